@@ -0,0 +1,139 @@
+"""
+Read latency (p50/p99) for N dashboard-style readers while one writer replays
+pipeline writes, under the rollback-journal defaults versus DEFAULT_PRAGMAS (WAL).
+Readers run in their own processes, like the dashboard.
+
+    python benchmarks/bench_db_concurrency.py --readers 4 --seconds 5
+"""
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+
+def _bootstrap():
+    src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+
+
+_bootstrap()
+
+from x_agent_os.database import DEFAULT_PRAGMAS, DatabaseHandler  # noqa: E402
+
+# What a connection got before the pragma profile: SQLite's own defaults, plus a
+# busy timeout so readers wait for the writer instead of failing outright.
+LEGACY_PRAGMAS = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "busy_timeout": 5000,
+    "mmap_size": None,
+    "cache_size": None,
+    "temp_store": None,
+}
+
+READ_SQL = "SELECT id, draft_content FROM posts WHERE published_at IS NULL ORDER BY created_at DESC LIMIT 50"
+
+
+def _percentile(values, fraction):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def writer(db: DatabaseHandler, stop: threading.Event, counts: dict):
+    session_id = db.create_session("benchmark", topic="concurrency")
+    batch = 0
+    while not stop.is_set():
+        db.save_content_fingerprints(
+            [
+                {
+                    "content_type": "tweet",
+                    "primary_identifier": f"bench-{batch}-{i}",
+                    "url": None,
+                    "content_hash": f"{batch}-{i}",
+                    "platform": "twitter",
+                }
+                for i in range(100)
+            ]
+        )
+        db.create_post(session_id, "bench", "x", "short_post", "agent", f"post {batch}")
+        batch += 1
+    counts["write_batches"] = batch
+
+
+def reader(path: str, pragmas: dict, stop, results):
+    db = DatabaseHandler(path, pragmas=pragmas, read_only=True)
+    latencies, errors = [], []
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            with db.get_connection() as conn:
+                conn.execute(READ_SQL).fetchall()
+        except sqlite3.OperationalError as e:
+            errors.append(str(e))
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+    db.close()
+    results.put((latencies, errors))
+
+
+def measure(name: str, pragmas: dict, readers: int, seconds: float, directory: str):
+    path = os.path.join(directory, f"{name}.db")
+    write_db = DatabaseHandler(path, pragmas=pragmas)
+    read_stop, write_stop = multiprocessing.Event(), threading.Event()
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=reader, args=(path, pragmas, read_stop, results)) for _ in range(readers)
+    ]
+    for process in processes:
+        process.start()
+    counts = {}
+    write_thread = threading.Thread(target=writer, args=(write_db, write_stop, counts))
+    write_thread.start()
+    time.sleep(seconds)
+    write_stop.set()
+    write_thread.join()
+    read_stop.set()
+    latencies, errors = [], []
+    for _ in processes:
+        process_latencies, process_errors = results.get()
+        latencies += process_latencies
+        errors += process_errors
+    for process in processes:
+        process.join()
+    write_db.close()
+    return {
+        "reads": len(latencies),
+        "p50": _percentile(latencies, 0.50),
+        "p99": _percentile(latencies, 0.99),
+        "errors": len(errors),
+        "write_batches": counts.get("write_batches", 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--dir", help="Where to create the databases (default: a temp dir; use a real disk)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        rows = [
+            ("rollback journal (before)", measure("legacy", LEGACY_PRAGMAS, args.readers, args.seconds, directory)),
+            ("WAL profile (after)", measure("wal", DEFAULT_PRAGMAS, args.readers, args.seconds, directory)),
+        ]
+    print(f"1 writer, {args.readers} readers, {args.seconds:g}s each")
+    print(f"{'profile':<28}{'reads':>9}{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}{'writes':>8}")
+    for name, r in rows:
+        print(f"{name:<28}{r['reads']:>9}{r['p50']:>9.2f}{r['p99']:>9.2f}{r['errors']:>8}{r['write_batches']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Connects per run and wall-clock for a synthetic pipeline run, with DatabaseHandler's
+per-thread connection reuse versus the old connect-per-call behaviour.
+
+    python benchmarks/bench_db_connections.py --items 10000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+
+def _bootstrap():
+    src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+
+
+_bootstrap()
+
+from x_agent_os.database import DatabaseHandler  # noqa: E402
+
+
+# What the pre-pooling handler ran with: a bare sqlite3.connect(), so the
+# rollback journal and SQLite's default synchronous/cache settings.
+BASELINE_PRAGMAS = {
+    "journal_mode": "DELETE",
+    "synchronous": None,
+    "busy_timeout": None,
+    "mmap_size": None,
+    "cache_size": None,
+    "temp_store": None,
+}
+
+
+class ConnectPerCallHandler(DatabaseHandler):
+    """The pre-pooling behaviour: a fresh, untuned connection for every method call."""
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path, pragmas=BASELINE_PRAGMAS)
+
+    @contextmanager
+    def get_connection(self):
+        conn = self._open_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def synthetic_run(db: DatabaseHandler, items: int):
+    """Per-item call pattern of a daily run: fingerprint check + insert, some posts and conversations."""
+    session_id = db.create_session("benchmark", topic="synthetic")
+    for i in range(items):
+        key = ("tweet", f"bench-{i}")
+        if key in db.find_content_fingerprints([key]):
+            continue
+        db.save_content_fingerprints(
+            [
+                {
+                    "content_type": "tweet",
+                    "primary_identifier": f"bench-{i}",
+                    "url": f"https://x.com/bench/status/{i}",
+                    "content_hash": f"{i:064x}",
+                    "platform": "twitter",
+                    "platform_metadata": {"snippet": f"synthetic tweet {i}"},
+                }
+            ]
+        )
+        if i % 10 == 0:
+            db.create_post(session_id, "bench", "x", "short_post", "agent", f"post {i}")
+        if i % 20 == 0:
+            db.add_conversation(
+                session_id=session_id,
+                skill_slug="bench",
+                x_tweet_url=f"https://x.com/bench/status/{i}",
+                x_tweet_id=None,
+                author_handle="bench",
+                author_followers=0,
+                snippet=f"synthetic tweet {i}",
+                reason="benchmark",
+                suggested_reply="",
+            )
+
+
+def measure(handler_class, items: int, directory: str):
+    started = time.perf_counter()
+    db = handler_class(os.path.join(directory, f"{handler_class.__name__}.db"))
+    synthetic_run(db, items)
+    elapsed = time.perf_counter() - started
+    connects = db.stats["connects"]  # Includes opening and migrating the database
+    db.close()
+    return connects, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        rows = [
+            ("connect per call (before)", *measure(ConnectPerCallHandler, args.items, directory)),
+            ("thread connection (after)", *measure(DatabaseHandler, args.items, directory)),
+        ]
+    print(f"{args.items} items")
+    print(f"{'mode':<28}{'connects':>10}{'seconds':>10}{'items/s':>10}")
+    for name, connects, elapsed in rows:
+        print(f"{name:<28}{connects:>10}{elapsed:>10.2f}{args.items / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
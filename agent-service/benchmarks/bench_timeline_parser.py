@@ -0,0 +1,129 @@
+"""
+Parse time and peak memory of x_agent_os.timeline_parser over search-v2 payloads
+of 20, 200 and 2,000 tweets. Payloads are synthesized in the current API shape
+unless recorded ones are passed with --fixture (raw RapidAPI response bodies).
+
+    python benchmarks/bench_timeline_parser.py
+    python benchmarks/bench_timeline_parser.py --fixture page1.json --fixture page2.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+
+def _bootstrap():
+    src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+
+
+_bootstrap()
+
+from x_agent_os import timeline_parser  # noqa: E402
+from x_agent_os.timeline_parser import parse_search_timeline  # noqa: E402
+
+
+def make_payload(tweets: int) -> bytes:
+    """A search-v2 response with `tweets` entries plus top and bottom cursors."""
+    entries = []
+    for i in range(tweets):
+        tweet_id = str(1800000000000000000 + i)
+        entries.append({
+            "entryId": f"tweet-{tweet_id}",
+            "content": {
+                "entryType": "TimelineTimelineItem",
+                "itemContent": {
+                    "itemType": "TimelineTweet",
+                    "tweet_results": {"result": {
+                        "__typename": "Tweet",
+                        "rest_id": tweet_id,
+                        "core": {"user_results": {"result": {
+                            "__typename": "User",
+                            "core": {"screen_name": f"user{i % 50}", "name": f"User {i % 50}"},
+                            "legacy": {"followers_count": 1000 + i, "description": "x" * 120},
+                        }}},
+                        "legacy": {
+                            "id_str": tweet_id,
+                            "full_text": f"Synthetic tweet {i} about shipping faster " * 4,
+                            "created_at": "Wed Oct 15 12:00:00 +0000 2025",
+                            "favorite_count": i % 300,
+                            "quote_count": i % 7,
+                            "reply_count": i % 40,
+                            "retweet_count": i % 90,
+                            "entities": {"hashtags": [], "urls": [], "user_mentions": []},
+                        },
+                        "views": {"count": str(10 * i), "state": "EnabledWithCount"},
+                    }},
+                },
+            },
+        })
+    entries.append({"entryId": "cursor-top-0", "content": {"cursorType": "Top", "value": "top"}})
+    entries.append({"entryId": "cursor-bottom-0", "content": {"cursorType": "Bottom", "value": "bottom"}})
+    payload = {"result": {"timeline": {"instructions": [{"type": "TimelineAddEntries", "entries": entries}]}}}
+    return json.dumps(payload).encode("utf-8")
+
+
+def legacy_parse(raw: bytes):
+    """The old path's decoding cost: json.loads -> json.dumps(indent=2) for storage -> json.loads again."""
+    stored = json.dumps(json.loads(raw), indent=2)
+    return parse_search_timeline(json.loads(stored))
+
+
+def stdlib_parse(raw: bytes):
+    return parse_search_timeline(json.loads(raw))
+
+
+def fast_parse(raw: bytes):
+    return parse_search_timeline(timeline_parser.loads(raw))
+
+
+def measure(parse, raw: bytes, min_seconds: float):
+    tracemalloc.start()
+    parse(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    runs, started = 0, time.perf_counter()
+    while True:
+        parse(raw)
+        runs += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return elapsed / runs * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 200, 2000])
+    parser.add_argument("--fixture", action="append", default=[], help="Recorded raw response body (repeatable)")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="Minimum timing window per case")
+    args = parser.parse_args()
+
+    if args.fixture:
+        payloads = []
+        for path in args.fixture:
+            with open(path, "rb") as f:
+                raw = f.read()
+            payloads.append((os.path.basename(path), raw))
+    else:
+        payloads = [(f"{size} tweets", make_payload(size)) for size in args.sizes]
+
+    modes = [("json round trip (before)", legacy_parse), ("json", stdlib_parse)]
+    if timeline_parser.orjson is not None:
+        modes.append(("orjson", fast_parse))
+    else:
+        print("orjson not installed; skipping the fast backend")
+
+    print(f"{'payload':<18}{'bytes':>10}{'tweets':>8}  {'mode':<26}{'ms/parse':>10}{'peak KiB':>10}")
+    for name, raw in payloads:
+        tweets = len(stdlib_parse(raw)[0])
+        for mode, parse in modes:
+            ms, peak_kib = measure(parse, raw, args.min_seconds)
+            print(f"{name:<18}{len(raw):>10}{tweets:>8}  {mode:<26}{ms:>10.3f}{peak_kib:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
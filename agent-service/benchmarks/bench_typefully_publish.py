@@ -0,0 +1,145 @@
+"""
+Batch publish throughput of TypefullyDraftManager.create_from_generated_content
+against a local mock Typefully API, sequential versus concurrent, including the
+post claims in a temp database. The mock answers after --latency-ms and can
+throttle the first requests with 429 + Retry-After.
+
+    python benchmarks/bench_typefully_publish.py --posts 40 --concurrency 1 4 8
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _bootstrap():
+    src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+
+
+_bootstrap()
+os.environ.setdefault("TYPEFULLY_API_KEY", "benchmark")
+
+from x_agent_os.agents.typefully_auth import TypefullyAuth  # noqa: E402
+from x_agent_os.agents.typefully_client import TypefullyClient, TypefullyRateLimiter  # noqa: E402
+from x_agent_os.agents.typefully_drafts import TypefullyDraftManager  # noqa: E402
+from x_agent_os.config import TypefullyConfig  # noqa: E402
+from x_agent_os.database import DatabaseHandler  # noqa: E402
+
+
+class MockTypefully(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.05
+    throttle_remaining = 0
+    lock = threading.Lock()
+    stats = {"requests": 0, "drafts": 0, "throttled": 0, "in_flight": 0, "peak_in_flight": 0}
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        cls = type(self)
+        with cls.lock:
+            cls.stats["requests"] += 1
+            cls.stats["in_flight"] += 1
+            cls.stats["peak_in_flight"] = max(cls.stats["peak_in_flight"], cls.stats["in_flight"])
+            throttled = cls.throttle_remaining > 0
+            if throttled:
+                cls.throttle_remaining -= 1
+                cls.stats["throttled"] += 1
+        time.sleep(cls.latency)
+        with cls.lock:
+            cls.stats["in_flight"] -= 1
+        if throttled:
+            self._send(429, {"detail": "Too many requests"}, {"Retry-After": "1"})
+        elif self.command == "POST" and self.path.startswith("/v1/drafts/"):
+            with cls.lock:
+                cls.stats["drafts"] += 1
+                draft_id = cls.stats["drafts"]
+            self._send(200, {"id": draft_id, "share_url": None})
+        else:
+            self._send(200, [])
+
+    do_GET = do_POST = _handle
+
+
+def run_batch(manager, db, posts: int, concurrency: int, throttle: int):
+    MockTypefully.throttle_remaining = throttle
+    for key in MockTypefully.stats:
+        MockTypefully.stats[key] = 0
+    post_ids = [
+        db.create_post(None, "bench", "x", "short_post", "agent", f"benchmark post {concurrency}-{i}")
+        for i in range(posts)
+    ]
+    contents = [f"benchmark post {concurrency}-{i}" for i in range(posts)]
+    started = time.perf_counter()
+    items = manager.create_from_generated_content(contents, post_ids=post_ids, max_concurrency=concurrency)
+    elapsed = time.perf_counter() - started
+    rerun_started = time.perf_counter()
+    rerun = manager.create_from_generated_content(contents, post_ids=post_ids, max_concurrency=concurrency)
+    rerun_elapsed = time.perf_counter() - rerun_started
+    return {
+        "elapsed": elapsed,
+        "created": sum(1 for item in items if item.status == "created"),
+        "peak": MockTypefully.stats["peak_in_flight"],
+        "throttled": MockTypefully.stats["throttled"],
+        "rerun_skipped": sum(1 for item in rerun if item.status == "skipped"),
+        "rerun_elapsed": rerun_elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--posts", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mock API response time")
+    parser.add_argument("--throttle", type=int, default=0, help="Answer the first N requests of each batch with 429")
+    args = parser.parse_args()
+
+    MockTypefully.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockTypefully)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as directory:
+        auth = TypefullyAuth(credentials_dir=directory)
+        auth.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        config = TypefullyConfig()
+        # The pool is sized once per host, so give it room for the widest run
+        config.max_concurrency = max(args.concurrency)
+        db = DatabaseHandler(os.path.join(directory, "benchmark.db"))
+
+        print(f"{args.posts} posts, mock latency {args.latency_ms:g} ms, {args.throttle} throttled requests per batch")
+        print(f"{'concurrency':>11}{'seconds':>9}{'drafts/s':>10}{'created':>9}{'peak':>6}{'429s':>6}"
+              f"{'rerun skipped':>15}{'rerun s':>9}")
+        for concurrency in args.concurrency:
+            client = TypefullyClient(auth, config=config)
+            # A fresh, unthrottled-by-default budget per run (the API's own limits come from the mock)
+            client.async_client.rate_limiter = TypefullyRateLimiter(per_minute=0, per_hour=0)
+            result = run_batch(TypefullyDraftManager(client, db), db, args.posts, concurrency, args.throttle)
+            print(f"{concurrency:>11}{result['elapsed']:>9.2f}{args.posts / result['elapsed']:>10.1f}"
+                  f"{result['created']:>9}{result['peak']:>6}{result['throttled']:>6}"
+                  f"{result['rerun_skipped']:>15}{result['rerun_elapsed']:>9.2f}")
+        print(f"(the old one-at-a-time client spaced requests 1 s apart: >= {args.posts - 1} s for {args.posts} posts)")
+        db.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
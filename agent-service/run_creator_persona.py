@@ -21,6 +21,11 @@ def main():
     parser.add_argument("--limit", type=int, default=50)
     parser.add_argument("--top-n", type=int, default=7)
     parser.add_argument("--force", action="store_true")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fetch only tweets newer than the last capture and reuse the summary if the top posts are unchanged",
+    )
     args = parser.parse_args()
 
     runner = CreatorPersonaInspo()
@@ -30,6 +35,7 @@ def main():
         limit=args.limit,
         top_n=args.top_n,
         force=args.force,
+        incremental=args.incremental,
     )
     print(json.dumps(result.__dict__))
 
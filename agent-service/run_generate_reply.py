@@ -20,11 +20,12 @@ from x_agent_os.database import DatabaseHandler
 def main():
     parser = argparse.ArgumentParser(description="Generate reply for a conversation")
     parser.add_argument("--conversation-id", type=int, required=True)
+    parser.add_argument("--refresh", action="store_true", help="Bypass the LLM response cache")
     args = parser.parse_args()
 
     db = DatabaseHandler()
     agent = ReplyAgent(db)
-    reply = agent.generate_reply_for_conversation(args.conversation_id)
+    reply = agent.generate_reply_for_conversation(args.conversation_id, refresh=args.refresh)
     print(json.dumps({"reply": reply}))
 
 
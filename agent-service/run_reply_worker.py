@@ -0,0 +1,30 @@
+import argparse
+import logging
+import os
+import sys
+
+
+def _bootstrap():
+    service_root = os.path.dirname(__file__)
+    src_path = os.path.join(service_root, "src")
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+
+
+def main():
+    _bootstrap()
+    from x_agent_os.config import REPLY_WORKER_CONCURRENCY, REPLY_WORKER_HOST, REPLY_WORKER_PORT
+    from x_agent_os.reply_worker import ReplyWorker, serve
+
+    parser = argparse.ArgumentParser(description="Long-lived reply generation worker for the dashboard")
+    parser.add_argument("--host", default=REPLY_WORKER_HOST)
+    parser.add_argument("--port", type=int, default=REPLY_WORKER_PORT)
+    parser.add_argument("--concurrency", type=int, default=REPLY_WORKER_CONCURRENCY, help="Concurrent model calls")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    serve(host=args.host, port=args.port, worker=ReplyWorker(concurrency=args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,237 @@ from x_agent_os.config import GOOGLE_API_KEY
 import re # Import re module
 import os
 import json
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from x_agent_os.database import DatabaseHandler
+from x_agent_os.llm_cache import LLMResponseCache
+
+# Matches the "Max length" line in the post prompt; batch posts over it are redrafted one at a time.
+MAX_POST_CHARS = 2000
 
 class EditorAgent:
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = 1,
+        call_timeout: Optional[float] = None,
+        call_limiter: Optional[threading.Semaphore] = None,
+        batch_mode: bool = False,
+    ):
+        """
+        max_workers > 1 drafts topics concurrently; call_timeout bounds each Gemini
+        request, and call_limiter (shared with other agents) caps in-flight calls.
+        batch_mode drafts every topic in one request and only falls back to
+        per-topic calls for posts the batch response did not deliver.
+        """
         if not GOOGLE_API_KEY:
             raise ValueError("GOOGLE_API_KEY not configured.")
         genai.configure(api_key=GOOGLE_API_KEY)
         self.db = DatabaseHandler()
         print("EditorAgent initialized with Gemini 3 Pro Preview")
         self.model = genai.GenerativeModel('gemini-3-pro-preview') # Using 1.5 pro as per PRD
+        self.llm_cache = LLMResponseCache(self.db, "editor")
+        self.max_workers = max_workers
+        self.call_timeout = call_timeout
+        self.call_limiter = call_limiter
+        self.batch_mode = batch_mode
+        self.last_stage_stats = {}
+
+    def _build_prompt(self, i: int, topic_text: str, app_name: str, app_description: str, tuon_features_content: str) -> str:
+        # Constructing a prompt for Gemini Pro
+        prompt_parts = [
+            "You are a master conversion copywriter, narrative strategist, and voice engineer specializing in ",
+            "high-performing LinkedIn content. You distill complex products into emotionally resonant stories that ",
+            "shift beliefs, expose uncomfortable truths, and make people reconsider how they work.\n\n",
+            f"{app_name} = '{app_description}'.\n\n",
+            "Context for subtle reference:\n",
+            f"{tuon_features_content}\n\n",
+            "Audience: high-agency professionals who care about productivity, knowledge leverage, and creative output.\n",
+            "They are busy, overloaded with tools, allergic to fluff, and skeptical of hype.\n\n"
+            "Your task: write an engaging, belief-shifting LinkedIn post based on the topic below:\n",
+            f"Topic: '{topic_text}'\n\n",
+            "Core objective: say the spicy truths out loud. Challenge assumptions. Name the real pain. Make the reader feel:\n",
+            "  → \"finally someone said it\"\n",
+            "  → \"that’s why I’m frustrated\"\n",
+            "  → \"there’s a better way\"\n\n",
+            "Post Requirements:\n",
+            "- Start with a strong pattern interrupt (spicy assertion, bold claim, or uncomfortable truth)\n",
+            "- Use a problem → truth → reframe → solution → benefit → reflection structure\n",
+            "- Reference features only through outcomes, not lists (feature → functional benefit → emotional benefit)\n",
+            "- Use mini-stories, metaphors, or relatable scenarios\n",
+            "- Keep pacing tight with short punchy sentences\n",
+            "- No fluff, no hashtags, no emojis, no corporate speak\n",
+            "- End on an insightful reflection that feels like a shift in worldview\n",
+            "- Tone: bold, honest, expert-level clarity, anti-bullshit\n",
+            "- Max length: 2000 characters\n\n",
+            "Examples of acceptable 'spicy truths' (illustrative only):\n"
+            "  * Most productivity tools are just digital clutter. Tuon is built to actually help you create.\n",
+            "  * Switching between apps kills your flow. Staying in one workspace preserves cognitive momentum.\n",
+            "  * Notes buried in old tools are dead notes. Context-aware resurfacing makes knowledge compounding.\n\n",
+            "Output only the LinkedIn post text. No headings. No labels. No commentary."
+        ]
+        prompt = "\\n".join(prompt_parts)
+        print(f"-- Editor Agent Prompt to Gemini (Topic {i+1}) --\\n{prompt[:500]}...\\n-- End of Prompt Snippet --")
+        return prompt
+
+    def _generate_content(self, prompt: str, accept: Optional[Callable[[str], bool]] = None):
+        request_options = {"timeout": self.call_timeout} if self.call_timeout else None
+        if self.call_limiter is None:
+            return self.llm_cache.generate(self.model, prompt, accept=accept, request_options=request_options)
+        with self.call_limiter:
+            return self.llm_cache.generate(self.model, prompt, accept=accept, request_options=request_options)
+
+    def _craft_one(self, i: int, topic_text: str, prompt: str) -> Tuple[dict, str]:
+        """Generate the post for one topic. Never raises, so one failed topic cannot sink the others."""
+        generated_post_text = "" # Initialize
+        try:
+            api_response = self._generate_content(prompt)
+            # Extract text from API response
+            if not api_response.parts:
+                print(f"Error: Received an empty API response from EditorAgent for topic {i+1}.")
+                generated_post_text = "#Error: Empty API Response"
+            elif hasattr(api_response, 'text'):
+                generated_post_text = api_response.text
+            else:
+                generated_post_text = "".join(part.text for part in api_response.parts if hasattr(part, 'text'))
+                
+            if not generated_post_text:
+                print(f"Error: API response content is empty for EditorAgent for topic {i+1}.")
+                generated_post_text = "#Error: Empty API Response Content"
+
+        except Exception as e:
+            print(f"Error calling Gemini API for EditorAgent (Topic {i+1}): {e}")
+            generated_post_text = f"#Error: API Call Failed - {e}"
+
+        print(f"-- Editor Agent API Response (Topic {i+1}) --\\n{generated_post_text[:300]}...\\n-- End of API Response Snippet --")
+            
+
+        # Remove parsing for multiple variations
+        # The generated_post_text is now assumed to be the single post
+        single_post_content = generated_post_text.strip()
+        if generated_post_text.startswith("#Error"):
+            single_post_content = generated_post_text.strip() # Keep error message
+        elif not single_post_content: # Handle case where API returns empty but not error state
+            print(f"Warning: Received empty content (after stripping) for topic {i+1}, but no explicit error. Storing as empty.")
+            single_post_content = "" 
+
+        current_posts_data = { 
+            "topic": topic_text,
+            "linkedin_post": single_post_content # Changed from linkedin_posts list to single string
+        }
+
+        # Regex parsing might not be strictly needed if the LLM follows the new prompt structure well,
+        # but we can keep a simple extraction for robustness or if the LLM adds minor artifacts.
+        # For now, we assume generated_post_text IS the post due to the new prompt.
+        # If LLM includes "**LinkedIn Post:**", we might want to strip it, but the prompt asks for direct text.
+            
+        # Example of a simple strip if the model *still* adds a prefix despite instructions:
+        # prefix_to_strip = "**LinkedIn Post:**"
+        # if generated_post_text.strip().startswith(prefix_to_strip):
+        #    current_posts["linkedin_post"] = generated_post_text.strip()[len(prefix_to_strip):].strip()
+
+        raw_api_response = f"--- Raw API Response for LinkedIn Post (Topic {i+1}: {topic_text}) ---\n{generated_post_text}\n"
+        return current_posts_data, raw_api_response
+
+    def _build_batch_prompt(self, topics: list, app_name: str, app_description: str, tuon_features_content: str) -> str:
+        # Same brief as _build_prompt, but the shared context is sent once for every topic.
+        prompt_parts = [
+            "You are a master conversion copywriter, narrative strategist, and voice engineer specializing in ",
+            "high-performing LinkedIn content. You distill complex products into emotionally resonant stories that ",
+            "shift beliefs, expose uncomfortable truths, and make people reconsider how they work.\n\n",
+            f"{app_name} = '{app_description}'.\n\n",
+            "Context for subtle reference:\n",
+            f"{tuon_features_content}\n\n",
+            "Audience: high-agency professionals who care about productivity, knowledge leverage, and creative output.\n",
+            "They are busy, overloaded with tools, allergic to fluff, and skeptical of hype.\n\n"
+            f"Your task: write one engaging, belief-shifting LinkedIn post for EACH of the {len(topics)} topics below:\n",
+        ]
+        prompt_parts.extend(f"Topic {i+1}: '{topic_text}'\n" for i, topic_text in enumerate(topics))
+        prompt_parts.extend([
+            "\nCore objective: say the spicy truths out loud. Challenge assumptions. Name the real pain. Make the reader feel:\n",
+            "  → \"finally someone said it\"\n",
+            "  → \"that’s why I’m frustrated\"\n",
+            "  → \"there’s a better way\"\n\n",
+            "Post Requirements (apply to every post):\n",
+            "- Start with a strong pattern interrupt (spicy assertion, bold claim, or uncomfortable truth)\n",
+            "- Use a problem → truth → reframe → solution → benefit → reflection structure\n",
+            "- Reference features only through outcomes, not lists (feature → functional benefit → emotional benefit)\n",
+            "- Use mini-stories, metaphors, or relatable scenarios\n",
+            "- Keep pacing tight with short punchy sentences\n",
+            "- No fluff, no hashtags, no emojis, no corporate speak\n",
+            "- End on an insightful reflection that feels like a shift in worldview\n",
+            "- Tone: bold, honest, expert-level clarity, anti-bullshit\n",
+            f"- Max length: {MAX_POST_CHARS} characters per post\n",
+            "- Each post must stand on its own; do not reference the other topics\n\n",
+            "Output only a JSON array with one object per topic, in topic order, and nothing else. Example format:\n",
+            "[{\"topic_index\": 1, \"linkedin_post\": \"...\"}, {\"topic_index\": 2, \"linkedin_post\": \"...\"}]"
+        ])
+        prompt = "".join(prompt_parts)
+        print(f"-- Editor Agent Batch Prompt to Gemini ({len(topics)} topics) --\n{prompt[:500]}...\n-- End of Prompt Snippet --")
+        return prompt
+
+    @staticmethod
+    def _parse_batch_posts(response_text: str, topic_count: int) -> Dict[int, str]:
+        """
+        Map topic index -> post for every well-formed entry in a batch response.
+        Entries that are missing, empty, duplicated or over MAX_POST_CHARS are left
+        out so the caller redrafts just those topics.
+        """
+        text_to_parse = response_text.strip()
+        if text_to_parse.startswith("```json"):
+            text_to_parse = text_to_parse[7:]
+        elif text_to_parse.startswith("```"):
+            text_to_parse = text_to_parse[3:]
+        if text_to_parse.endswith("```"):
+            text_to_parse = text_to_parse[:-3]
+
+        start_index = text_to_parse.find('[')
+        end_index = text_to_parse.rfind(']')
+        if start_index == -1 or end_index < start_index:
+            return {}
+        try:
+            items = json.loads(text_to_parse[start_index:end_index + 1])
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(items, list):
+            return {}
+
+        posts: Dict[int, str] = {}
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            index = item.get("topic_index", position + 1)
+            post = item.get("linkedin_post")
+            if not isinstance(index, int) or not 1 <= index <= topic_count or (index - 1) in posts:
+                continue
+            if not isinstance(post, str) or not post.strip() or len(post.strip()) > MAX_POST_CHARS:
+                continue
+            posts[index - 1] = post.strip()
+        return posts
+
+    def _craft_batch(self, topics: list, app_name: str, app_description: str, tuon_features_content: str) -> Tuple[Dict[int, str], str]:
+        """One request for all topics. Returns the valid posts by topic index and the raw response text."""
+        prompt = self._build_batch_prompt(topics, app_name, app_description, tuon_features_content)
+        try:
+            # Only cache batch responses that covered every topic; a partial one would pin the fallback.
+            api_response = self._generate_content(
+                prompt, accept=lambda text: len(self._parse_batch_posts(text, len(topics))) == len(topics)
+            )
+            if not api_response.parts:
+                print("Error: Received an empty batch API response from EditorAgent.")
+                return {}, ""
+            if hasattr(api_response, 'text'):
+                response_text = api_response.text
+            else:
+                response_text = "".join(part.text for part in api_response.parts if hasattr(part, 'text'))
+        except Exception as e:
+            print(f"Error calling Gemini API for EditorAgent (batch): {e}")
+            return {}, ""
+
+        posts = self._parse_batch_posts(response_text or "", len(topics))
+        print(f"-- Editor Agent Batch Response: {len(posts)}/{len(topics)} valid posts --")
+        return posts, response_text or ""
 
     def craft_posts(self, distilled_content: dict, app_name: str, app_description: str, tuon_features_content: str, session_id: Optional[int] = None) -> list:
         """
@@ -46,91 +266,68 @@ class EditorAgent:
             print("Warning: No distilled topics provided to Editor Agent.")
             return []
 
-        for i, topic_text in enumerate(topics):
-            # Constructing a prompt for Gemini Pro
-            prompt_parts = [
-                "You are a master conversion copywriter, narrative strategist, and voice engineer specializing in ",
-                "high-performing LinkedIn content. You distill complex products into emotionally resonant stories that ",
-                "shift beliefs, expose uncomfortable truths, and make people reconsider how they work.\n\n",
-                f"{app_name} = '{app_description}'.\n\n",
-                "Context for subtle reference:\n",
-                f"{tuon_features_content}\n\n",
-                "Audience: high-agency professionals who care about productivity, knowledge leverage, and creative output.\n",
-                "They are busy, overloaded with tools, allergic to fluff, and skeptical of hype.\n\n"
-                "Your task: write an engaging, belief-shifting LinkedIn post based on the topic below:\n",
-                f"Topic: '{topic_text}'\n\n",
-                "Core objective: say the spicy truths out loud. Challenge assumptions. Name the real pain. Make the reader feel:\n",
-                "  → \"finally someone said it\"\n",
-                "  → \"that’s why I’m frustrated\"\n",
-                "  → \"there’s a better way\"\n\n",
-                "Post Requirements:\n",
-                "- Start with a strong pattern interrupt (spicy assertion, bold claim, or uncomfortable truth)\n",
-                "- Use a problem → truth → reframe → solution → benefit → reflection structure\n",
-                "- Reference features only through outcomes, not lists (feature → functional benefit → emotional benefit)\n",
-                "- Use mini-stories, metaphors, or relatable scenarios\n",
-                "- Keep pacing tight with short punchy sentences\n",
-                "- No fluff, no hashtags, no emojis, no corporate speak\n",
-                "- End on an insightful reflection that feels like a shift in worldview\n",
-                "- Tone: bold, honest, expert-level clarity, anti-bullshit\n",
-                "- Max length: 2000 characters\n\n",
-                "Examples of acceptable 'spicy truths' (illustrative only):\n"
-                "  * Most productivity tools are just digital clutter. Tuon is built to actually help you create.\n",
-                "  * Switching between apps kills your flow. Staying in one workspace preserves cognitive momentum.\n",
-                "  * Notes buried in old tools are dead notes. Context-aware resurfacing makes knowledge compounding.\n\n",
-                "Output only the LinkedIn post text. No headings. No labels. No commentary."
-            ]
-            prompt = "\\n".join(prompt_parts)
-            print(f"-- Editor Agent Prompt to Gemini (Topic {i+1}) --\\n{prompt[:500]}...\\n-- End of Prompt Snippet --")
-
-            generated_post_text = "" # Initialize
+        stage_started = time.perf_counter()
+        call_latencies = [0.0] * len(topics)
+        crafted: List[Optional[Tuple[dict, str]]] = [None] * len(topics)
+
+        batch_calls = 0
+        if self.batch_mode and len(topics) > 1:
+            batch_calls = 1
+            batch_started = time.perf_counter()
+            batch_posts, batch_raw_response = self._craft_batch(topics, app_name, app_description, tuon_features_content)
+            batch_seconds = time.perf_counter() - batch_started
+            for i, post_text in batch_posts.items():
+                call_latencies[i] = batch_seconds
+                crafted[i] = (
+                    {"topic": topics[i], "linkedin_post": post_text},
+                    f"--- Raw API Response for LinkedIn Post (Topic {i+1}: {topics[i]}, batch) ---\n{post_text}\n",
+                )
+            if batch_posts:
+                # Keep the untouched batch output once, on the first post it produced.
+                first = min(batch_posts)
+                crafted[first] = (crafted[first][0], f"--- Raw Batch API Response ({len(topics)} topics) ---\n{batch_raw_response}\n")
+            if len(batch_posts) < len(topics):
+                print(f"⚠️  Batch response covered {len(batch_posts)}/{len(topics)} topics; drafting the rest one at a time")
+
+        pending = [i for i in range(len(topics)) if crafted[i] is None]
+        prompts = {
+            i: self._build_prompt(i, topics[i], app_name, app_description, tuon_features_content)
+            for i in pending
+        }
+
+        def run_topic(i: int) -> Tuple[dict, str]:
+            started = time.perf_counter()
             try:
-                api_response = self.model.generate_content(prompt)
-                # Extract text from API response
-                if not api_response.parts:
-                    print(f"Error: Received an empty API response from EditorAgent for topic {i+1}.")
-                    generated_post_text = "#Error: Empty API Response"
-                elif hasattr(api_response, 'text'):
-                    generated_post_text = api_response.text
-                else:
-                    generated_post_text = "".join(part.text for part in api_response.parts if hasattr(part, 'text'))
-                
-                if not generated_post_text:
-                    print(f"Error: API response content is empty for EditorAgent for topic {i+1}.")
-                    generated_post_text = "#Error: Empty API Response Content"
+                return self._craft_one(i, topics[i], prompts[i])
+            finally:
+                call_latencies[i] = time.perf_counter() - started
 
-            except Exception as e:
-                print(f"Error calling Gemini API for EditorAgent (Topic {i+1}): {e}")
-                generated_post_text = f"#Error: API Call Failed - {e}"
+        if self.max_workers <= 1 or len(pending) <= 1:
+            results = [run_topic(i) for i in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending)), thread_name_prefix="editor") as pool:
+                # map() yields in submission order, so posts line up with topics.
+                results = list(pool.map(run_topic, pending))
+        for i, result in zip(pending, results):
+            crafted[i] = result
 
-            print(f"-- Editor Agent API Response (Topic {i+1}) --\\n{generated_post_text[:300]}...\\n-- End of API Response Snippet --")
-            
-            all_raw_api_responses.append(f"--- Raw API Response for LinkedIn Post (Topic {i+1}: {topic_text}) ---\n{generated_post_text}\n")
-
-            # Remove parsing for multiple variations
-            # The generated_post_text is now assumed to be the single post
-            single_post_content = generated_post_text.strip()
-            if generated_post_text.startswith("#Error"):
-                single_post_content = generated_post_text.strip() # Keep error message
-            elif not single_post_content: # Handle case where API returns empty but not error state
-                print(f"Warning: Received empty content (after stripping) for topic {i+1}, but no explicit error. Storing as empty.")
-                single_post_content = "" 
-
-            current_posts_data = { 
-                "topic": topic_text,
-                "linkedin_post": single_post_content # Changed from linkedin_posts list to single string
-            }
-
-            # Regex parsing might not be strictly needed if the LLM follows the new prompt structure well,
-            # but we can keep a simple extraction for robustness or if the LLM adds minor artifacts.
-            # For now, we assume generated_post_text IS the post due to the new prompt.
-            # If LLM includes "**LinkedIn Post:**", we might want to strip it, but the prompt asks for direct text.
-            
-            # Example of a simple strip if the model *still* adds a prefix despite instructions:
-            # prefix_to_strip = "**LinkedIn Post:**"
-            # if generated_post_text.strip().startswith(prefix_to_strip):
-            #    current_posts["linkedin_post"] = generated_post_text.strip()[len(prefix_to_strip):].strip()
+        for post_data, raw_api_response in crafted:
+            social_media_posts.append(post_data)
+            all_raw_api_responses.append(raw_api_response)
 
-            social_media_posts.append(current_posts_data) # Use renamed variable
+        stage_seconds = time.perf_counter() - stage_started
+        self.last_stage_stats = {
+            "topics": len(topics),
+            "failed": sum(1 for post in social_media_posts if post["linkedin_post"].startswith("#Error")),
+            "max_workers": self.max_workers,
+            "batch_calls": batch_calls,
+            "per_topic_calls": len(pending),
+            "stage_seconds": round(stage_seconds, 3),
+            "posts_per_second": round(len(topics) / stage_seconds, 3) if stage_seconds else None,
+            "max_call_seconds": round(max(call_latencies), 3),
+            "mean_call_seconds": round(sum(call_latencies) / len(call_latencies), 3),
+        }
+        print(f"📊 Editor stage: {self.last_stage_stats}")
 
         # Save to database if we have data and a session_id
         if social_media_posts and session_id:
@@ -1,10 +1,15 @@
 import json
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
 
 import google.generativeai as genai
 
 from x_agent_os.config import GOOGLE_API_KEY
 from x_agent_os.database import DatabaseHandler
+from x_agent_os.llm_cache import LLMResponseCache
+from x_agent_os.persona_context import get_persona_contexts
 from x_agent_os.skills import SkillManager
 
 
@@ -16,6 +21,7 @@ class ReplyAgent:
         self.db = db or DatabaseHandler()
         self.skill_manager = SkillManager(self.db)
         self.model = genai.GenerativeModel("gemini-3-flash-preview")
+        self.llm_cache = LLMResponseCache(self.db, "reply")
 
     def _get_personal_brand(self) -> Dict[str, Any]:
         skill = self.db.get_skill_by_slug("personal_brand")
@@ -37,31 +43,12 @@ class ReplyAgent:
         return examples
 
     def _collect_creator_personas(self, limit: int = 2) -> List[Dict[str, Any]]:
-        personas = self.db.list_creator_personas(active_only=True)
-        persona_context = []
-        for persona in personas[:limit]:
-            handle = persona.get("handle")
-            run = self.db.get_latest_creator_persona_run(handle)
-            posts = self.db.list_creator_persona_posts(persona["id"], limit=3)
-            persona_context.append(
-                {
-                    "handle": handle,
-                    "summary": run.get("summary_json") if run else None,
-                    "top_posts": [post.get("content") for post in posts],
-                }
-            )
-        return persona_context
-
-    def generate_reply_for_conversation(self, conversation_id: int) -> str:
-        conversation = self.db.get_conversation_by_id(conversation_id)
-        if not conversation:
-            raise ValueError(f"Conversation {conversation_id} not found.")
+        return get_persona_contexts(self.db, limit=limit, posts_limit=3)
 
+    def _shared_context(self) -> Dict[str, Any]:
+        """Context that is the same for every conversation: brand, style examples, creator personas."""
         brand = self._get_personal_brand()
-        examples = self._collect_style_examples(limit=3)
-        personas = self._collect_creator_personas(limit=2)
-
-        context = {
+        return {
             "brand_summary": {
                 "values": brand.get("values", []),
                 "voice_notes": brand.get("voice_notes", []),
@@ -71,16 +58,24 @@ class ReplyAgent:
                 "style_constraints": brand.get("style_constraints", []),
             },
             "reply_style": brand.get("reply_style"),
+            "recent_posts": self._collect_style_examples(limit=3),
+            "creator_personas": self._collect_creator_personas(limit=2),
+        }
+
+    def _build_prompt(self, conversation: Dict[str, Any], shared: Dict[str, Any]) -> str:
+        context = {
+            "brand_summary": shared["brand_summary"],
+            "reply_style": shared["reply_style"],
             "skill_slug": conversation.get("skill_slug"),
             "tweet_snippet": conversation.get("snippet"),
             "tweet_reason": conversation.get("reason"),
             "author_handle": conversation.get("author_handle"),
             "tweet_url": conversation.get("x_tweet_url"),
-            "recent_posts": examples,
-            "creator_personas": personas,
+            "recent_posts": shared["recent_posts"],
+            "creator_personas": shared["creator_personas"],
         }
 
-        prompt_text = (
+        return (
             "You are an assistant generating a reply in the author's personal brand voice. "
             "Follow the brand manifesto and prioritize clarity, leverage, and direct advice. "
             "Output only the reply text. No labels or JSON.\n\n"
@@ -89,9 +84,72 @@ class ReplyAgent:
             f"Context:\n{json.dumps(context, indent=2)}"
         )
 
-        response = self.model.generate_content(prompt_text)
+    def _generate(self, conversation: Dict[str, Any], shared: Dict[str, Any], refresh: bool = False) -> str:
+        response = self.llm_cache.generate(self.model, self._build_prompt(conversation, shared), refresh=refresh)
         if not response.parts:
             raise RuntimeError("Empty response from reply agent.")
-        reply_text = response.text.strip()
-        self.db.update_conversation_reply(conversation_id, reply_text)
+        return response.text.strip()
+
+    def generate_reply_for_conversation(self, conversation_id: int, refresh: bool = False) -> str:
+        """refresh=True asks the model for a new reply even if this exact context was answered before."""
+        conversation = self.db.get_conversation_by_id(conversation_id)
+        if not conversation:
+            raise ValueError(f"Conversation {conversation_id} not found.")
+
+        started = time.perf_counter()
+        reply_text = self._generate(conversation, self._shared_context(), refresh=refresh)
+        latency_ms = int((time.perf_counter() - started) * 1000)
+        self.db.update_conversation_reply(conversation_id, reply_text, latency_ms=latency_ms)
         return reply_text
+
+    def generate_replies_batch(
+        self,
+        conversation_ids: Optional[Iterable[int]] = None,
+        max_workers: int = 4,
+        call_limiter: Optional[threading.Semaphore] = None,
+        refresh: bool = False,
+        include_existing: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate replies for many conversations (default: every pending one without a
+        suggested reply) against one shared context, up to max_workers at a time (and
+        under call_limiter, if given). Replies are written back in one transaction.
+        Returns one {"conversation_id", "reply", "latency_ms", "error"} dict per conversation.
+        """
+        if conversation_ids is None:
+            conversations = self.db.list_pending_conversations()
+        else:
+            conversations = [self.db.get_conversation_by_id(conversation_id) for conversation_id in conversation_ids]
+            conversations = [conversation for conversation in conversations if conversation]
+        if not include_existing:
+            conversations = [conversation for conversation in conversations if not conversation.get("suggested_reply")]
+        if not conversations:
+            return []
+
+        shared = self._shared_context()
+
+        def generate_one(conversation: Dict[str, Any]) -> Dict[str, Any]:
+            started = time.perf_counter()
+            reply_text, error = None, None
+            try:
+                if call_limiter is not None:
+                    with call_limiter:
+                        reply_text = self._generate(conversation, shared, refresh=refresh)
+                else:
+                    reply_text = self._generate(conversation, shared, refresh=refresh)
+            except Exception as e:
+                error = str(e)
+            return {
+                "conversation_id": conversation["id"],
+                "reply": reply_text,
+                "latency_ms": int((time.perf_counter() - started) * 1000),
+                "error": error,
+            }
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="reply") as pool:
+            results = list(pool.map(generate_one, conversations))
+
+        self.db.update_conversation_replies(
+            [(result["conversation_id"], result["reply"], result["latency_ms"]) for result in results if result["reply"]]
+        )
+        return results
@@ -4,6 +4,7 @@ import os
 import json
 from typing import Optional
 from x_agent_os.database import DatabaseHandler
+from x_agent_os.llm_cache import LLMResponseCache
 
 class ReviewerAgent:
     def __init__(self):
@@ -15,6 +16,7 @@ class ReviewerAgent:
         # For now, we'll just print, model initialization will be more specific
         print("ReviewerAgent initialized with Gemini 3 Flash Preview")
         self.model = genai.GenerativeModel('gemini-3-flash-preview')
+        self.llm_cache = LLMResponseCache(self.db, "reviewer")
 
     def review_and_distill(self, search_results: list, app_name: str, app_description: str, tuon_features_content: str, session_id: Optional[int] = None) -> dict:
         """
@@ -57,7 +59,7 @@ class ReviewerAgent:
         print(f"-- Reviewer Agent Prompt to Gemini --\n{prompt[:500]}...\n-- End of Prompt Snippet --")
 
         # Actual call to Gemini API will go here
-        response = self.model.generate_content(prompt)
+        response = self.llm_cache.generate(self.model, prompt)
         
         # Ensure the response is not empty and has text
         if not response.parts:
@@ -1,27 +1,203 @@
 import http.client
-import json
 import os
+import threading
 import urllib.parse # For URL encoding the query
-from typing import Optional
-from x_agent_os.config import RAPIDAPI_API_KEY
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Tuple
+from x_agent_os.config import RAPIDAPI_API_KEY, RAPIDAPI_POOL_SIZE, RAPIDAPI_TIMEOUT_SECONDS
 from x_agent_os.database import DatabaseHandler
 from x_agent_os.content_fingerprinting import IncrementalProcessingManager
+from x_agent_os.http_pool import get_pool
+from x_agent_os.provider_cache import ProviderResponseCache, normalize_query
+from x_agent_os.single_flight import SingleFlight
+from x_agent_os.timeline_parser import loads, parse_search_timeline
+
+RAPIDAPI_HOST = "twitter241.p.rapidapi.com"
+RAPIDAPI_PAGE_SIZE = 20 # Tweets per search-v2 request; larger counts are paged with cursors
+RAPIDAPI_MAX_PAGES = 10
+
+
+def _parse_created_at(created_at: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.strptime(created_at, "%a %b %d %H:%M:%S %z %Y")
+    except (TypeError, ValueError):
+        return None
+
 
 class TwitterAgent:
-    def __init__(self):
+    def __init__(self, call_limiter: Optional[threading.Semaphore] = None):
+        """call_limiter (the orchestrator's RapidAPI semaphore) also bounds background cache refreshes."""
         if not RAPIDAPI_API_KEY:
             raise ValueError("RAPIDAPI_API_KEY not configured.")
         self.api_key = RAPIDAPI_API_KEY
         self.db = DatabaseHandler()
-        self.conn = http.client.HTTPSConnection("twitter241.p.rapidapi.com")
+        self._local = threading.local() # Per-thread last raw response for incremental processing
+        # Keep-alive sockets shared by every TwitterAgent
+        self.http = get_pool(RAPIDAPI_HOST, maxsize=RAPIDAPI_POOL_SIZE, timeout=RAPIDAPI_TIMEOUT_SECONDS)
+        self.response_cache = ProviderResponseCache(self.db, "rapidapi", revalidate_limiter=call_limiter)
+        self._flights = SingleFlight() # Identical queries share one call for this agent's lifetime (one run)
         print("TwitterAgent initialized with RapidAPI client.")
 
-    def search_tweets(self, query: str, count: int = 20, search_type: str = "Top", session_id: Optional[int] = None) -> list:
-        """Queries RapidAPI Twitter V2 to find tweets based on the query."""
+    def _request(self, endpoint: str) -> Optional[str]:
+        """GET an endpoint; returns the body text, or None for non-200 responses (never cached)."""
+        headers = {
+            'x-rapidapi-key': self.api_key,
+            'x-rapidapi-host': RAPIDAPI_HOST
+        }
+        status, _, data = self.http.request("GET", endpoint, headers=headers)
+        raw_response_text = data.decode("utf-8")
+        if status != 200:
+            print(f"Error from RapidAPI: {status} - {raw_response_text}")
+            return None
+        return raw_response_text
+
+    def _fetch_results(self, query: str, count: int, search_type: str) -> Tuple[list, str, Optional[str]]:
+        """Fetch and parse up to count tweets; returns (results, raw_api_response, response_key) of the first page."""
+        if count <= RAPIDAPI_PAGE_SIZE:
+            results, raw_api_response, response_key, _ = self._fetch_page(query, count, search_type)
+            return results, raw_api_response, response_key
+
+        results, raw_api_response, response_key = [], "", None
+        seen = set()
+
+        def collect(page_results: list) -> bool:
+            for tweet in page_results:
+                if tweet["url"] not in seen:
+                    seen.add(tweet["url"])
+                    results.append(tweet)
+            return len(results) < count
+
+        for _, page_raw, page_key, _ in self._iter_pages(query, search_type, RAPIDAPI_PAGE_SIZE, keep_paging=collect):
+            if not raw_api_response:
+                raw_api_response, response_key = page_raw, page_key
+        return results[:count], raw_api_response, response_key
+
+    def _iter_pages(
+        self,
+        query: str,
+        search_type: str,
+        page_size: int,
+        max_pages: int = RAPIDAPI_MAX_PAGES,
+        prefetch: bool = True,
+        keep_paging: Optional[Callable[[list], bool]] = None,
+    ) -> Iterator[Tuple[list, str, Optional[str], Optional[str]]]:
+        """
+        Yield (results, raw_api_response, response_key, next_cursor) per page, following
+        bottom cursors. With prefetch the next page is requested while the caller handles
+        the current one. Stops at max_pages, an empty page, a missing cursor, or when
+        keep_paging(results), called once per page before anything is prefetched,
+        returns False.
+        """
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tweet-page") if prefetch else None
+        try:
+            def request_page(cursor):
+                if pool is None:
+                    return self._fetch_page(query, page_size, search_type, cursor)
+                return pool.submit(self._fetch_page, query, page_size, search_type, cursor)
+
+            pending = request_page(None)
+            for page_number in range(max_pages):
+                page = pending.result() if pool is not None else pending
+                results, _, _, cursor = page
+                wanted = keep_paging(results) if keep_paging is not None else True
+                has_next = bool(wanted and cursor and results and page_number + 1 < max_pages)
+                if has_next:
+                    pending = request_page(cursor)
+                yield page
+                if not has_next:
+                    return
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def iter_search_tweets(
+        self,
+        query: str,
+        search_type: str = "Latest",
+        max_items: Optional[int] = None,
+        since: Optional[datetime] = None,
+        page_size: int = RAPIDAPI_PAGE_SIZE,
+        max_pages: int = RAPIDAPI_MAX_PAGES,
+        prefetch: bool = True,
+        since_id: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Stream tweets for a query across pages. Stops after max_items tweets, or once a
+        whole page is older than `since` (tweets older than `since` are never yielded).
+        With since_id, paging stops after the first page that reaches that tweet; the
+        already-known tweets on it are still yielded so callers can refresh their counts.
+        Results are not saved to any session.
+        """
+        yielded = 0
+        seen = set()
+        known_id = int(since_id) if since_id and since_id.isdigit() else None
+        batches: List[list] = []
+
+        # Decides each page's tweets before the next page is prefetched, so a page
+        # that finishes the stream never costs another request.
+        def take(results: list) -> bool:
+            nonlocal yielded
+            batch = []
+            batches.append(batch)
+            older = 0
+            reached_known = False
+            for tweet in results:
+                tweet_id = tweet["url"].rsplit("/", 1)[-1]
+                if known_id is not None and tweet_id.isdigit() and int(tweet_id) <= known_id:
+                    reached_known = True
+                if tweet["url"] in seen:
+                    continue
+                seen.add(tweet["url"])
+                created_at = _parse_created_at(tweet.get("created_at"))
+                if since and created_at and created_at < since:
+                    older += 1
+                    continue
+                batch.append(tweet)
+                yielded += 1
+                if max_items and yielded >= max_items:
+                    return False
+            return not (reached_known or (since and results and older == len(results)))
+
+        for _ in self._iter_pages(query, search_type, page_size, max_pages, prefetch, keep_paging=take):
+            yield from batches.pop(0)
+
+    def _fetch_page(
+        self, query: str, count: int, search_type: str, cursor: Optional[str] = None
+    ) -> Tuple[list, str, Optional[str], Optional[str]]:
+        """Fetch (via the response cache) and parse one page; returns (results, raw_api_response, response_key, next_cursor)."""
+        # URL encode the query parameter
+        encoded_query = urllib.parse.quote(query)
+        endpoint = f"/search-v2?type={search_type}&count={count}&query={encoded_query}"
+        params = {"type": search_type, "count": count}
+        if cursor:
+            endpoint += f"&cursor={urllib.parse.quote(cursor)}"
+            params["cursor"] = cursor
+
+        raw_response_text, response_key, cache_status = self.response_cache.fetch(
+            query, params, lambda: self._request(endpoint)
+        )
+        if raw_response_text is None:
+            return [], "", None, None
+        if cache_status in ("hit", "stale"):
+            print(f"💾 PROVIDER CACHE {cache_status.upper()}: Reusing RapidAPI response for this query")
+
+        # Stored exactly as received; parsing is a single pass over the decoded payload
+        tweet_results_data, next_cursor = parse_search_timeline(loads(raw_response_text))
+        if not tweet_results_data:
+            print(f"Warning: No tweets extracted from primary paths or globalObjects. Response structure might have changed or contained no tweets. Raw response snippet: {raw_response_text[:500]}")
+
+        return tweet_results_data, raw_response_text, response_key, next_cursor
+
+    def search_tweets(self, query: str, count: int = 20, search_type: str = "Top", session_id: Optional[int] = None, use_session_cache: bool = True) -> list:
+        """
+        Queries RapidAPI Twitter V2 to find tweets based on the query.
+        Pass use_session_cache=False when one session holds results for several queries.
+        """
         print(f"Searching for tweets matching query: '{query}' using RapidAPI (count: {count}, type: {search_type})")
 
         # Check database cache first
-        if session_id and self.db.has_twitter_results(session_id):
+        if use_session_cache and session_id and self.db.has_twitter_results(session_id):
             cached_results = self.db.get_twitter_results(session_id)
             print(f"💾 CACHE HIT: Loaded {len(cached_results)} tweet results from database for session {session_id}")
             print(f"   🚀 Skipping API call - using cached data")
@@ -34,155 +210,24 @@ class TwitterAgent:
         else:
             print(f"❌ NO SESSION ID: Cannot use caching, making API call to RapidAPI...")
 
-        headers = {
-            'x-rapidapi-key': self.api_key,
-            'x-rapidapi-host': "twitter241.p.rapidapi.com"
-        }
-        
-        # URL encode the query parameter
-        encoded_query = urllib.parse.quote(query)
-        endpoint = f"/search-v2?type={search_type}&count={count}&query={encoded_query}"
-
         try:
-            self.conn.request("GET", endpoint, headers=headers)
-            res = self.conn.getresponse()
-            data = res.read()
-            raw_response_text = data.decode("utf-8")
-
-            # Prepare raw API response for database storage
-            try:
-                raw_api_response = json.dumps(json.loads(raw_response_text), indent=2)
-            except json.JSONDecodeError:
-                raw_api_response = raw_response_text
-            
-            # Store for incremental processing
-            self._last_raw_response = raw_api_response
+            (shared_results, raw_api_response, response_key), coalesced = self._flights.do(
+                ("search-v2", normalize_query(query), search_type, count),
+                lambda: self._fetch_results(query, count, search_type),
+                remember_if=lambda result: bool(result[1]), # Don't pin a failed (non-200) request for the run
+            )
+            if coalesced:
+                print(f"🔗 COALESCED: Reusing this run's RapidAPI result for the same query")
+            # Copies, so callers can't mutate the shared result
+            tweet_results_data = [dict(result) for result in shared_results]
 
-            if res.status != 200:
-                print(f"Error from RapidAPI: {res.status} - {raw_response_text}")
-                return []
-
-            response_json = json.loads(raw_response_text)
-            
-            # Extract relevant data: tweet URL and text content as snippet
-            # Based on sample_rapidapi_response.json, tweets are in response_json['data']['search_by_raw_query']['search_timeline']['timeline']['instructions'][0]['entries']
-            # Each entry that is a tweet has an itemContent of type "tweet"
-            # The tweet URL can be constructed: https://twitter.com/{user_screen_name}/status/{tweet_id}
-            # The tweet text is in legacy.full_text
-            
-            tweet_results_data = []
-            
-            # Navigating the complex structure of the sample response
-            raw_entries_or_items = [] # Will store items from either 'entries' or 'moduleItems'
-
-            if response_json and \
-                response_json.get('result','{}').get('timeline', {}).get('instructions'):
-                
-                for instruction in response_json['result']['timeline']['instructions']:
-                    instruction_type = instruction.get('type')
-                    if instruction_type == 'TimelineAddEntries':
-                        raw_entries_or_items.extend(instruction.get('entries', []))
-                    elif instruction_type == 'TimelineModule': # Check for TimelineModule
-                        for module_item_container in instruction.get('items', []): # items in TimelineModule
-                            # The actual tweet item is nested deeper
-                            item = module_item_container.get('item')
-                            if item and item.get('itemContent'):
-                                raw_entries_or_items.append(item) # Add the item itself which contains itemContent
-            
-            # Fallback for globalObjects structure if the primary path yields nothing
-            if not raw_entries_or_items and response_json.get('globalObjects', {}).get('tweets'):
-                print("Processing tweets from 'globalObjects.tweets' structure.")
-                for tweet_id, tweet_data in response_json['globalObjects']['tweets'].items():
-                    user_id_str = tweet_data.get('user_id_str')
-                    user_info = response_json.get('globalObjects', {}).get('users', {}).get(user_id_str, {})
-                    
-                    screen_name = user_info.get('screen_name', 'unknown_user')
-                    followers_count = user_info.get('followers_count', 0)
-                    text = tweet_data.get('full_text', tweet_data.get('text', 'No text available'))
-                    url = f"https://twitter.com/{screen_name}/status/{tweet_id}"
-                    
-                    tweet_results_data.append({
-                        "url": url,
-                        "snippet": text,
-                        "screen_name": screen_name,
-                        "followers_count": followers_count,
-                        "created_at": tweet_data.get('created_at', 'N/A'),
-                        "favorite_count": tweet_data.get('favorite_count', 0),
-                        "quote_count": tweet_data.get('quote_count', 0),
-                        "reply_count": tweet_data.get('reply_count', 0),
-                        "retweet_count": tweet_data.get('retweet_count', 0)
-                    })
-                if tweet_results_data:
-                        print(f"Processed {len(tweet_results_data)} tweets from 'globalObjects'.")
-            
-            # Process the collected entries or items
-            for item_like_entry in raw_entries_or_items:
-                tweet_result = None
-                item_content = item_like_entry.get('itemContent') # Used by TimelineModule items
-                content = item_like_entry.get('content') # Used by TimelineAddEntries entries
-
-                if item_content and item_content.get('tweet_results', {}).get('result'):
-                    tweet_result = item_content['tweet_results']['result']
-                elif content: # Fallback to original logic for TimelineAddEntries structure
-                    if content.get('itemContent', {}).get('tweet_results', {}).get('result'):
-                        tweet_result = content['itemContent']['tweet_results']['result']
-                    elif content.get('tweet_results', {}).get('result'):
-                        tweet_result = content['tweet_results']['result']
-                    elif content.get('tweet', {}).get('tweet_results', {}).get('result'):
-                        tweet_result = content['tweet']['tweet_results']['result']
-
-                if tweet_result and tweet_result.get('__typename') == 'Tweet':
-                    legacy_tweet_data = tweet_result.get('legacy', {})
-                    
-                    # Get user data - UPDATED for new API structure
-                    core_user_data = {}
-                    screen_name = 'unknown_user'
-                    
-                    # Try new API structure first (screen_name moved to core)
-                    if tweet_result.get('core', {}).get('user_results', {}).get('result', {}).get('core'):
-                        user_core = tweet_result['core']['user_results']['result']['core']
-                        screen_name = user_core.get('screen_name', 'unknown_user')
-                        # Get legacy data for followers count, etc.
-                        user_legacy = tweet_result['core']['user_results']['result'].get('legacy', {})
-                        core_user_data = user_legacy
-                    
-                    # Fallback to old structure
-                    elif tweet_result.get('core', {}).get('user_results', {}).get('result', {}).get('legacy'):
-                        core_user_data = tweet_result['core']['user_results']['result']['legacy']
-                        screen_name = core_user_data.get('screen_name', 'unknown_user')
-                    elif tweet_result.get('user', {}).get('result', {}).get('legacy'): # For some tweet types like community tweet
-                        core_user_data = tweet_result['user']['result']['legacy']
-                        screen_name = core_user_data.get('screen_name', 'unknown_user')
-                    
-                    tweet_id = legacy_tweet_data.get('id_str')
-                    full_text = legacy_tweet_data.get('full_text', 'No text available')
-                    
-                    if tweet_id and screen_name != 'unknown_user':
-                        url = f"https://twitter.com/{screen_name}/status/{tweet_id}"
-                        
-                        tweet_item = {
-                            "url": url,
-                            "snippet": full_text,
-                            "screen_name": screen_name,
-                            "followers_count": core_user_data.get('followers_count', 0),
-                            "created_at": legacy_tweet_data.get('created_at', 'N/A'),
-                            "favorite_count": legacy_tweet_data.get('favorite_count', 0),
-                            "quote_count": legacy_tweet_data.get('quote_count', 0),
-                            "reply_count": legacy_tweet_data.get('reply_count', 0),
-                            "retweet_count": legacy_tweet_data.get('retweet_count', 0)
-                        }
-                        tweet_results_data.append(tweet_item)
-            
-            if not tweet_results_data:
-                # Keep the warning if, after all attempts, no data is extracted
-                # This also covers the case where globalObjects was processed but yielded no data.
-                if not ('globalObjects' in response_json and 'tweets' in response_json['globalObjects'] and tweet_results_data): # only show warning if not already processed globalObjects
-                    print(f"Warning: No tweets extracted from primary paths or globalObjects. Response structure might have changed or contained no tweets. Raw response snippet: {raw_response_text[:500]}")
+            # Store for incremental processing
+            self._local.last_raw_response = raw_api_response
 
             # Save to database if we have data and a session_id
             if tweet_results_data and session_id:
                 try:
-                    self.db.save_twitter_results(session_id, tweet_results_data, raw_api_response)
+                    self.db.save_twitter_results(session_id, tweet_results_data, raw_api_response, response_key=response_key)
                     print(f"Saved {len(tweet_results_data)} tweet results to database for session {session_id}")
                 except Exception as e:
                     print(f"Error saving tweet results to database: {e}")
@@ -194,8 +239,8 @@ class TwitterAgent:
             import traceback
             traceback.print_exc()
             return []
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON response from RapidAPI: {e}. Response text: {raw_response_text[:500]}")
+        except ValueError as e: # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+            print(f"Error decoding JSON response from RapidAPI: {e}. Response text: {str(getattr(e, 'doc', ''))[:500]}")
             import traceback
             traceback.print_exc()
             return []
@@ -204,28 +249,24 @@ class TwitterAgent:
             import traceback
             traceback.print_exc()
             return []
-        finally:
-            # It's good practice to close the connection, 
-            # but HTTPSConnection can be reused for multiple requests to the same host.
-            # If you were done with this host, you'd close it: self.conn.close()
-            # For now, assume it might be reused if multiple searches are done with one agent instance.
-            pass 
 
     def search_user_tweets(self, username: str, count: int = 20, search_type: str = "Latest") -> list:
-        """Fetch recent tweets from a specific username using search."""
+        """Fetch recent tweets from a specific username using search (paged when count > RAPIDAPI_PAGE_SIZE)."""
         handle = username.lstrip("@")
         query = f"from:{handle}"
         return self.search_tweets(query, count=count, search_type=search_type, session_id=None)
     
-    def search_tweets_incremental(self, query: str, count: int = 20, search_type: str = "Top", session_id: Optional[int] = None) -> dict:
+    def search_tweets_incremental(self, query: str, count: int = 20, search_type: str = "Top", session_id: Optional[int] = None, use_session_cache: bool = True, record_fingerprints: bool = True) -> dict:
         """
         Search for tweets and return only NEW ones not seen before.
         This is the main method for incremental content generation.
+        record_fingerprints=False leaves the new items unrecorded; their fingerprints
+        come back as new_fingerprints for IncrementalProcessingManager.record_fingerprints().
         """
         print(f"🔄 INCREMENTAL Twitter search for query: '{query}'")
         
         # Get all tweet results (both new and existing)
-        all_results = self.search_tweets(query, count, search_type, session_id)
+        all_results = self.search_tweets(query, count, search_type, session_id, use_session_cache)
         
         if not all_results:
             print("❌ No tweets returned from API")
@@ -233,16 +274,17 @@ class TwitterAgent:
                 "new_results": [],
                 "duplicate_count": 0,
                 "total_processed": 0,
-                "fingerprint_ids": []
+                "new_fingerprints": [],
+                "new_fingerprint_ids": []
             }
         
         # Process incrementally using fingerprinting
         processor = IncrementalProcessingManager(self.db)
         
         # Get the raw response for fingerprinting
-        raw_response = getattr(self, '_last_raw_response', "")
+        raw_response = getattr(self._local, 'last_raw_response', "")
         
-        result = processor.process_twitter_results_incrementally(all_results, raw_response)
+        result = processor.process_twitter_results_incrementally(all_results, raw_response, record=record_fingerprints)
         
         print(f"📊 Twitter processing summary:")
         print(f"   Total tweets: {result['total_processed']}")
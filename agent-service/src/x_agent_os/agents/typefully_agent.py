@@ -12,7 +12,7 @@ from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 
 from .typefully_auth import TypefullyAuth, TypefullyAuthError
-from .typefully_client import TypefullyClient, TypefullyAPIError, ValidationError
+from .typefully_client import AsyncTypefullyClient, TypefullyAPIError, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -88,10 +88,10 @@ class TypefullyAgent:
             self.auth = TypefullyAuth()
             
             # Initialize client
-            self.client = TypefullyClient(self.auth)
+            self.client = AsyncTypefullyClient(self.auth, self.account_id)
             
             # Test connectivity
-            health = self.client.health_check()
+            health = await self.client.health_check()
             
             if health["api_connectivity"]:
                 self.initialized = True
@@ -123,37 +123,28 @@ class TypefullyAgent:
         self._ensure_initialized()
         
         try:
-            # Prepare publishing options
-            options = {
-                "auto_retweet": request.auto_retweet,
-                "auto_plug": request.auto_plug,
-                "share": True  # Always generate share URL
-            }
-            
-            if request.schedule_date:
-                if isinstance(request.schedule_date, datetime):
-                    options["schedule_date"] = request.schedule_date.isoformat()
-                else:
-                    options["schedule_date"] = request.schedule_date
+            schedule_date = request.schedule_date
+            if isinstance(schedule_date, datetime):
+                schedule_date = schedule_date.isoformat()
             
             # Determine content type and publish
             content_length = len(request.content)
             
             if content_length <= 280 or request.content_type == "single_tweet":
-                # Single tweet
-                result = self.client.create_draft({
-                    "content": request.content,
-                    **options
-                })
                 pub_type = "single_tweet"
             else:
-                # Thread
-                result = self.client.create_thread({
-                    "content": request.content,
-                    **options
-                })
                 pub_type = "thread"
             
+            result = await self.client.create_draft(
+                request.content,
+                threadify=pub_type == "thread",
+                share=True,  # Always generate share URL
+                schedule_date=schedule_date,
+                auto_retweet_enabled=request.auto_retweet,
+                auto_plug_enabled=request.auto_plug,
+                account_id=request.account_id
+            )
+            
             # Update stats
             if request.schedule_date:
                 self.stats["total_scheduled"] += 1
@@ -170,7 +161,7 @@ class TypefullyAgent:
                 share_url=result.get("share_url"),
                 tweet_url=result.get("tweet_url"),
                 content_type=pub_type,
-                scheduled_date=options.get("schedule_date"),
+                scheduled_date=schedule_date,
                 metrics={"content_length": content_length}
             )
             
@@ -203,8 +194,10 @@ class TypefullyAgent:
         self._ensure_initialized()
         
         try:
-            scheduled = self.client.get_recently_scheduled_drafts()
-            published = self.client.get_recently_published_drafts()
+            scheduled, published = await asyncio.gather(
+                self.client.get_recently_scheduled_drafts(),
+                self.client.get_recently_published_drafts()
+            )
             
             return {
                 "scheduled_drafts": scheduled[:limit],
@@ -235,7 +228,7 @@ class TypefullyAgent:
     async def cleanup(self):
         """Clean up agent resources"""
         if self.client:
-            self.client.close()
+            await self.client.aclose()
         
         logger.info("Typefully agent cleaned up")
 
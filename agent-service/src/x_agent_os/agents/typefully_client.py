@@ -2,18 +2,25 @@
 Typefully API Client
 
 Comprehensive client for Typefully API that handles all HTTP operations,
-rate limiting, error handling, and response validation.
+rate limiting, error handling, and response validation. AsyncTypefullyClient
+does the work; TypefullyClient is a blocking facade over it for existing callers.
 """
 
+import asyncio
+import functools
+import http.client
 import time
 import logging
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, Union
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, List, Tuple, Union
 import json
 
+from x_agent_os.config import TYPEFULLY_CONFIG, TypefullyConfig
+from x_agent_os.http_pool import ConnectError, get_pool
 from .typefully_auth import TypefullyAuth, TypefullyAuthError
 
 logger = logging.getLogger(__name__)
@@ -39,6 +46,16 @@ class ValidationError(TypefullyAPIError):
     pass
 
 
+class AuthenticationError(TypefullyAPIError):
+    """Raised when no valid API credentials are available (nothing was sent)"""
+    pass
+
+
+class ConnectionFailedError(TypefullyAPIError):
+    """Raised when the API host could not be reached (nothing was sent)"""
+    pass
+
+
 class NotificationPayload:
     """Base class for notification payloads"""
     pass
@@ -58,149 +75,447 @@ class DraftPublishedPayload(NotificationPayload):
         self.num_tweets = data.get("num_tweets")
 
 
-class TypefullyClient:
+# Statuses retried with exponential backoff (429 is handled separately via Retry-After).
+_RETRY_STATUSES = {500, 502, 503, 504}
+
+
+class TypefullyRateLimiter:
     """
-    Comprehensive Typefully API client
-    
+    Dual token bucket: every request needs a token from both the per-minute and
+    the per-hour bucket. reserve() takes the tokens up front and returns how long
+    the caller must wait before sending, so concurrent callers queue in order
+    without holding a lock while they sleep. A 429's Retry-After pauses every
+    caller sharing the limiter (block_for).
+    """
+
+    def __init__(self, per_minute: int, per_hour: int):
+        now = time.monotonic()
+        # [capacity, refill per second, tokens, last refill]; a non-positive limit disables that bucket
+        self._buckets = [
+            [float(limit), limit / window, float(limit), now]
+            for limit, window in ((per_minute, 60.0), (per_hour, 3600.0))
+            if limit > 0
+        ]
+        self.per_minute = per_minute
+        self.per_hour = per_hour
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token from each bucket; returns seconds to wait before the request may go out."""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._blocked_until - now)
+            for bucket in self._buckets:
+                capacity, rate, tokens, last = bucket
+                tokens = min(capacity, tokens + (now - last) * rate) - 1
+                bucket[2], bucket[3] = tokens, now
+                if tokens < 0:
+                    delay = max(delay, -tokens / rate)
+            return delay
+
+    def block_for(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+# Process-wide limiter per Typefully host, shared by every client (sync and async).
+_limiters: Dict[str, TypefullyRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str, config: TypefullyConfig = TYPEFULLY_CONFIG) -> TypefullyRateLimiter:
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = TypefullyRateLimiter(config.rate_limit_per_minute, config.rate_limit_per_hour)
+        return limiter
+
+
+# Threads that run blocking pool requests, one executor per host sized to its pool.
+# The event loop's default executor has only cpu_count + 4 threads, which would
+# cap TYPEFULLY_MAX_CONCURRENCY on small machines.
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(host: str, max_workers: int) -> ThreadPoolExecutor:
+    with _executors_lock:
+        executor = _executors.get(host)
+        if executor is None:
+            executor = _executors[host] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="typefully")
+        return executor
+
+
+def _retry_after_seconds(headers: Dict[str, str], default: int = 60) -> int:
+    """Retry-After as delta-seconds or an HTTP date; default when missing or unparseable."""
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if not value:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0, int((retry_at - datetime.now(timezone.utc)).total_seconds()))
+
+
+class AsyncTypefullyClient:
+    """
+    Asynchronous Typefully API client
+
     Features:
-    - All Typefully API endpoints
-    - Automatic retry logic with exponential backoff
-    - Rate limiting compliance
+    - Requests share a process-wide keep-alive connection pool (up to
+      TypefullyConfig.max_concurrency in flight) and never block the event loop
+    - Per-minute and per-hour token buckets from TypefullyConfig
+    - Retry-After on 429, exponential backoff on 5xx and network errors
     - Response validation and error handling
-    - Connection pooling and session management
     """
-    
-    def __init__(self, auth: Optional[TypefullyAuth] = None, account_id: Optional[str] = None):
+
+    def __init__(self, auth: Optional[TypefullyAuth] = None, account_id: Optional[str] = None,
+                 config: TypefullyConfig = TYPEFULLY_CONFIG,
+                 rate_limiter: Optional[TypefullyRateLimiter] = None):
         """
-        Initialize Typefully API client
-        
+        Initialize async Typefully API client
+
         Args:
             auth: TypefullyAuth instance (will create if None)
             account_id: Specific account to use
+            config: Timeouts, retries, concurrency and rate limits
+            rate_limiter: Limiter to use (default: the one shared per host)
         """
         self.auth = auth or TypefullyAuth()
         self.account_id = account_id
-        
-        # Set up session with connection pooling and retries
-        self.session = requests.Session()
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
-            backoff_factor=1
+        self.config = config
+
+        base = urllib.parse.urlsplit(self.auth.BASE_URL)
+        self._base_path = base.path.rstrip("/")
+        self.pool = get_pool(
+            base.hostname,
+            maxsize=config.max_concurrency,
+            port=base.port,
+            tls=base.scheme == "https",
+            timeout=config.timeout_seconds,
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Rate limiting
-        self._last_request_time = 0
-        self._min_request_interval = 1.0  # 1 second between requests
-        
-        logger.info(f"Typefully client initialized for account: {self.account_id or 'default'}")
-    
-    def _wait_for_rate_limit(self) -> None:
-        """Implement basic rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        
-        if time_since_last < self._min_request_interval:
-            sleep_time = self._min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        
-        self._last_request_time = time.time()
-    
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                     params: Optional[Dict] = None, account_id: Optional[str] = None) -> Dict[str, Any]:
+        self.rate_limiter = rate_limiter or get_rate_limiter(base.netloc, config)
+        self._executor = _get_executor(base.netloc, self.pool.maxsize)
+        self._last_request_time = 0.0
+
+        logger.info(f"Async Typefully client initialized for account: {self.account_id or 'default'}")
+
+    def _build_request(self, endpoint: str, data: Optional[Dict], params: Optional[Dict],
+                       account_id: Optional[str]) -> Tuple[str, Dict[str, str], Optional[bytes]]:
+        path = f"{self._base_path}{endpoint}"
+        if params:
+            path += "?" + urllib.parse.urlencode(params)
+        try:
+            headers = self.auth.get_auth_headers(account_id or self.account_id)
+        except TypefullyAuthError as e:
+            raise AuthenticationError(f"Authentication failed: {e}")
+        body = json.dumps(data).encode("utf-8") if data is not None else None
+        return path, headers, body
+
+    @staticmethod
+    def _parse_response(status: int, body: bytes, method: str, endpoint: str) -> Dict[str, Any]:
+        if not 200 <= status < 300:
+            error_data = None
+            try:
+                error_data = json.loads(body) if body else None
+            except ValueError:
+                pass
+
+            error_msg = f"HTTP {status}: {http.client.responses.get(status, 'Unknown')}"
+            if error_data:
+                error_msg += f" - {error_data}"
+
+            logger.error(f"API request failed: {error_msg}")
+            raise TypefullyAPIError(error_msg, status_code=status, response_data=error_data)
+
+        try:
+            result = json.loads(body) if body else {}
+            logger.debug(f"Request successful: {method} {endpoint}")
+            return result
+        except ValueError as e:
+            logger.error(f"Failed to parse response JSON: {e}")
+            raise TypefullyAPIError(f"Invalid JSON response: {e}")
+
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                            params: Optional[Dict] = None, account_id: Optional[str] = None,
+                            idempotent: bool = True) -> Dict[str, Any]:
         """
-        Make an API request with error handling and rate limiting
-        
+        Make an API request with rate limiting, retries and error handling
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (e.g., '/drafts/')
             data: Request body data
             params: Query parameters
             account_id: Specific account to use for this request
-            
+            idempotent: False for requests that must not be repeated once they may have
+                reached the server; those are only retried on 429 and connection failures,
+                and the pool sends them at most once
+
         Returns:
             Response data as dictionary
-            
+
         Raises:
             TypefullyAPIError: For various API errors
-            RateLimitError: When rate limited
+            RateLimitError: When still rate limited after max_retries
         """
-        # Apply rate limiting
-        self._wait_for_rate_limit()
-        
-        # Build URL
-        url = f"{self.auth.BASE_URL}{endpoint}"
-        
-        # Get authentication headers
-        try:
-            headers = self.auth.get_auth_headers(account_id or self.account_id)
-        except TypefullyAuthError as e:
-            raise TypefullyAPIError(f"Authentication failed: {e}")
-        
+        path, headers, body = self._build_request(endpoint, data, params, account_id)
+        loop = asyncio.get_running_loop()
+
         logger.debug(f"Making {method} request to {endpoint}", extra={
             "method": method,
             "endpoint": endpoint,
             "has_data": bool(data),
             "has_params": bool(params)
         })
-        
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                headers=headers,
-                timeout=30
-            )
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
+
+        max_retries = max(0, self.config.max_retries)
+        for attempt in range(max_retries + 1):
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_request_time = time.time()
+            backoff = self.config.retry_delay * (2 ** attempt)
+
+            try:
+                status, response_headers, response_body = await loop.run_in_executor(
+                    self._executor, functools.partial(self.pool.request, method, path, headers, body, retry=idempotent)
+                )
+            except ConnectError as e:
+                # Nothing reached the server, so this is safe to retry even for non-idempotent requests
+                if attempt < max_retries:
+                    logger.warning(f"Could not connect ({e}), retrying in {backoff:.1f}s")
+                    await asyncio.sleep(backoff)
+                    continue
+                logger.error(f"Could not connect to the Typefully API: {e}")
+                raise ConnectionFailedError(f"Network error: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                if idempotent and attempt < max_retries:
+                    logger.warning(f"Network error during API request ({e}), retrying in {backoff:.1f}s")
+                    await asyncio.sleep(backoff)
+                    continue
+                logger.error(f"Network error during API request: {e}")
+                raise TypefullyAPIError(f"Network error: {e}")
+
+            if status == 429:
+                retry_after = _retry_after_seconds(response_headers)
+                self.rate_limiter.block_for(retry_after)
                 logger.warning(f"Rate limit exceeded, retry after {retry_after} seconds")
+                if attempt < max_retries:
+                    continue # The next reserve() waits out Retry-After
                 raise RateLimitError(
                     f"Rate limit exceeded. Retry after {retry_after} seconds",
                     retry_after=retry_after
                 )
-            
-            # Handle other HTTP errors
-            if not response.ok:
-                error_data = None
-                try:
-                    error_data = response.json()
-                except:
-                    pass
-                
-                error_msg = f"HTTP {response.status_code}: {response.reason}"
-                if error_data:
-                    error_msg += f" - {error_data}"
-                
-                logger.error(f"API request failed: {error_msg}")
-                raise TypefullyAPIError(
-                    error_msg,
-                    status_code=response.status_code,
-                    response_data=error_data
-                )
-            
-            # Parse response
-            try:
-                result = response.json() if response.content else {}
-                logger.debug(f"Request successful: {method} {endpoint}")
-                return result
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse response JSON: {e}")
-                raise TypefullyAPIError(f"Invalid JSON response: {e}")
-                
-        except requests.RequestException as e:
-            logger.error(f"Network error during API request: {e}")
-            raise TypefullyAPIError(f"Network error: {e}")
+
+            if status in _RETRY_STATUSES and idempotent and attempt < max_retries:
+                logger.warning(f"HTTP {status} from {endpoint}, retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                continue
+
+            return self._parse_response(status, response_body, method, endpoint)
+
+    # ========================
+    # DRAFT MANAGEMENT
+    # ========================
+
+    async def create_draft(self, content: str, threadify: bool = True, share: bool = False,
+                           schedule_date: Optional[Union[str, datetime]] = None,
+                           auto_retweet_enabled: bool = False, auto_plug_enabled: bool = False,
+                           account_id: Optional[str] = None) -> Dict[str, Any]:
+        """Create a draft (see TypefullyClient.create_draft)"""
+        if not content.strip():
+            raise ValidationError("Content cannot be empty")
+
+        data = {
+            "content": content,
+            "threadify": threadify,
+            "share": share,
+            "auto_retweet_enabled": auto_retweet_enabled,
+            "auto_plug_enabled": auto_plug_enabled
+        }
+
+        # Handle scheduling
+        if schedule_date:
+            if isinstance(schedule_date, datetime):
+                data["schedule-date"] = schedule_date.isoformat()
+            else:
+                data["schedule-date"] = schedule_date
+
+        logger.info(f"Creating draft with {len(content)} characters")
+        # Not retried on 5xx/network errors: the draft may already exist (see TypefullyDraftManager)
+        return await self._make_request("POST", "/drafts/", data=data, account_id=account_id, idempotent=False)
+
+    async def _list_drafts(self, endpoint: str, content_filter: Optional[str],
+                           account_id: Optional[str]) -> List[Dict[str, Any]]:
+        params = {}
+        if content_filter:
+            if content_filter not in ["threads", "tweets"]:
+                raise ValidationError("content_filter must be 'threads' or 'tweets'")
+            params["content_filter"] = content_filter
+
+        result = await self._make_request("GET", endpoint, params=params, account_id=account_id)
+        return result if isinstance(result, list) else result.get("drafts", [])
+
+    async def get_recently_scheduled_drafts(self, content_filter: Optional[str] = None,
+                                            account_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get recently scheduled drafts (content_filter: "threads" or "tweets")"""
+        logger.info("Fetching recently scheduled drafts")
+        return await self._list_drafts("/drafts/recently-scheduled/", content_filter, account_id)
+
+    async def get_recently_published_drafts(self, content_filter: Optional[str] = None,
+                                            account_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get recently published drafts (content_filter: "threads" or "tweets")"""
+        logger.info("Fetching recently published drafts")
+        return await self._list_drafts("/drafts/recently-published/", content_filter, account_id)
+
+    # ========================
+    # NOTIFICATIONS
+    # ========================
+
+    async def get_notifications(self, kind: Optional[str] = None,
+                                account_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get latest notifications (kind: "inbox" or "activity")"""
+        params = {}
+        if kind:
+            if kind not in ["inbox", "activity"]:
+                raise ValidationError("kind must be 'inbox' or 'activity'")
+            params["kind"] = kind
+
+        logger.info(f"Fetching notifications" + (f" (kind: {kind})" if kind else ""))
+        return await self._make_request("GET", "/notifications/", params=params, account_id=account_id)
+
+    async def mark_notifications_read(self, kind: Optional[str] = None, username: Optional[str] = None,
+                                      account_id: Optional[str] = None) -> Dict[str, Any]:
+        """Mark notifications as read, optionally only one kind or one username"""
+        data = {}
+        if kind:
+            if kind not in ["inbox", "activity"]:
+                raise ValidationError("kind must be 'inbox' or 'activity'")
+            data["kind"] = kind
+
+        if username:
+            data["username"] = username
+
+        logger.info(f"Marking notifications as read" +
+                   (f" (kind: {kind})" if kind else "") +
+                   (f" (username: {username})" if username else ""))
+
+        return await self._make_request("POST", "/notifications/mark-all-read/",
+                                        data=data, account_id=account_id)
+
+    # ========================
+    # STATUS
+    # ========================
+
+    def get_client_info(self) -> Dict[str, Any]:
+        """
+        Get client information and status
+
+        Returns:
+            Client information dictionary
+        """
+        return {
+            "auth_account": self.account_id or "default",
+            "base_url": self.auth.BASE_URL,
+            "last_request_time": self._last_request_time,
+            "rate_limit_per_minute": self.rate_limiter.per_minute,
+            "rate_limit_per_hour": self.rate_limiter.per_hour,
+            "max_concurrency": self.pool.maxsize,
+            "pool": self.pool.stats(),
+            "available_accounts": [acc["account_id"] for acc in self.auth.list_accounts()]
+        }
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Perform health check on the client and underlying auth
+
+        Returns:
+            Health status information
+        """
+        logger.info("Performing Typefully client health check")
+
+        # Get auth health check
+        auth_health = self.auth.health_check()
+
+        # Test basic connectivity
+        api_connectivity = False
+        try:
+            # Use a lightweight endpoint to test connectivity
+            await self.get_notifications()
+            api_connectivity = True
+        except Exception as e:
+            logger.warning(f"API connectivity test failed: {e}")
+
+        return {
+            "client_status": "healthy" if api_connectivity else "degraded",
+            "api_connectivity": api_connectivity,
+            "auth_health": auth_health,
+            "current_account": self.account_id,
+            "session_active": bool(self.pool),
+            "last_check": datetime.now(timezone.utc).isoformat()
+        }
+
+    async def aclose(self) -> None:
+        """Drop idle pooled connections (the pool itself is shared and stays usable)"""
+        self.pool.close()
+        logger.info("Typefully client connections closed")
+
+
+# Event loop the sync facade runs coroutines on, so it also works when called
+# from code that is already inside a running loop.
+_facade_loop: Optional[asyncio.AbstractEventLoop] = None
+_facade_loop_lock = threading.Lock()
+
+
+def run_sync(coro):
+    """Run a coroutine to completion on the facade loop and return its result (blocking)."""
+    global _facade_loop
+    with _facade_loop_lock:
+        if _facade_loop is None:
+            _facade_loop = asyncio.new_event_loop()
+            threading.Thread(target=_facade_loop.run_forever, name="typefully-sync", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _facade_loop).result()
+
+
+class TypefullyClient:
+    """
+    Comprehensive Typefully API client (synchronous facade over AsyncTypefullyClient)
+    
+    Features:
+    - All Typefully API endpoints
+    - Automatic retry logic with exponential backoff and Retry-After
+    - Per-minute and per-hour rate limits from TypefullyConfig
+    - Response validation and error handling
+    - Connection pooling shared with async callers
+    """
+    
+    def __init__(self, auth: Optional[TypefullyAuth] = None, account_id: Optional[str] = None,
+                 config: TypefullyConfig = TYPEFULLY_CONFIG):
+        """
+        Initialize Typefully API client
+        
+        Args:
+            auth: TypefullyAuth instance (will create if None)
+            account_id: Specific account to use
+            config: Timeouts, retries, concurrency and rate limits
+        """
+        self.async_client = AsyncTypefullyClient(auth, account_id, config)
+        self.auth = self.async_client.auth
+        self.account_id = account_id
+        
+        logger.info(f"Typefully client initialized for account: {self.account_id or 'default'}")
+    
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
+                     params: Optional[Dict] = None, account_id: Optional[str] = None) -> Dict[str, Any]:
+        """Blocking AsyncTypefullyClient._make_request"""
+        return run_sync(self.async_client._make_request(method, endpoint, data, params, account_id))
     
     # ========================
     # DRAFT MANAGEMENT
@@ -225,26 +540,11 @@ class TypefullyClient:
         Returns:
             Created draft information
         """
-        if not content.strip():
-            raise ValidationError("Content cannot be empty")
-        
-        data = {
-            "content": content,
-            "threadify": threadify,
-            "share": share,
-            "auto_retweet_enabled": auto_retweet_enabled,
-            "auto_plug_enabled": auto_plug_enabled
-        }
-        
-        # Handle scheduling
-        if schedule_date:
-            if isinstance(schedule_date, datetime):
-                data["schedule-date"] = schedule_date.isoformat()
-            else:
-                data["schedule-date"] = schedule_date
-        
-        logger.info(f"Creating draft with {len(content)} characters")
-        return self._make_request("POST", "/drafts/", data=data, account_id=account_id)
+        return run_sync(self.async_client.create_draft(
+            content, threadify=threadify, share=share, schedule_date=schedule_date,
+            auto_retweet_enabled=auto_retweet_enabled, auto_plug_enabled=auto_plug_enabled,
+            account_id=account_id
+        ))
     
     def get_recently_scheduled_drafts(self, content_filter: Optional[str] = None,
                                     account_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -258,16 +558,7 @@ class TypefullyClient:
         Returns:
             List of recently scheduled drafts
         """
-        params = {}
-        if content_filter:
-            if content_filter not in ["threads", "tweets"]:
-                raise ValidationError("content_filter must be 'threads' or 'tweets'")
-            params["content_filter"] = content_filter
-        
-        logger.info("Fetching recently scheduled drafts")
-        result = self._make_request("GET", "/drafts/recently-scheduled/", 
-                                  params=params, account_id=account_id)
-        return result if isinstance(result, list) else result.get("drafts", [])
+        return run_sync(self.async_client.get_recently_scheduled_drafts(content_filter, account_id))
     
     def get_recently_published_drafts(self, content_filter: Optional[str] = None,
                                     account_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -281,16 +572,7 @@ class TypefullyClient:
         Returns:
             List of recently published drafts
         """
-        params = {}
-        if content_filter:
-            if content_filter not in ["threads", "tweets"]:
-                raise ValidationError("content_filter must be 'threads' or 'tweets'")
-            params["content_filter"] = content_filter
-        
-        logger.info("Fetching recently published drafts")
-        result = self._make_request("GET", "/drafts/recently-published/", 
-                                  params=params, account_id=account_id)
-        return result if isinstance(result, list) else result.get("drafts", [])
+        return run_sync(self.async_client.get_recently_published_drafts(content_filter, account_id))
     
     # ========================
     # NOTIFICATIONS
@@ -308,14 +590,7 @@ class TypefullyClient:
         Returns:
             Notifications data with accounts and notifications
         """
-        params = {}
-        if kind:
-            if kind not in ["inbox", "activity"]:
-                raise ValidationError("kind must be 'inbox' or 'activity'")
-            params["kind"] = kind
-        
-        logger.info(f"Fetching notifications" + (f" (kind: {kind})" if kind else ""))
-        return self._make_request("GET", "/notifications/", params=params, account_id=account_id)
+        return run_sync(self.async_client.get_notifications(kind, account_id))
     
     def mark_notifications_read(self, kind: Optional[str] = None, username: Optional[str] = None,
                               account_id: Optional[str] = None) -> Dict[str, Any]:
@@ -330,21 +605,8 @@ class TypefullyClient:
         Returns:
             Result of mark read operation
         """
-        data = {}
-        if kind:
-            if kind not in ["inbox", "activity"]:
-                raise ValidationError("kind must be 'inbox' or 'activity'")
-            data["kind"] = kind
-        
-        if username:
-            data["username"] = username
-        
-        logger.info(f"Marking notifications as read" + 
-                   (f" (kind: {kind})" if kind else "") + 
-                   (f" (username: {username})" if username else ""))
-        
-        return self._make_request("POST", "/notifications/mark-all-read/", 
-                                data=data, account_id=account_id)
+        return run_sync(self.async_client.mark_notifications_read(kind, username, account_id))
+    
     
     # ========================
     # UTILITY METHODS
@@ -426,6 +688,7 @@ class TypefullyClient:
         logger.debug(f"Split content into {len(tweets)} tweets")
         return tweets
     
+    
     def get_client_info(self) -> Dict[str, Any]:
         """
         Get client information and status
@@ -433,13 +696,7 @@ class TypefullyClient:
         Returns:
             Client information dictionary
         """
-        return {
-            "auth_account": self.account_id or "default",
-            "base_url": self.auth.BASE_URL,
-            "last_request_time": self._last_request_time,
-            "min_request_interval": self._min_request_interval,
-            "available_accounts": [acc["account_id"] for acc in self.auth.list_accounts()]
-        }
+        return self.async_client.get_client_info()
     
     def health_check(self) -> Dict[str, Any]:
         """
@@ -448,31 +705,8 @@ class TypefullyClient:
         Returns:
             Health status information
         """
-        logger.info("Performing Typefully client health check")
-        
-        # Get auth health check
-        auth_health = self.auth.health_check()
-        
-        # Test basic connectivity
-        api_connectivity = False
-        try:
-            # Use a lightweight endpoint to test connectivity
-            self.get_notifications()
-            api_connectivity = True
-        except Exception as e:
-            logger.warning(f"API connectivity test failed: {e}")
-        
-        return {
-            "client_status": "healthy" if api_connectivity else "degraded",
-            "api_connectivity": api_connectivity,
-            "auth_health": auth_health,
-            "current_account": self.account_id,
-            "session_active": bool(self.session),
-            "last_check": datetime.now(timezone.utc).isoformat()
-        }
+        return run_sync(self.async_client.health_check())
     
     def close(self) -> None:
-        """Close the client session"""
-        if self.session:
-            self.session.close()
-            logger.info("Typefully client session closed") 
\ No newline at end of file
+        """Close the client's idle connections"""
+        run_sync(self.async_client.aclose())
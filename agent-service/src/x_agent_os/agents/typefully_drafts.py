@@ -6,13 +6,21 @@ and media attachments for Typefully integration.
 """
 
 import re
+import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Union, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-from .typefully_client import TypefullyClient, ValidationError
+from x_agent_os.database import DatabaseHandler
+from .typefully_auth import TypefullyAuthError
+from .typefully_client import (
+    AsyncTypefullyClient, AuthenticationError, ConnectionFailedError, RateLimitError, TypefullyAPIError,
+    TypefullyClient, ValidationError, run_sync
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +43,23 @@ class TweetMetrics:
     estimated_display_chars: int
 
 
+@dataclass
+class DraftBatchItem:
+    """Outcome of one post in a batch publish"""
+    index: int
+    status: str  # created, skipped (already has a draft), pending (outcome unknown), failed
+    content: str
+    post_id: Optional[int] = None
+    draft_id: Optional[str] = None
+    draft: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    latency_ms: int = 0
+
+    @property
+    def success(self) -> bool:
+        return self.status in ("created", "skipped")
+
+
 @dataclass
 class ThreadPreview:
     """Preview of a thread before creation"""
@@ -70,14 +95,16 @@ class TypefullyDraftManager:
         ' ': 0.3
     }
     
-    def __init__(self, client: TypefullyClient):
+    def __init__(self, client: TypefullyClient, db: Optional[DatabaseHandler] = None):
         """
         Initialize draft manager
         
         Args:
             client: TypefullyClient instance
+            db: Database for posts.typefully_claim idempotency (created on first use if None)
         """
         self.client = client
+        self._db = db
         logger.info("Typefully draft manager initialized")
     
     # ========================
@@ -340,6 +367,14 @@ class TypefullyDraftManager:
         Returns:
             Created draft information
         """
+        return self.client.create_draft(**self._single_draft_request(
+            content, schedule_date, auto_retweet, auto_plug, share, account_id
+        ))
+    
+    def _single_draft_request(self, content: str, schedule_date: Optional[Union[str, datetime]] = None,
+                              auto_retweet: bool = False, auto_plug: bool = False,
+                              share: bool = False, account_id: Optional[str] = None) -> Dict[str, Any]:
+        """Validate and format a single tweet; returns create_draft keyword arguments"""
         # Validate content length
         metrics = self.analyze_content(content)
         if metrics.character_count > self.MAX_TWEET_LENGTH:
@@ -352,7 +387,7 @@ class TypefullyDraftManager:
         
         logger.info(f"Creating single draft: {metrics.character_count} characters")
         
-        return self.client.create_draft(
+        return dict(
             content=formatted_content,
             threadify=False,
             share=share,
@@ -381,6 +416,15 @@ class TypefullyDraftManager:
         Returns:
             Created thread information
         """
+        return self.client.create_draft(**self._thread_request(
+            content, manual_split, schedule_date, auto_retweet, auto_plug, share, account_id
+        ))
+    
+    def _thread_request(self, content: str, manual_split: bool = False,
+                        schedule_date: Optional[Union[str, datetime]] = None,
+                        auto_retweet: bool = False, auto_plug: bool = False,
+                        share: bool = False, account_id: Optional[str] = None) -> Dict[str, Any]:
+        """Split, validate and format a thread; returns create_draft keyword arguments"""
         if manual_split:
             # Split by 4 consecutive newlines (Typefully format)
             tweets = [tweet.strip() for tweet in re.split(r'\\n{4,}', content) if tweet.strip()]
@@ -404,7 +448,7 @@ class TypefullyDraftManager:
         
         logger.info(f"Creating thread with {len(tweets)} tweets")
         
-        return self.client.create_draft(
+        return dict(
             content=thread_content,
             threadify=False,  # We've already formatted it
             share=share,
@@ -417,58 +461,203 @@ class TypefullyDraftManager:
     def create_from_generated_content(self, posts: List[str], 
                                     content_type: ContentType = ContentType.SINGLE_TWEET,
                                     schedule_interval_minutes: int = 60,
-                                    **kwargs) -> List[Dict[str, Any]]:
+                                    post_ids: Optional[List[Optional[int]]] = None,
+                                    max_concurrency: Optional[int] = None,
+                                    resubmit_pending: bool = False,
+                                    **kwargs) -> List[DraftBatchItem]:
+        """
+        Create multiple drafts from generated content (blocking wrapper around
+        acreate_from_generated_content)
         """
-        Create multiple drafts from generated content
+        return run_sync(self.acreate_from_generated_content(
+            posts, content_type, schedule_interval_minutes, post_ids=post_ids,
+            max_concurrency=max_concurrency, resubmit_pending=resubmit_pending, **kwargs
+        ))
+    
+    async def acreate_from_generated_content(self, posts: List[str],
+                                             content_type: ContentType = ContentType.SINGLE_TWEET,
+                                             schedule_interval_minutes: int = 60,
+                                             post_ids: Optional[List[Optional[int]]] = None,
+                                             max_concurrency: Optional[int] = None,
+                                             resubmit_pending: bool = False,
+                                             **kwargs) -> List[DraftBatchItem]:
+        """
+        Create multiple drafts from generated content concurrently
+        
+        Drafts are created up to max_concurrency at a time (default: the client's
+        pool size); the client's shared token buckets keep the batch within the rate
+        budget. When post_ids are given, posts already holding a typefully_draft_id
+        are skipped, and each post is claimed (posts.typefully_claim) once it holds
+        a concurrency slot, right before its create is sent. A create whose outcome
+        is unknown (5xx, dropped connection, a response without a draft id) keeps
+        its claim and is reported as "pending"; a later run adopts the draft
+        if it shows up in recently scheduled drafts and otherwise leaves it alone
+        unless resubmit_pending=True. Creates that certainly never took effect
+        release their claim.
         
         Args:
             posts: List of post content
             content_type: Type of content to create
             schedule_interval_minutes: Minutes between scheduled posts
+            post_ids: posts.id for each entry (None entries are not tracked)
+            max_concurrency: Max creates in flight
+            resubmit_pending: Resubmit posts whose earlier create has an unknown outcome
             **kwargs: Additional options for draft creation
             
         Returns:
-            List of created draft information
+            One DraftBatchItem per post, in input order
         """
-        results = []
-        base_time = datetime.now(timezone.utc)
-        
-        for i, post_content in enumerate(posts):
+        if post_ids is not None and len(post_ids) != len(posts):
+            raise ValidationError("post_ids must have one entry per post")
+        
+        client = self._async_client()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or client.pool.maxsize))
+        base_time = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        scheduled_drafts: Dict[str, Any] = {}
+        
+        async def publish(index: int, post_content: str) -> DraftBatchItem:
+            post_id = post_ids[index] if post_ids else None
+            item = DraftBatchItem(index=index, status="failed", content=post_content, post_id=post_id)
+            started = time.perf_counter()
+            marker = None
             try:
                 # Calculate schedule time
-                schedule_time = base_time.replace(minute=0, second=0, microsecond=0)
-                schedule_time = schedule_time.replace(hour=schedule_time.hour + (i * schedule_interval_minutes // 60))
-                schedule_time = schedule_time.replace(minute=(i * schedule_interval_minutes) % 60)
+                schedule_time = base_time + timedelta(minutes=index * schedule_interval_minutes)
+                request = self._batch_request(post_content, content_type, schedule_time.isoformat(), **kwargs)
                 
-                if content_type == ContentType.SINGLE_TWEET:
-                    result = self.create_single_draft(
-                        content=post_content,
-                        schedule_date=schedule_time.isoformat(),
-                        **kwargs
-                    )
-                elif content_type == ContentType.THREAD:
-                    result = self.create_thread(
-                        content=post_content,
-                        schedule_date=schedule_time.isoformat(),
-                        **kwargs
-                    )
-                else:
-                    # For long form, create as thread with auto-split
-                    result = self.create_thread(
-                        content=post_content,
-                        manual_split=False,
-                        schedule_date=schedule_time.isoformat(),
-                        **kwargs
-                    )
+                async with semaphore:
+                    # Claim only once a slot is free, so a crash leaves at most
+                    # max_concurrency posts pending rather than the whole batch
+                    if post_id is not None:
+                        marker = uuid.uuid4().hex
+                        existing = await asyncio.to_thread(self.db.claim_post_typefully_draft, post_id, marker)
+                        if existing is not None:
+                            marker = await self._resolve_existing(
+                                item, existing, request["content"], resubmit_pending, scheduled_drafts
+                            )
+                            if marker is None:
+                                return item
+                    result = await client.create_draft(**request)
                 
-                results.append(result)
-                logger.info(f"Created draft {i+1}/{len(posts)}")
+                item.draft = result
+                if result.get("id") is None:
+                    # Accepted but unidentifiable: keep the claim so a later run reconciles it
+                    item.status = "pending" if marker else "failed"
+                    item.error = "Typefully returned no draft id"
+                    logger.error(f"Draft {index + 1} created without an id")
+                    return item
                 
+                item.status, item.draft_id = "created", str(result["id"])
+                if post_id is not None:
+                    await asyncio.to_thread(self.db.update_post_typefully_id, post_id, item.draft_id)
+                logger.info(f"Created draft {index + 1}/{len(posts)}")
+            
             except Exception as e:
-                logger.error(f"Failed to create draft {i+1}: {e}")
-                results.append({"error": str(e), "content": post_content})
-        
-        return results
+                item.error = str(e)
+                if marker and self._definitely_not_created(e):
+                    await asyncio.to_thread(self.db.release_post_typefully_claim, post_id, marker)
+                elif marker:
+                    item.status = "pending"
+                logger.error(f"Failed to create draft {index + 1}: {e}")
+            
+            finally:
+                item.latency_ms = int((time.perf_counter() - started) * 1000)
+            return item
+        
+        items = await asyncio.gather(*(publish(i, post) for i, post in enumerate(posts)))
+        created = sum(1 for item in items if item.status == "created")
+        logger.info(f"Batch publish: {created} created, "
+                    f"{sum(1 for item in items if item.status == 'skipped')} skipped, "
+                    f"{sum(1 for item in items if item.status == 'pending')} pending, "
+                    f"{sum(1 for item in items if item.status == 'failed')} failed")
+        return list(items)
+    
+    @property
+    def db(self) -> DatabaseHandler:
+        if self._db is None:
+            self._db = DatabaseHandler()
+        return self._db
+    
+    def _async_client(self) -> AsyncTypefullyClient:
+        if isinstance(self.client, AsyncTypefullyClient):
+            return self.client
+        return self.client.async_client
+    
+    def _batch_request(self, post_content: str, content_type: ContentType, schedule_date: str,
+                       **kwargs) -> Dict[str, Any]:
+        if content_type == ContentType.SINGLE_TWEET:
+            return self._single_draft_request(content=post_content, schedule_date=schedule_date, **kwargs)
+        if content_type == ContentType.THREAD:
+            return self._thread_request(content=post_content, schedule_date=schedule_date, **kwargs)
+        # For long form, create as thread with auto-split
+        return self._thread_request(content=post_content, manual_split=False, schedule_date=schedule_date, **kwargs)
+    
+    async def _resolve_existing(self, item: DraftBatchItem, existing: Dict[str, Optional[str]], content: str,
+                                resubmit_pending: bool, scheduled_drafts: Dict[str, Any]) -> Optional[str]:
+        """
+        Handle a post that already has a draft id or a claim. Returns a new claim
+        marker when the post should be (re)submitted, None when item is settled.
+        """
+        if existing["typefully_draft_id"]:
+            item.status, item.draft_id = "skipped", existing["typefully_draft_id"]
+            return None
+        
+        # An earlier create's outcome is unknown: look for its draft before resubmitting
+        if "drafts" not in scheduled_drafts:
+            scheduled_drafts["drafts"] = asyncio.ensure_future(
+                self._async_client().get_recently_scheduled_drafts()
+            )
+        try:
+            drafts = await scheduled_drafts["drafts"]
+        except TypefullyAPIError as e:
+            logger.warning(f"Could not list scheduled drafts to reconcile post {item.post_id}: {e}")
+            drafts = []
+        match = next((draft for draft in drafts if self._draft_matches(draft, content)), None)
+        if match is not None and match.get("id") is not None:
+            item.status, item.draft_id, item.draft = "skipped", str(match["id"]), match
+            await asyncio.to_thread(self.db.update_post_typefully_id, item.post_id, item.draft_id)
+            return None
+        
+        if not resubmit_pending:
+            item.status = "pending"
+            item.error = "An earlier create has an unknown outcome; pass resubmit_pending=True to send it again"
+            return None
+        marker = uuid.uuid4().hex
+        current = await asyncio.to_thread(
+            self.db.claim_post_typefully_draft, item.post_id, marker, existing["typefully_claim"]
+        )
+        if current is not None:
+            # Another run finished or took over this post meanwhile
+            if current["typefully_draft_id"]:
+                item.status, item.draft_id = "skipped", current["typefully_draft_id"]
+            else:
+                item.status, item.error = "pending", "Claimed by another run"
+            return None
+        return marker
+    
+    @staticmethod
+    def _draft_matches(draft: Dict[str, Any], content: str) -> bool:
+        first_tweet = content.split("\n\n\n\n", 1)[0].strip()
+        for key in ("text", "content", "text_first_tweet"):
+            value = draft.get(key)
+            if isinstance(value, str) and value.strip() and (
+                value.strip() == content.strip() or value.strip() == first_tweet
+            ):
+                return True
+        return False
+    
+    @staticmethod
+    def _definitely_not_created(error: Exception) -> bool:
+        """
+        True when the create never took effect, so the claim can be released: rejected
+        locally or by the API (4xx), or never sent (no credentials, host unreachable).
+        """
+        if isinstance(error, (ValidationError, RateLimitError, AuthenticationError, ConnectionFailedError,
+                              TypefullyAuthError)):
+            return True
+        if isinstance(error, TypefullyAPIError) and error.status_code is not None:
+            return 400 <= error.status_code < 500
+        return False
     
     # ========================
     # UTILITY METHODS
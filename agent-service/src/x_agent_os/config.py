@@ -9,6 +9,36 @@ load_dotenv()
 PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 RAPIDAPI_API_KEY = os.getenv("RAPIDAPI_API_KEY")
+# Keep-alive connections (and so concurrent requests) to RapidAPI per process
+RAPIDAPI_POOL_SIZE = int(os.getenv("X_AGENT_OS_RAPIDAPI_POOL_SIZE", "4"))
+# Per-request timeouts, so a fetch the orchestrator gave up on still ends and frees its provider slot
+PERPLEXITY_TIMEOUT_SECONDS = float(os.getenv("X_AGENT_OS_PERPLEXITY_TIMEOUT_SECONDS", "40"))
+RAPIDAPI_TIMEOUT_SECONDS = float(os.getenv("X_AGENT_OS_RAPIDAPI_TIMEOUT_SECONDS", "20"))
+
+# Optional Bloom filter in front of content fingerprint lookups
+FINGERPRINT_BLOOM_ENABLED = os.getenv("X_AGENT_OS_FINGERPRINT_BLOOM", "false").lower() == "true"
+FINGERPRINT_BLOOM_CAPACITY = int(os.getenv("X_AGENT_OS_FINGERPRINT_BLOOM_CAPACITY", "1000000"))
+FINGERPRINT_BLOOM_ERROR_RATE = float(os.getenv("X_AGENT_OS_FINGERPRINT_BLOOM_ERROR_RATE", "0.001"))
+FINGERPRINT_BLOOM_PATH = os.getenv("X_AGENT_OS_FINGERPRINT_BLOOM_PATH")
+
+# Draft all of a skill's editor posts in one Gemini request instead of one per topic
+EDITOR_BATCH_MODE = os.getenv("X_AGENT_OS_EDITOR_BATCH", "false").lower() == "true"
+
+# Content-addressed cache of Gemini responses (reviewer, editor, reply)
+LLM_CACHE_ENABLED = os.getenv("X_AGENT_OS_LLM_CACHE", "false").lower() == "true"
+LLM_CACHE_TTL_SECONDS = float(os.getenv("X_AGENT_OS_LLM_CACHE_TTL_SECONDS", "86400"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("X_AGENT_OS_LLM_CACHE_MAX_ENTRIES", "5000"))
+
+# Query-keyed cache of raw Perplexity/RapidAPI responses
+PROVIDER_CACHE_ENABLED = os.getenv("X_AGENT_OS_PROVIDER_CACHE", "false").lower() == "true"
+PROVIDER_CACHE_TTL_SECONDS = float(os.getenv("X_AGENT_OS_PROVIDER_CACHE_TTL_SECONDS", "21600"))
+PROVIDER_CACHE_STALE_SECONDS = float(os.getenv("X_AGENT_OS_PROVIDER_CACHE_STALE_SECONDS", "64800"))
+PROVIDER_CACHE_BUCKET_SECONDS = int(os.getenv("X_AGENT_OS_PROVIDER_CACHE_BUCKET_SECONDS", "86400"))
+
+# Long-lived reply worker the dashboard calls instead of spawning run_generate_reply.py per click
+REPLY_WORKER_HOST = os.getenv("X_AGENT_OS_REPLY_WORKER_HOST", "127.0.0.1")
+REPLY_WORKER_PORT = int(os.getenv("X_AGENT_OS_REPLY_WORKER_PORT", "8765"))
+REPLY_WORKER_CONCURRENCY = int(os.getenv("X_AGENT_OS_REPLY_WORKER_CONCURRENCY", "4"))
 
 # Typefully API Configuration
 TYPEFULLY_API_KEY_TUON = os.getenv("TYPEFULLY_API_KEY_TUON")
@@ -41,6 +71,7 @@ class TypefullyConfig:
         # Rate Limiting
         self.rate_limit_per_minute = int(os.getenv("TYPEFULLY_RATE_LIMIT", "60"))
         self.rate_limit_per_hour = int(os.getenv("TYPEFULLY_RATE_LIMIT_HOUR", "300"))
+        self.max_concurrency = int(os.getenv("TYPEFULLY_MAX_CONCURRENCY", "4"))
         
         # Logging and Monitoring
         self.enable_detailed_logging = os.getenv("TYPEFULLY_DETAILED_LOGS", "false").lower() == "true"
@@ -88,7 +119,9 @@ class TypefullyConfig:
             "auto_retweet": self.auto_retweet_enabled,
             "auto_plug": self.auto_plug_enabled,
             "default_threadify": self.default_threadify,
-            "rate_limit_per_minute": self.rate_limit_per_minute
+            "rate_limit_per_minute": self.rate_limit_per_minute,
+            "rate_limit_per_hour": self.rate_limit_per_hour,
+            "max_concurrency": self.max_concurrency
         }
         
         return status
@@ -1,9 +1,60 @@
 import hashlib
 import json
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+# SimHash width and LSH banding. With 4 bands of 16 bits, any two signatures
+# within Hamming distance 3 are guaranteed to share at least one band.
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+
+# Max Hamming distance at which two items count as near-duplicates, per
+# content_type. Set a type to None to disable near-duplicate checks for it.
+# Distances above SIMHASH_BANDS - 1 are best-effort: such pairs are only found
+# when they happen to share a band.
+NEAR_DUPLICATE_MAX_DISTANCE: Dict[str, Optional[int]] = {
+    "search_result": 3,
+    "tweet": 5,
+}
+
+# Texts shorter than this are too unstable for SimHash and only get exact dedup.
+NEAR_DUPLICATE_MIN_TOKENS = 6
+
+_RETWEET_PREFIX = re.compile(r"^\s*rt\s+@\w+:?\s*")
+_URL = re.compile(r"https?://\S+")
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def _normalize_tokens(text: str) -> List[str]:
+    lowered = _RETWEET_PREFIX.sub("", (text or "").lower())
+    return _TOKEN.findall(_URL.sub(" ", lowered))
+
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash over word unigrams and bigrams, or None for short texts."""
+    tokens = _normalize_tokens(text)
+    if len(tokens) < NEAR_DUPLICATE_MIN_TOKENS:
+        return None
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def simhash_bands(value: int) -> List[Tuple[int, int]]:
+    width = SIMHASH_BITS // SIMHASH_BANDS
+    mask = (1 << width) - 1
+    return [(band, value >> (band * width) & mask) for band in range(SIMHASH_BANDS)]
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
 class ContentFingerprinter:
     """Utility class for creating content fingerprints for deduplication."""
     
@@ -92,77 +143,147 @@ class ContentFingerprinter:
 class IncrementalProcessingManager:
     """Manages incremental processing workflow."""
     
-    def __init__(self, db_handler):
+    def __init__(self, db_handler, near_duplicate_thresholds: Optional[Dict[str, Optional[int]]] = None):
         self.db = db_handler
         self.fingerprinter = ContentFingerprinter()
+        self.near_duplicate_thresholds = {**NEAR_DUPLICATE_MAX_DISTANCE, **(near_duplicate_thresholds or {})}
     
-    def process_search_results_incrementally(self, search_results: list, raw_response: str = "") -> Dict[str, Any]:
-        """Process search results and return only new ones."""
+    def _drop_near_duplicates(self, candidates: list) -> set:
+        """Return indexes of candidates within the SimHash threshold of stored or earlier items."""
+        signatures: Dict[int, int] = {}
+        bands_by_type: Dict[str, list] = {}
+        for index, (_, fingerprint) in enumerate(candidates):
+            if not fingerprint:
+                continue
+            content_type = fingerprint["content_type"]
+            if self.near_duplicate_thresholds.get(content_type) is None:
+                continue
+            signature = simhash((fingerprint.get("platform_metadata") or {}).get("snippet", ""))
+            if signature is None:
+                continue
+            signatures[index] = signature
+            fingerprint["simhash"] = signature
+            bands_by_type.setdefault(content_type, []).extend(simhash_bands(signature))
+
+        stored = {
+            content_type: self.db.find_simhash_candidates(content_type, bands)
+            for content_type, bands in bands_by_type.items()
+        }
+
+        near_duplicates = set()
+        accepted: Dict[str, List[int]] = {}
+        for index, signature in signatures.items():
+            fingerprint = candidates[index][1]
+            content_type = fingerprint["content_type"]
+            threshold = self.near_duplicate_thresholds[content_type]
+            pool = list(stored[content_type].values()) + accepted.get(content_type, [])
+            if any(hamming_distance(signature, other) <= threshold for other in pool):
+                near_duplicates.add(index)
+            else:
+                accepted.setdefault(content_type, []).append(signature)
+        return near_duplicates
+
+    def _dedup_batch(self, results: list, fingerprints: list, describe, record: bool = True) -> Dict[str, Any]:
+        """
+        One lookup + one insert for the whole batch; later repeats within the batch are duplicates.
+        record=False only filters: the new items' fingerprints are returned as
+        new_fingerprints for record_fingerprints() once the caller decides to keep them.
+        """
+        existing = self.db.find_content_fingerprints(
+            (fp["content_type"], fp["primary_identifier"]) for fp in fingerprints
+        )
+
+        candidates = []
+        seen = set(existing)
+        for result, fingerprint in zip(results, fingerprints):
+            key = (fingerprint["content_type"], fingerprint["primary_identifier"])
+            if key in seen:
+                candidates.append((result, None))
+                continue
+            seen.add(key)
+            candidates.append((result, fingerprint))
+
+        near_duplicates = self._drop_near_duplicates(candidates)
+        for index in near_duplicates:
+            candidates[index] = (candidates[index][0], None)
+
+        fresh = [fp for _, fp in candidates if fp]
+        if record:
+            inserted = self.record_fingerprints(fresh)
+        else:
+            inserted = {(fp["content_type"], fp["primary_identifier"]): None for fp in fresh}
+
         new_results = []
         duplicate_count = 0
         new_fingerprints = []
-        
-        for result in search_results:
-            # Create fingerprint
-            fingerprint = self.fingerprinter.create_search_result_fingerprint(result, raw_response)
-            
-            # Check if we've seen this content before
-            existing = self.db.check_content_fingerprint(
-                fingerprint["content_type"], 
-                fingerprint["primary_identifier"]
-            )
-            
-            if not existing:
-                # Save new fingerprint
-                fingerprint_id = self.db.save_content_fingerprint(**fingerprint)
+        new_fingerprint_ids = []
+        for index, (result, fingerprint) in enumerate(candidates):
+            key = (fingerprint["content_type"], fingerprint["primary_identifier"]) if fingerprint else None
+            if key in inserted:
                 new_results.append(result)
-                new_fingerprints.append(fingerprint_id)
-                print(f"✅ NEW search result: {result.get('url', 'N/A')[:60]}...")
+                new_fingerprints.append(fingerprint)
+                if record:
+                    new_fingerprint_ids.append(inserted[key])
+                print(f"✅ NEW {describe(result)}")
             else:
                 duplicate_count += 1
-                print(f"⏭️  DUPLICATE search result: {result.get('url', 'N/A')[:60]}...")
-        
+                label = "NEAR-DUPLICATE" if index in near_duplicates else "DUPLICATE"
+                print(f"⏭️  {label} {describe(result)}")
+
         return {
             "new_results": new_results,
             "duplicate_count": duplicate_count,
-            "new_fingerprint_ids": new_fingerprints,
-            "total_processed": len(search_results)
+            "new_fingerprints": new_fingerprints,
+            "new_fingerprint_ids": new_fingerprint_ids,
+            "total_processed": len(results)
         }
+
+    def record_fingerprints(self, fingerprints: list) -> Dict[Tuple[str, str], int]:
+        """
+        Store fingerprints (and their SimHash bands) as seen. Returns {(content_type,
+        primary_identifier): id} for the ones actually inserted; a key another run
+        stored first is missing from the result and should be treated as a duplicate.
+        """
+        inserted = self.db.save_content_fingerprints(fingerprints)
+        self.db.save_content_simhashes(
+            [
+                (inserted[key], fp["content_type"], fp["simhash"], simhash_bands(fp["simhash"]))
+                for fp in fingerprints
+                if "simhash" in fp
+                and (key := (fp["content_type"], fp["primary_identifier"])) in inserted
+            ]
+        )
+        return inserted
+
+    def process_search_results_incrementally(self, search_results: list, raw_response: str = "",
+                                             record: bool = True) -> Dict[str, Any]:
+        """Process search results and return only new ones."""
+        fingerprints = [
+            self.fingerprinter.create_search_result_fingerprint(result, raw_response)
+            for result in search_results
+        ]
+        return self._dedup_batch(
+            search_results,
+            fingerprints,
+            lambda result: f"search result: {result.get('url', 'N/A')[:60]}...",
+            record=record,
+        )
     
-    def process_twitter_results_incrementally(self, twitter_results: list, raw_response: str = "") -> Dict[str, Any]:
+    def process_twitter_results_incrementally(self, twitter_results: list, raw_response: str = "",
+                                              record: bool = True) -> Dict[str, Any]:
         """Process Twitter results and return only new ones."""
-        new_results = []
-        duplicate_count = 0
-        new_fingerprints = []
-        
-        for result in twitter_results:
-            # Create fingerprint
-            fingerprint = self.fingerprinter.create_twitter_fingerprint(result, raw_response)
-            
-            # Check if we've seen this tweet before
-            existing = self.db.check_content_fingerprint(
-                fingerprint["content_type"], 
-                fingerprint["primary_identifier"]
-            )
-            
-            if not existing:
-                # Save new fingerprint
-                fingerprint_id = self.db.save_content_fingerprint(**fingerprint)
-                new_results.append(result)
-                new_fingerprints.append(fingerprint_id)
-                print(f"✅ NEW tweet: @{result.get('screen_name', 'unknown')} - {result.get('snippet', '')[:40]}...")
-            else:
-                duplicate_count += 1
-                print(f"⏭️  DUPLICATE tweet: @{result.get('screen_name', 'unknown')} - {result.get('snippet', '')[:40]}...")
-        
-        return {
-            "new_results": new_results,
-            "duplicate_count": duplicate_count,
-            "new_fingerprint_ids": new_fingerprints,
-            "total_processed": len(twitter_results)
-        }
+        fingerprints = [
+            self.fingerprinter.create_twitter_fingerprint(result, raw_response)
+            for result in twitter_results
+        ]
+        return self._dedup_batch(
+            twitter_results,
+            fingerprints,
+            lambda result: f"tweet: @{result.get('screen_name', 'unknown')} - {result.get('snippet', '')[:40]}...",
+            record=record,
+        )
     
     def mark_content_as_processed(self, fingerprint_ids: list):
         """Mark content as processed after successful content generation."""
-        for fingerprint_id in fingerprint_ids:
-            self.db.update_fingerprint_status(fingerprint_id, "processed") 
\ No newline at end of file
+        if fingerprint_ids:
+            self.db.update_fingerprint_statuses(fingerprint_ids, "processed") 
\ No newline at end of file
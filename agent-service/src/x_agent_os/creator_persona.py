@@ -75,6 +75,7 @@ class PersonaRunResult:
     output_md_path: str
     summary: Dict[str, Any]
     cached: bool = False
+    summary_reused: bool = False
 
 
 class CreatorPersonaInspo:
@@ -109,11 +110,18 @@ class CreatorPersonaInspo:
         limit: int = 50,
         top_n: int = 7,
         force: bool = False,
+        incremental: bool = False,
     ) -> PersonaRunResult:
+        """
+        Capture a creator's recent posts and summarize them. incremental=True refreshes
+        an existing capture: only tweets newer than the persona's newest_tweet_id are
+        fetched (plus the overlap page, whose counts are upserted), and the summary is
+        only regenerated when the top_n set changes. force=True rebuilds from scratch.
+        """
         handle = handle.lstrip("@")
         persona_id = self.db.upsert_creator_persona(handle=handle)
         latest_run = self.db.get_latest_creator_persona_run(handle)
-        if latest_run and self._is_recent_run(latest_run, window_days) and not force:
+        if latest_run and self._is_recent_run(latest_run, window_days) and not (force or incremental):
             return PersonaRunResult(
                 handle=handle,
                 output_json_path=latest_run.get("output_json_path", ""),
@@ -124,20 +132,70 @@ class CreatorPersonaInspo:
 
         if force:
             self.db.clear_creator_persona_data(persona_id)
+            incremental = False
+
+        since_id = None
+        if incremental:
+            since_id = (self.db.get_creator_persona(handle) or {}).get("newest_tweet_id")
 
         now = datetime.now(timezone.utc)
-        tweets = self.twitter.search_user_tweets(handle, count=limit, search_type="Latest")
-        recent = [tweet for tweet in tweets if _within_days(tweet.get("created_at"), window_days, now)]
+        if since_id:
+            tweets = list(
+                self.twitter.iter_search_tweets(
+                    f"from:{handle}",
+                    search_type="Latest",
+                    max_items=limit,
+                    since=now - timedelta(days=window_days),
+                    since_id=since_id,
+                )
+            )
+        else:
+            tweets = self.twitter.search_user_tweets(handle, count=limit, search_type="Latest")
+        fetched = [tweet for tweet in tweets if _within_days(tweet.get("created_at"), window_days, now)]
 
-        for tweet in recent:
+        for tweet in fetched:
             tweet["tweet_id"] = _extract_tweet_id(tweet.get("url"))
             tweet["engagement_score"] = _engagement_score(tweet)
 
+        db_posts = [
+            {
+                "tweet_id": tweet.get("tweet_id"),
+                "tweet_url": tweet.get("url"),
+                "content": tweet.get("snippet"),
+                "created_at": tweet.get("created_at"),
+                "likes": tweet.get("favorite_count"),
+                "replies": tweet.get("reply_count"),
+                "retweets": tweet.get("retweet_count"),
+                "quotes": tweet.get("quote_count"),
+                "impressions": None,
+                "bookmarks": None,
+                "engagement_score": tweet.get("engagement_score"),
+                "raw_json": json.dumps(tweet),
+            }
+            for tweet in fetched
+        ]
+        if db_posts:
+            self.db.upsert_creator_persona_posts(persona_id, db_posts)
+
+        # An incremental run ranks everything stored for the window, not just this fetch
+        recent = self._stored_posts(persona_id, window_days, now) if since_id else fetched
+
         ranked = sorted(recent, key=lambda x: x.get("engagement_score", 0), reverse=True)
         top_posts = ranked[:top_n]
+        top_tweet_ids = [post.get("tweet_id") for post in top_posts]
 
         timing = _timing_stats(recent)
-        summary = self._summarize(handle, recent, top_posts, timing)
+        previous_top = (latest_run or {}).get("top_tweet_ids")
+        summary_reused = bool(
+            incremental
+            and previous_top is not None
+            and set(previous_top) == set(top_tweet_ids)
+            and latest_run.get("summary_json")
+        )
+        if summary_reused:
+            summary = latest_run["summary_json"]
+        else:
+            summary = self._summarize(handle, recent, top_posts, timing)
 
         output_dir = self._output_dir(handle)
         run_stamp = now.strftime("%Y%m%d_%H%M%S")
@@ -158,26 +216,6 @@ class CreatorPersonaInspo:
         json_path.write_text(json.dumps(json_payload, indent=2), encoding="utf-8")
         md_path.write_text(self._summary_markdown(handle, top_posts, summary, timing), encoding="utf-8")
 
-        db_posts = [
-            {
-                "tweet_id": tweet.get("tweet_id"),
-                "tweet_url": tweet.get("url"),
-                "content": tweet.get("snippet"),
-                "created_at": tweet.get("created_at"),
-                "likes": tweet.get("favorite_count"),
-                "replies": tweet.get("reply_count"),
-                "retweets": tweet.get("retweet_count"),
-                "quotes": tweet.get("quote_count"),
-                "impressions": None,
-                "bookmarks": None,
-                "engagement_score": tweet.get("engagement_score"),
-                "raw_json": json.dumps(tweet),
-            }
-            for tweet in recent
-        ]
-        if db_posts:
-            self.db.insert_creator_persona_posts(persona_id, db_posts)
-
         self.db.save_creator_persona_run(
             persona_id=persona_id,
             window_days=window_days,
@@ -185,6 +223,7 @@ class CreatorPersonaInspo:
             output_json_path=str(json_path),
             output_md_path=str(md_path),
             summary_json=summary,
+            top_tweet_ids=top_tweet_ids,
         )
 
         return PersonaRunResult(
@@ -193,8 +232,20 @@ class CreatorPersonaInspo:
             output_md_path=str(md_path),
             summary=summary,
             cached=False,
+            summary_reused=summary_reused,
         )
 
+    def _stored_posts(self, persona_id: int, window_days: int, now: datetime) -> List[Dict[str, Any]]:
+        posts = []
+        for row in self.db.list_creator_persona_posts(persona_id, limit=-1):  # -1: no limit
+            if not row.get("raw_json") or not _within_days(row.get("created_at"), window_days, now):
+                continue
+            post = json.loads(row["raw_json"])
+            post["tweet_id"] = row.get("tweet_id")
+            post["engagement_score"] = row.get("engagement_score") or 0
+            posts.append(post)
+        return posts
+
     def _summarize(
         self,
         handle: str,
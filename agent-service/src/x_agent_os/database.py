@@ -1,10 +1,18 @@
 import json
+import logging
 import os
 import sqlite3
+import threading
+import time
+import weakref
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from x_agent_os.fingerprint_filter import FingerprintBloomFilter
+
+logger = logging.getLogger(__name__)
 
 
 def _default_db_path() -> str:
@@ -17,302 +25,896 @@ def _default_db_path() -> str:
     return str(data_dir / "x_agent_os.db")
 
 
-class DatabaseHandler:
-    def __init__(self, db_path: Optional[str] = None):
-        self.db_path = db_path or _default_db_path()
-        self.init_database()
-        self.migrate_database()
-
-    @contextmanager
-    def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
-
-    def migrate_database(self):
-        """Apply targeted schema migrations for legacy tables."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(twitter_results)")
-            columns = [column[1] for column in cursor.fetchall()]
-            if "tweet_created_at" not in columns:
-                cursor.execute(
-                    """
-                    ALTER TABLE twitter_results
-                    ADD COLUMN tweet_created_at TEXT
-                    """
-                )
-            conn.commit()
-
-    def init_database(self):
-        """Initialize the database with legacy + X Agent OS tables."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # --- Legacy tables (keep intact) ---
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS sessions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_name TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    topic TEXT,
-                    app_name TEXT,
-                    app_description TEXT
-                )
-                """
+# Applied to every connection. WAL lets the dashboard keep reading while the
+# pipeline writes; the rest trades a little durability for fewer fsyncs and
+# keeps hot pages in memory. Override per handler via `pragmas=`.
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "mmap_size": 268435456,
+    "cache_size": -64000,
+    "temp_store": "MEMORY",
+}
+
+# Pragmas that change the database file rather than the connection.
+_WRITE_PRAGMAS = {"journal_mode"}
+
+
+# Rows per executemany() call in bulk inserts; keeps parameter lists bounded.
+BULK_INSERT_CHUNK_SIZE = 500
+
+
+def _chunked(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk: List[Any] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Conservative bound on bound parameters per statement (SQLite's pre-3.32 default).
+MAX_SQL_VARIABLES = 999
+
+
+def _bulk_insert(
+    cursor: sqlite3.Cursor, sql: str, rows: Iterable[Sequence[Any]], chunk_size: int
+) -> List[int]:
+    """executemany() in chunks and return the new row ids in input order.
+
+    The first INSERT takes the write lock and it is held until commit, so
+    the rowids of one chunk are contiguous and end at last_insert_rowid().
+    """
+    ids: List[int] = []
+    for chunk in _chunked(rows, max(1, chunk_size)):
+        cursor.executemany(sql, chunk)
+        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+    return ids
+
+
+class _ConnectionOwner:
+    """Kept only in a thread's threading.local; collected when that thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _release_connection(
+    connections: Dict[int, sqlite3.Connection], lock: threading.Lock, key: int, conn: sqlite3.Connection
+):
+    with lock:
+        if connections.get(key) is conn:
+            del connections[key]
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def _close_connections(connections: Dict[int, sqlite3.Connection], lock: threading.Lock):
+    with lock:
+        for conn in connections.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        connections.clear()
+
+
+def _migration_base_tables(cursor: sqlite3.Cursor):
+    """Legacy + X Agent OS tables."""
+    # --- Legacy tables (keep intact) ---
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_name TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            topic TEXT,
+            app_name TEXT,
+            app_description TEXT
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS search_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER,
+            url TEXT,
+            snippet TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            raw_response TEXT,
+            FOREIGN KEY (session_id) REFERENCES sessions (id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS twitter_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER,
+            url TEXT,
+            snippet TEXT,
+            screen_name TEXT,
+            followers_count INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            tweet_created_at TEXT,
+            favorite_count INTEGER DEFAULT 0,
+            quote_count INTEGER DEFAULT 0,
+            reply_count INTEGER DEFAULT 0,
+            retweet_count INTEGER DEFAULT 0,
+            raw_response TEXT,
+            FOREIGN KEY (session_id) REFERENCES sessions (id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS reviewer_outputs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER,
+            distilled_topics TEXT,
+            talking_points TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            raw_response TEXT,
+            FOREIGN KEY (session_id) REFERENCES sessions (id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS editor_outputs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER,
+            topic TEXT,
+            linkedin_post TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            raw_response TEXT,
+            FOREIGN KEY (session_id) REFERENCES sessions (id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS content_fingerprints (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content_type TEXT NOT NULL,
+            primary_identifier TEXT NOT NULL,
+            url TEXT,
+            content_hash TEXT NOT NULL,
+            platform TEXT NOT NULL,
+            first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            processing_status TEXT DEFAULT 'new',
+            platform_metadata TEXT,
+            UNIQUE(content_type, primary_identifier)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS processing_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_date DATE NOT NULL,
+            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            completed_at TIMESTAMP,
+            status TEXT DEFAULT 'running',
+            new_search_results INTEGER DEFAULT 0,
+            new_tweets INTEGER DEFAULT 0,
+            duplicates_skipped INTEGER DEFAULT 0,
+            content_generated INTEGER DEFAULT 0,
+            session_id INTEGER,
+            FOREIGN KEY (session_id) REFERENCES sessions (id)
+        )
+        """
+    )
+
+    # --- X Agent OS tables ---
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS skills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            slug TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'active',
+            priority REAL DEFAULT 0.5,
+            config_json TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS posts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER,
+            skill_slug TEXT,
+            platform TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            source TEXT NOT NULL,
+            draft_content TEXT NOT NULL,
+            published_content TEXT,
+            typefully_draft_id TEXT,
+            x_tweet_id TEXT,
+            x_thread_root_id TEXT,
+            planned_for TIMESTAMP,
+            published_at TIMESTAMP,
+            metadata_json TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (session_id) REFERENCES sessions (id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS conversations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER,
+            skill_slug TEXT,
+            x_tweet_url TEXT NOT NULL,
+            x_tweet_id TEXT,
+            author_handle TEXT,
+            author_followers INTEGER,
+            snippet TEXT,
+            reason TEXT,
+            suggested_reply TEXT,
+            status TEXT DEFAULT 'pending',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (session_id) REFERENCES sessions (id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS daily_briefs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT UNIQUE NOT NULL,
+            content_md TEXT NOT NULL,
+            summary_json TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS metrics_snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            post_id INTEGER NOT NULL,
+            captured_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            impressions INTEGER,
+            likes INTEGER,
+            replies INTEGER,
+            retweets INTEGER,
+            bookmarks INTEGER,
+            profile_visits INTEGER,
+            link_clicks INTEGER,
+            raw_json TEXT,
+            FOREIGN KEY (post_id) REFERENCES posts (id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS creator_personas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            handle TEXT UNIQUE NOT NULL,
+            display_name TEXT,
+            status TEXT DEFAULT 'active',
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS creator_persona_posts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            persona_id INTEGER NOT NULL,
+            tweet_id TEXT,
+            tweet_url TEXT,
+            content TEXT,
+            created_at TEXT,
+            captured_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            impressions INTEGER,
+            likes INTEGER,
+            replies INTEGER,
+            retweets INTEGER,
+            quotes INTEGER,
+            bookmarks INTEGER,
+            engagement_score REAL,
+            raw_json TEXT,
+            FOREIGN KEY (persona_id) REFERENCES creator_personas (id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS creator_persona_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            persona_id INTEGER NOT NULL,
+            run_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            window_days INTEGER,
+            source TEXT,
+            output_json_path TEXT,
+            output_md_path TEXT,
+            summary_json TEXT,
+            FOREIGN KEY (persona_id) REFERENCES creator_personas (id)
+        )
+        """
+    )
+
+
+def _migration_tweet_created_at(cursor: sqlite3.Cursor):
+    """Add twitter_results.tweet_created_at to databases created before it existed."""
+    cursor.execute("PRAGMA table_info(twitter_results)")
+    columns = [column[1] for column in cursor.fetchall()]
+    if "tweet_created_at" not in columns:
+        cursor.execute(
+            """
+            ALTER TABLE twitter_results
+            ADD COLUMN tweet_created_at TEXT
+            """
+        )
+
+
+# Secondary indexes backing the hot lookups below (see HOT_QUERIES).
+INDEXES: List[Tuple[str, str, str]] = [
+    ("idx_sessions_created_at", "sessions", "created_at"),
+    ("idx_search_results_session", "search_results", "session_id, created_at"),
+    ("idx_twitter_results_session", "twitter_results", "session_id"),
+    ("idx_reviewer_outputs_session", "reviewer_outputs", "session_id, created_at"),
+    ("idx_editor_outputs_session", "editor_outputs", "session_id, created_at"),
+    ("idx_processing_runs_started_at", "processing_runs", "started_at"),
+    ("idx_posts_published_at", "posts", "published_at, created_at"),
+    ("idx_posts_created_at", "posts", "created_at"),
+    ("idx_conversations_status", "conversations", "status, created_at"),
+    ("idx_metrics_snapshots_post", "metrics_snapshots", "post_id, captured_at"),
+    ("idx_metrics_snapshots_captured_at", "metrics_snapshots", "captured_at"),
+    ("idx_creator_persona_posts_persona", "creator_persona_posts", "persona_id, engagement_score"),
+    ("idx_creator_persona_runs_persona", "creator_persona_runs", "persona_id, run_at"),
+]
+
+
+def _migration_hot_path_indexes(cursor: sqlite3.Cursor):
+    """Create INDEXES."""
+    for name, table, columns in INDEXES:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def _migration_simhash_bands(cursor: sqlite3.Cursor):
+    """SimHash signature per fingerprint plus its LSH band index."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS content_simhashes (
+            fingerprint_id INTEGER PRIMARY KEY,
+            content_type TEXT NOT NULL,
+            simhash INTEGER NOT NULL,
+            FOREIGN KEY (fingerprint_id) REFERENCES content_fingerprints (id)
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS content_simhash_bands (
+            content_type TEXT NOT NULL,
+            band INTEGER NOT NULL,
+            band_value INTEGER NOT NULL,
+            fingerprint_id INTEGER NOT NULL,
+            PRIMARY KEY (content_type, band, band_value, fingerprint_id)
+        ) WITHOUT ROWID
+        """
+    )
+
+
+def _add_missing_columns(cursor: sqlite3.Cursor, table: str, columns: List[Tuple[str, str]]):
+    cursor.execute(f"PRAGMA table_info({table})")
+    existing = {column[1] for column in cursor.fetchall()}
+    for name, definition in columns:
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+
+def _migration_processing_run_fetch_stats(cursor: sqlite3.Cursor):
+    """Per-source fetch latency and degraded sources on processing_runs."""
+    _add_missing_columns(
+        cursor,
+        "processing_runs",
+        [
+            ("search_latency_ms", "INTEGER"),
+            ("twitter_latency_ms", "INTEGER"),
+            ("degraded_sources", "TEXT"),
+        ],
+    )
+
+
+def _migration_llm_response_cache(cursor: sqlite3.Cursor):
+    """Content-addressed LLM responses shared by the Gemini agents."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS llm_response_cache (
+            cache_key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            response_text TEXT NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            last_accessed_at REAL NOT NULL,
+            hit_count INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_accessed ON llm_response_cache (last_accessed_at)"
+    )
+
+
+def _migration_provider_response_cache(cursor: sqlite3.Cursor):
+    """Raw Perplexity/RapidAPI payloads keyed by query, referenced from result rows."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS provider_response_cache (
+            cache_key TEXT PRIMARY KEY,
+            provider TEXT NOT NULL,
+            query TEXT NOT NULL,
+            params_json TEXT NOT NULL,
+            time_bucket INTEGER NOT NULL,
+            raw_response TEXT NOT NULL,
+            fetched_at REAL NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_provider_response_cache_fetched ON provider_response_cache (fetched_at)"
+    )
+    _add_missing_columns(cursor, "search_results", [("response_key", "TEXT")])
+    _add_missing_columns(cursor, "twitter_results", [("response_key", "TEXT")])
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_search_results_response_key ON search_results (response_key)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_twitter_results_response_key ON twitter_results (response_key)")
+
+
+def _migration_creator_persona_incremental(cursor: sqlite3.Cursor):
+    """
+    One row per (persona, tweet) so refreshes upsert, plus the state incremental
+    runs compare against. Duplicates keep their most recently captured row (highest
+    id on ties); the number removed is logged.
+    """
+    cursor.execute(
+        """
+        DELETE FROM creator_persona_posts
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY persona_id, tweet_id ORDER BY captured_at DESC, id DESC
+                ) AS position
+                FROM creator_persona_posts
+                WHERE tweet_id IS NOT NULL
             )
-
+            WHERE position > 1
+        )
+        """
+    )
+    if cursor.rowcount > 0:
+        logger.warning("Removed %d duplicate creator_persona_posts rows before adding the unique index", cursor.rowcount)
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_creator_persona_posts_tweet "
+        "ON creator_persona_posts (persona_id, tweet_id)"
+    )
+    _add_missing_columns(cursor, "creator_personas", [("newest_tweet_id", "TEXT")])
+    _add_missing_columns(cursor, "creator_persona_runs", [("top_tweet_ids", "TEXT")])
+
+
+def _migration_conversation_reply_latency(cursor: sqlite3.Cursor):
+    """Generation latency of each conversation's suggested reply."""
+    _add_missing_columns(cursor, "conversations", [("reply_latency_ms", "INTEGER")])
+
+
+def _migration_persona_context_snapshots(cursor: sqlite3.Cursor):
+    """
+    Materialized persona context. Triggers bump creator_personas.context_version
+    whenever a persona's runs or posts change, and any persona change bumps the
+    single-row creator_persona_context_version, so readers can validate a cached
+    snapshot with one primary-key lookup. The triggers also cover dashboard writes.
+    """
+    _add_missing_columns(cursor, "creator_personas", [("context_version", "INTEGER NOT NULL DEFAULT 0")])
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS creator_persona_context (
+            persona_id INTEGER PRIMARY KEY,
+            version INTEGER NOT NULL,
+            context_json TEXT NOT NULL,
+            built_at REAL NOT NULL,
+            FOREIGN KEY (persona_id) REFERENCES creator_personas (id)
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS creator_persona_context_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+        """
+    )
+    cursor.execute("INSERT OR IGNORE INTO creator_persona_context_version (id, version) VALUES (1, 0)")
+
+    bump_persona = "UPDATE creator_personas SET context_version = context_version + 1 WHERE id = {row}.persona_id;"
+    for table in ("creator_persona_runs", "creator_persona_posts"):
+        for event, row in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
             cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS search_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id INTEGER,
-                    url TEXT,
-                    snippet TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    raw_response TEXT,
-                    FOREIGN KEY (session_id) REFERENCES sessions (id)
-                )
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_context
+                AFTER {event} ON {table}
+                BEGIN
+                    {bump_persona.format(row=row)}
+                END
                 """
             )
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_creator_personas_{event.lower()}_context
+            AFTER {event} ON creator_personas
+            BEGIN
+                UPDATE creator_persona_context_version SET version = version + 1 WHERE id = 1;
+            END
+            """
+        )
+
+
+def _migration_post_typefully_claim(cursor: sqlite3.Cursor):
+    """
+    In-flight Typefully draft creates are claimed here rather than in
+    typefully_draft_id, which only ever holds real draft ids.
+    """
+    _add_missing_columns(cursor, "posts", [("typefully_claim", "TEXT")])
+
+
+def _to_signed64(value: int) -> int:
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _to_unsigned64(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+# Queries that must be served by an index; checked by
+# DatabaseHandler.find_full_table_scans() and agent-service/tests/test_query_plans.py,
+# which fails when one of them falls back to a full table scan. Add an entry
+# here when a method below becomes part of a hot path.
+HOT_QUERIES: Dict[str, Tuple[str, Tuple[Any, ...]]] = {
+    "latest_session": ("SELECT id FROM sessions ORDER BY created_at DESC LIMIT 1", ()),
+    "search_results_by_session": (
+        "SELECT url, snippet FROM search_results WHERE session_id = ? ORDER BY created_at",
+        (1,),
+    ),
+    "twitter_results_by_session": (
+        "SELECT url, snippet FROM twitter_results WHERE session_id = ? "
+        "ORDER BY COALESCE(tweet_created_at, created_at)",
+        (1,),
+    ),
+    "reviewer_output_by_session": (
+        "SELECT distilled_topics FROM reviewer_outputs WHERE session_id = ? "
+        "ORDER BY created_at DESC LIMIT 1",
+        (1,),
+    ),
+    "editor_outputs_by_session": (
+        "SELECT topic FROM editor_outputs WHERE session_id = ? ORDER BY created_at",
+        (1,),
+    ),
+    "fingerprint_lookup": (
+        "SELECT * FROM content_fingerprints WHERE content_type = ? AND primary_identifier = ?",
+        ("tweet", "1"),
+    ),
+    "latest_processing_run": ("SELECT * FROM processing_runs ORDER BY started_at DESC LIMIT 1", ()),
+    "pending_posts": ("SELECT * FROM posts WHERE published_at IS NULL ORDER BY created_at DESC", ()),
+    "recent_published_posts": (
+        "SELECT * FROM posts WHERE published_at IS NOT NULL "
+        "AND published_at >= datetime('now', ?) ORDER BY published_at DESC",
+        ("-14 days",),
+    ),
+    "recent_posts": ("SELECT draft_content FROM posts ORDER BY created_at DESC LIMIT ?", (5,)),
+    "pending_conversations": (
+        "SELECT * FROM conversations WHERE status = 'pending' ORDER BY created_at DESC",
+        (),
+    ),
+    "metrics_for_post": (
+        "SELECT * FROM metrics_snapshots WHERE post_id = ? ORDER BY captured_at DESC",
+        (1,),
+    ),
+    "metrics_in_window": (
+        "SELECT SUM(impressions) FROM metrics_snapshots WHERE captured_at BETWEEN ? AND ?",
+        ("2024-01-01 00:00:00", "2024-01-01 23:59:59"),
+    ),
+    "creator_persona_posts": (
+        "SELECT * FROM creator_persona_posts WHERE persona_id = ? "
+        "ORDER BY engagement_score DESC, created_at DESC LIMIT ?",
+        (1, 3),
+    ),
+    "llm_cache_lookup": (
+        "SELECT response_text FROM llm_response_cache WHERE cache_key = ? AND created_at >= ?",
+        ("key", 0.0),
+    ),
+    "llm_cache_lru": (
+        "SELECT cache_key FROM llm_response_cache ORDER BY last_accessed_at DESC LIMIT -1 OFFSET ?",
+        (1000,),
+    ),
+    "latest_creator_persona_run": (
+        "SELECT r.* FROM creator_persona_runs r JOIN creator_personas p ON p.id = r.persona_id "
+        "WHERE p.handle = ? ORDER BY r.run_at DESC LIMIT 1",
+        ("handle",),
+    ),
+}
+
+
+# Ordered schema migrations. Append new steps with the next version number and
+# never edit a released step. Steps must tolerate databases that predate the
+# schema_version table (those start at version 0 and replay every step).
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, "base tables", _migration_base_tables),
+    (2, "twitter_results.tweet_created_at", _migration_tweet_created_at),
+    (3, "hot path indexes", _migration_hot_path_indexes),
+    (4, "simhash near-duplicate index", _migration_simhash_bands),
+    (5, "processing_runs fetch stats", _migration_processing_run_fetch_stats),
+    (6, "llm response cache", _migration_llm_response_cache),
+    (7, "provider response cache", _migration_provider_response_cache),
+    (8, "incremental creator persona refresh", _migration_creator_persona_incremental),
+    (9, "conversations.reply_latency_ms", _migration_conversation_reply_latency),
+    (10, "creator persona context snapshots", _migration_persona_context_snapshots),
+    (11, "posts.typefully_claim", _migration_post_typefully_claim),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# Database files already known to be at SCHEMA_VERSION in this process.
+_schema_ready: Set[str] = set()
+_schema_lock = threading.Lock()
+
+# Optional Bloom filters in front of content_fingerprints, shared by every
+# handler on the same file. See DatabaseHandler.enable_fingerprint_filter().
+_fingerprint_filters: Dict[str, Tuple[FingerprintBloomFilter, str]] = {}
+_fingerprint_filters_lock = threading.Lock()
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS twitter_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id INTEGER,
-                    url TEXT,
-                    snippet TEXT,
-                    screen_name TEXT,
-                    followers_count INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    tweet_created_at TEXT,
-                    favorite_count INTEGER DEFAULT 0,
-                    quote_count INTEGER DEFAULT 0,
-                    reply_count INTEGER DEFAULT 0,
-                    retweet_count INTEGER DEFAULT 0,
-                    raw_response TEXT,
-                    FOREIGN KEY (session_id) REFERENCES sessions (id)
-                )
-                """
-            )
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS reviewer_outputs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id INTEGER,
-                    distilled_topics TEXT,
-                    talking_points TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    raw_response TEXT,
-                    FOREIGN KEY (session_id) REFERENCES sessions (id)
-                )
-                """
-            )
+class DatabaseHandler:
+    """SQLite access layer shared by the pipeline, agents and CLI entry points.
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS editor_outputs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id INTEGER,
-                    topic TEXT,
-                    linkedin_post TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    raw_response TEXT,
-                    FOREIGN KEY (session_id) REFERENCES sessions (id)
-                )
-                """
-            )
+    Connections are long-lived and owned by a single thread: the first call
+    from a thread opens its connection and every later call from that thread
+    reuses it. Connections are dropped when their thread exits, after a fork,
+    or when `close()` is called.
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS content_fingerprints (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    content_type TEXT NOT NULL,
-                    primary_identifier TEXT NOT NULL,
-                    url TEXT,
-                    content_hash TEXT NOT NULL,
-                    platform TEXT NOT NULL,
-                    first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    processing_status TEXT DEFAULT 'new',
-                    platform_metadata TEXT,
-                    UNIQUE(content_type, primary_identifier)
-                )
-                """
-            )
+    `read_only=True` opens the file in SQLite's read-only mode and skips schema
+    setup, for analytics readers that must never take the write lock.
+    """
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS processing_runs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_date DATE NOT NULL,
-                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    completed_at TIMESTAMP,
-                    status TEXT DEFAULT 'running',
-                    new_search_results INTEGER DEFAULT 0,
-                    new_tweets INTEGER DEFAULT 0,
-                    duplicates_skipped INTEGER DEFAULT 0,
-                    content_generated INTEGER DEFAULT 0,
-                    session_id INTEGER,
-                    FOREIGN KEY (session_id) REFERENCES sessions (id)
-                )
-                """
-            )
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        pragmas: Optional[Dict[str, Any]] = None,
+        read_only: bool = False,
+        checkpoint_interval_seconds: float = 300.0,
+    ):
+        self.db_path = db_path or _default_db_path()
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.read_only = read_only
+        self.checkpoint_interval_seconds = checkpoint_interval_seconds
+        self._last_checkpoint = time.monotonic()
+        self._local = threading.local()
+        # Keyed by id() of the owning thread's _ConnectionOwner, not the thread
+        # ident: idents are reused, owners die with their thread-local storage.
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        self._pid = os.getpid()
+        self.stats = {"connects": 0, "reuses": 0, "reconnects": 0}
+        self._stats_lock = threading.Lock()
+        self._finalizer = weakref.finalize(
+            self, _close_connections, self._connections, self._connections_lock
+        )
+        if not read_only:
+            self.ensure_schema()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        # check_same_thread is disabled only so close() can run from any thread;
+        # each connection is still handed out exclusively to its owning thread.
+        if self.read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        self._count("connects")
+        return conn
+
+    def _count(self, counter: str):
+        with self._stats_lock:
+            self.stats[counter] += 1
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        for name, value in self.pragmas.items():
+            if value is None or (self.read_only and name in _WRITE_PRAGMAS):
+                continue
+            conn.execute(f"PRAGMA {name} = {value}")
+
+    def checkpoint(self, mode: str = "PASSIVE") -> Optional[Dict[str, int]]:
+        """Run a WAL checkpoint; PASSIVE never blocks readers or writers."""
+        if self.read_only or mode.upper() not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+            return None
+        self._last_checkpoint = time.monotonic()
+        with self.get_connection() as conn:
+            row = conn.execute(f"PRAGMA wal_checkpoint({mode.upper()})").fetchone()
+        if not row:
+            return None
+        return {"busy": row[0], "log_frames": row[1], "checkpointed_frames": row[2]}
 
-            # --- X Agent OS tables ---
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS skills (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    slug TEXT UNIQUE NOT NULL,
-                    name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'active',
-                    priority REAL DEFAULT 0.5,
-                    config_json TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
+    def _maybe_checkpoint(self, conn: sqlite3.Connection):
+        if self.read_only or conn.in_transaction or self.checkpoint_interval_seconds <= 0:
+            return
+        if time.monotonic() - self._last_checkpoint < self.checkpoint_interval_seconds:
+            return
+        self._last_checkpoint = time.monotonic()
+        try:
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        except sqlite3.Error:
+            pass
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS posts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id INTEGER,
-                    skill_slug TEXT,
-                    platform TEXT NOT NULL,
-                    kind TEXT NOT NULL,
-                    source TEXT NOT NULL,
-                    draft_content TEXT NOT NULL,
-                    published_content TEXT,
-                    typefully_draft_id TEXT,
-                    x_tweet_id TEXT,
-                    x_thread_root_id TEXT,
-                    planned_for TIMESTAMP,
-                    published_at TIMESTAMP,
-                    metadata_json TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (session_id) REFERENCES sessions (id)
-                )
-                """
-            )
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        try:
+            conn.total_changes
+        except sqlite3.ProgrammingError:
+            return False
+        return True
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS conversations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id INTEGER,
-                    skill_slug TEXT,
-                    x_tweet_url TEXT NOT NULL,
-                    x_tweet_id TEXT,
-                    author_handle TEXT,
-                    author_followers INTEGER,
-                    snippet TEXT,
-                    reason TEXT,
-                    suggested_reply TEXT,
-                    status TEXT DEFAULT 'pending',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (session_id) REFERENCES sessions (id)
-                )
-                """
-            )
+    def _thread_connection(self) -> sqlite3.Connection:
+        if os.getpid() != self._pid:
+            # SQLite connections must not cross a fork; start fresh in the child.
+            self._local = threading.local()
+            with self._connections_lock:
+                self._connections.clear()
+            self._pid = os.getpid()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            if self._is_healthy(conn):
+                self._count("reuses")
+                return conn
+            self._count("reconnects")
+
+        conn = self._open_connection()
+        # When the thread exits its locals are dropped, the owner is collected
+        # and the finalizer closes the connection and unregisters it. Replacing
+        # the owner here does the same for a broken connection.
+        owner = _ConnectionOwner()
+        key = id(owner)
+        with self._connections_lock:
+            self._connections[key] = conn
+        weakref.finalize(owner, _release_connection, self._connections, self._connections_lock, key, conn)
+        self._local.owner = owner
+        self._local.conn = conn
+        self._local.depth = 0
+        return conn
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS daily_briefs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date TEXT UNIQUE NOT NULL,
-                    content_md TEXT NOT NULL,
-                    summary_json TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
+    @contextmanager
+    def get_connection(self):
+        conn = self._thread_connection()
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            # The connection outlives this block, so never leave a half-done
+            # transaction behind for the next caller on this thread.
+            if self._local.depth == 1 and conn.in_transaction:
+                conn.rollback()
+            raise
+        else:
+            if self._local.depth == 1:
+                self._maybe_checkpoint(conn)
+        finally:
+            self._local.depth -= 1
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS metrics_snapshots (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    post_id INTEGER NOT NULL,
-                    captured_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    impressions INTEGER,
-                    likes INTEGER,
-                    replies INTEGER,
-                    retweets INTEGER,
-                    bookmarks INTEGER,
-                    profile_visits INTEGER,
-                    link_clicks INTEGER,
-                    raw_json TEXT,
-                    FOREIGN KEY (post_id) REFERENCES posts (id)
-                )
-                """
-            )
+    def connection_stats(self) -> Dict[str, int]:
+        with self._connections_lock:
+            open_connections = len(self._connections)
+        with self._stats_lock:
+            stats = dict(self.stats)
+        return {**stats, "open_connections": open_connections}
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS creator_personas (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    handle TEXT UNIQUE NOT NULL,
-                    display_name TEXT,
-                    status TEXT DEFAULT 'active',
-                    notes TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
+    def close(self):
+        """Close every connection owned by this handler."""
+        _close_connections(self._connections, self._connections_lock)
+        self._local = threading.local()
 
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS creator_persona_posts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    persona_id INTEGER NOT NULL,
-                    tweet_id TEXT,
-                    tweet_url TEXT,
-                    content TEXT,
-                    created_at TEXT,
-                    captured_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    impressions INTEGER,
-                    likes INTEGER,
-                    replies INTEGER,
-                    retweets INTEGER,
-                    quotes INTEGER,
-                    bookmarks INTEGER,
-                    engagement_score REAL,
-                    raw_json TEXT,
-                    FOREIGN KEY (persona_id) REFERENCES creator_personas (id)
-                )
-                """
-            )
+    def __enter__(self):
+        return self
 
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _schema_key(self) -> str:
+        return str(Path(self.db_path).resolve())
+
+    def get_schema_version(self) -> int:
+        with self.get_connection() as conn:
+            try:
+                row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+            except sqlite3.OperationalError:
+                return 0
+            return row[0] or 0
+
+    def ensure_schema(self):
+        """Bring the database up to SCHEMA_VERSION, once per file per process."""
+        key = self._schema_key()
+        if key in _schema_ready:
+            return
+        with _schema_lock:
+            if key in _schema_ready:
+                return
+            if self.get_schema_version() < SCHEMA_VERSION:
+                self._apply_migrations()
+            _schema_ready.add(key)
+
+    def _apply_migrations(self):
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Take the write lock up front so concurrent processes serialize here
+            # and the loser sees the winner's version instead of re-running steps.
+            cursor.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 """
-                CREATE TABLE IF NOT EXISTS creator_persona_runs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    persona_id INTEGER NOT NULL,
-                    run_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    window_days INTEGER,
-                    source TEXT,
-                    output_json_path TEXT,
-                    output_md_path TEXT,
-                    summary_json TEXT,
-                    FOREIGN KEY (persona_id) REFERENCES creator_personas (id)
+                CREATE TABLE IF NOT EXISTS schema_version (
+                    version INTEGER PRIMARY KEY,
+                    description TEXT,
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
                 """
             )
-
+            cursor.execute("SELECT MAX(version) FROM schema_version")
+            current = cursor.fetchone()[0] or 0
+            for version, description, migration in MIGRATIONS:
+                if version <= current:
+                    continue
+                migration(cursor)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (version, description),
+                )
             conn.commit()
 
+    def find_full_table_scans(self) -> Dict[str, List[str]]:
+        """Return HOT_QUERIES whose plan scans a table without an index."""
+        offenders: Dict[str, List[str]] = {}
+        with self.get_connection() as conn:
+            for name, (sql, params) in HOT_QUERIES.items():
+                plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+                scans = [
+                    detail
+                    for detail in plan
+                    if detail.startswith("SCAN ") and " INDEX " not in detail
+                ]
+                if scans:
+                    offenders[name] = scans
+        return offenders
+
     # --- Session methods ---
     def create_session(
         self,
@@ -353,18 +955,34 @@ class DatabaseHandler:
             return result[0] if result else None
 
     # --- Search results ---
-    def save_search_results(self, session_id: int, results: List[Dict[str, Any]], raw_response: Optional[str] = None):
+    def save_search_results(
+        self,
+        session_id: int,
+        results: List[Dict[str, Any]],
+        raw_response: Optional[str] = None,
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+        response_key: Optional[str] = None,
+    ) -> List[int]:
+        # The raw payload is shared by the whole batch, so only the first row carries it.
+        # With a response_key the payload already lives in provider_response_cache.
+        if response_key:
+            raw_response = None
+        rows = (
+            (session_id, result.get("url"), result.get("snippet"), raw_response if i == 0 else None, response_key)
+            for i, result in enumerate(results)
+        )
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            for result in results:
-                cursor.execute(
-                    """
-                    INSERT INTO search_results (session_id, url, snippet, raw_response)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (session_id, result.get("url"), result.get("snippet"), raw_response),
-                )
+            ids = _bulk_insert(
+                conn.cursor(),
+                """
+                INSERT INTO search_results (session_id, url, snippet, raw_response, response_key)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+                chunk_size,
+            )
             conn.commit()
+            return ids
 
     def get_search_results(self, session_id: Optional[int] = None) -> List[Dict[str, Any]]:
         if session_id is None:
@@ -395,32 +1013,49 @@ class DatabaseHandler:
             return cursor.fetchone()[0] > 0
 
     # --- Twitter results ---
-    def save_twitter_results(self, session_id: int, results: List[Dict[str, Any]], raw_response: Optional[str] = None):
+    def save_twitter_results(
+        self,
+        session_id: int,
+        results: List[Dict[str, Any]],
+        raw_response: Optional[str] = None,
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+        response_key: Optional[str] = None,
+    ) -> List[int]:
+        # The raw payload is shared by the whole batch, so only the first row carries it.
+        # With a response_key the payload already lives in provider_response_cache.
+        if response_key:
+            raw_response = None
+        rows = (
+            (
+                session_id,
+                result.get("url"),
+                result.get("snippet"),
+                result.get("screen_name"),
+                result.get("followers_count", 0),
+                result.get("created_at"),
+                result.get("favorite_count", 0),
+                result.get("quote_count", 0),
+                result.get("reply_count", 0),
+                result.get("retweet_count", 0),
+                raw_response if i == 0 else None,
+                response_key,
+            )
+            for i, result in enumerate(results)
+        )
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            for result in results:
-                cursor.execute(
-                    """
-                    INSERT INTO twitter_results
-                    (session_id, url, snippet, screen_name, followers_count, tweet_created_at,
-                     favorite_count, quote_count, reply_count, retweet_count, raw_response)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        session_id,
-                        result.get("url"),
-                        result.get("snippet"),
-                        result.get("screen_name"),
-                        result.get("followers_count", 0),
-                        result.get("created_at"),
-                        result.get("favorite_count", 0),
-                        result.get("quote_count", 0),
-                        result.get("reply_count", 0),
-                        result.get("retweet_count", 0),
-                        raw_response,
-                    ),
-                )
+            ids = _bulk_insert(
+                conn.cursor(),
+                """
+                INSERT INTO twitter_results
+                (session_id, url, snippet, screen_name, followers_count, tweet_created_at,
+                 favorite_count, quote_count, reply_count, retweet_count, raw_response, response_key)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+                chunk_size,
+            )
             conn.commit()
+            return ids
 
     def get_twitter_results(self, session_id: Optional[int] = None) -> List[Dict[str, Any]]:
         if session_id is None:
@@ -510,20 +1145,33 @@ class DatabaseHandler:
 
     # --- Editor outputs ---
     def save_editor_outputs(
-        self, session_id: int, posts: List[Dict[str, Any]], raw_responses: Optional[List[str]] = None
-    ):
+        self,
+        session_id: int,
+        posts: List[Dict[str, Any]],
+        raw_responses: Optional[List[str]] = None,
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+    ) -> List[int]:
+        rows = (
+            (
+                session_id,
+                post.get("topic"),
+                post.get("linkedin_post"),
+                raw_responses[i] if raw_responses and i < len(raw_responses) else None,
+            )
+            for i, post in enumerate(posts)
+        )
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            for i, post in enumerate(posts):
-                raw_response = raw_responses[i] if raw_responses and i < len(raw_responses) else None
-                cursor.execute(
-                    """
-                    INSERT INTO editor_outputs (session_id, topic, linkedin_post, raw_response)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (session_id, post.get("topic"), post.get("linkedin_post"), raw_response),
-                )
+            ids = _bulk_insert(
+                conn.cursor(),
+                """
+                INSERT INTO editor_outputs (session_id, topic, linkedin_post, raw_response)
+                VALUES (?, ?, ?, ?)
+                """,
+                rows,
+                chunk_size,
+            )
             conn.commit()
+            return ids
 
     def get_editor_outputs(self, session_id: Optional[int] = None) -> List[Dict[str, Any]]:
         if session_id is None:
@@ -554,7 +1202,74 @@ class DatabaseHandler:
             return cursor.fetchone()[0] > 0
 
     # --- Content fingerprinting ---
+    def enable_fingerprint_filter(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        path: Optional[str] = None,
+    ) -> FingerprintBloomFilter:
+        """Put a Bloom filter in front of fingerprint lookups for this DB file.
+
+        The filter is loaded from `path` (default: next to the DB file) and
+        caught up with rows added since it was saved. A file that does not
+        match this DB (row count or highest id up to its max_id differ, e.g.
+        after a restore or prune) is discarded, and the filter is rebuilt from
+        a full content_fingerprints scan. Negative lookups then skip SQLite;
+        inserts still use ON CONFLICT, since another process may have added
+        a key since the filter was synced.
+        """
+        key = self._schema_key()
+        with _fingerprint_filters_lock:
+            if key in _fingerprint_filters:
+                return _fingerprint_filters[key][0]
+            path = path or f"{self.db_path}.bloom"
+            bloom = FingerprintBloomFilter.load(path)
+            with self.get_connection() as conn:
+                if bloom is not None:
+                    rows, max_id = conn.execute(
+                        "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM content_fingerprints WHERE id <= ?",
+                        (bloom.max_id,),
+                    ).fetchone()
+                    if (rows, max_id) != (bloom.rows, bloom.max_id):
+                        logger.warning("Fingerprint filter %s does not match the database; rebuilding", path)
+                        bloom = None
+                if bloom is None or bloom.estimated_error_rate() > error_rate * 10:
+                    bloom = FingerprintBloomFilter(capacity=capacity, error_rate=error_rate)
+                self._sync_fingerprint_filter(conn, bloom)
+            _fingerprint_filters[key] = (bloom, path)
+            return bloom
+
+    @staticmethod
+    def _sync_fingerprint_filter(conn: sqlite3.Connection, bloom: FingerprintBloomFilter):
+        bloom.sync(
+            conn.execute(
+                """
+                SELECT content_type, primary_identifier, id
+                FROM content_fingerprints
+                WHERE id > ?
+                ORDER BY id
+                """,
+                (bloom.max_id,),
+            )
+        )
+
+    def _fingerprint_filter(self) -> Optional[FingerprintBloomFilter]:
+        entry = _fingerprint_filters.get(self._schema_key()) if _fingerprint_filters else None
+        return entry[0] if entry else None
+
+    def save_fingerprint_filter(self):
+        """Catch the filter up with the table, so max_id/rows describe it exactly, and write it out."""
+        entry = _fingerprint_filters.get(self._schema_key())
+        if entry:
+            bloom, path = entry
+            with self.get_connection() as conn:
+                self._sync_fingerprint_filter(conn, bloom)
+            bloom.save(path)
+
     def check_content_fingerprint(self, content_type: str, primary_identifier: str) -> Optional[Dict[str, Any]]:
+        bloom = self._fingerprint_filter()
+        if bloom and not bloom.might_contain(content_type, primary_identifier):
+            return None
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -584,11 +1299,156 @@ class DatabaseHandler:
                 INSERT INTO content_fingerprints
                 (content_type, primary_identifier, url, content_hash, platform, platform_metadata)
                 VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(content_type, primary_identifier) DO NOTHING
+                RETURNING id
                 """,
                 (content_type, primary_identifier, url, content_hash, platform, metadata_json),
             )
+            row = cursor.fetchone()
+            if row is None:
+                # Another writer stored the key after our lookup missed it
+                row = cursor.execute(
+                    "SELECT id FROM content_fingerprints WHERE content_type = ? AND primary_identifier = ?",
+                    (content_type, primary_identifier),
+                ).fetchone()
+            conn.commit()
+            bloom = self._fingerprint_filter()
+            if bloom:
+                bloom.add(content_type, primary_identifier)
+            return row["id"]
+
+    def find_content_fingerprints(
+        self, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Look up many (content_type, primary_identifier) pairs in one pass."""
+        found: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        bloom = self._fingerprint_filter()
+        keys = dict.fromkeys(keys)
+        if bloom:
+            keys = [key for key in keys if bloom.might_contain(*key)]
+        if not keys:
+            return found
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in _chunked(keys, MAX_SQL_VARIABLES // 2):
+                placeholders = ", ".join(["(?, ?)"] * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT * FROM content_fingerprints
+                    WHERE (content_type, primary_identifier) IN (VALUES {placeholders})
+                    """,
+                    [value for key in chunk for value in key],
+                )
+                for row in cursor.fetchall():
+                    found[(row["content_type"], row["primary_identifier"])] = dict(row)
+        return found
+
+    def save_content_fingerprints(
+        self, fingerprints: List[Dict[str, Any]]
+    ) -> Dict[Tuple[str, str], int]:
+        """Insert fingerprints in one transaction, skipping ones that already exist.
+
+        Returns the new ids keyed by (content_type, primary_identifier); keys
+        that lost a race with another writer are absent.
+        """
+        columns = 6
+        inserted: Dict[Tuple[str, str], int] = {}
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in _chunked(fingerprints, MAX_SQL_VARIABLES // columns):
+                placeholders = ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+                params: List[Any] = []
+                for fingerprint in chunk:
+                    metadata = fingerprint.get("platform_metadata")
+                    params.extend(
+                        [
+                            fingerprint["content_type"],
+                            fingerprint["primary_identifier"],
+                            fingerprint.get("url"),
+                            fingerprint["content_hash"],
+                            fingerprint["platform"],
+                            json.dumps(metadata) if metadata else None,
+                        ]
+                    )
+                cursor.execute(
+                    f"""
+                    INSERT INTO content_fingerprints
+                    (content_type, primary_identifier, url, content_hash, platform, platform_metadata)
+                    VALUES {placeholders}
+                    ON CONFLICT(content_type, primary_identifier) DO NOTHING
+                    RETURNING id, content_type, primary_identifier
+                    """,
+                    params,
+                )
+                for row in cursor.fetchall():
+                    inserted[(row["content_type"], row["primary_identifier"])] = row["id"]
+            conn.commit()
+        bloom = self._fingerprint_filter()
+        if bloom:
+            # Keys that hit a conflict exist too (another writer got there first).
+            bloom.add_many((fp["content_type"], fp["primary_identifier"]) for fp in fingerprints)
+        return inserted
+
+    def find_simhash_candidates(
+        self, content_type: str, bands: Iterable[Tuple[int, int]]
+    ) -> Dict[int, int]:
+        """Return {fingerprint_id: simhash} for fingerprints sharing any (band, band_value)."""
+        candidates: Dict[int, int] = {}
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in _chunked(dict.fromkeys(bands), (MAX_SQL_VARIABLES - 1) // 2):
+                placeholders = ", ".join(["(?, ?)"] * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT s.fingerprint_id, s.simhash
+                    FROM content_simhash_bands b
+                    JOIN content_simhashes s ON s.fingerprint_id = b.fingerprint_id
+                    WHERE b.content_type = ? AND (b.band, b.band_value) IN (VALUES {placeholders})
+                    """,
+                    [content_type, *[value for key in chunk for value in key]],
+                )
+                for row in cursor.fetchall():
+                    candidates[row["fingerprint_id"]] = _to_unsigned64(row["simhash"])
+        return candidates
+
+    def save_content_simhashes(self, entries: List[Tuple[int, str, int, List[Tuple[int, int]]]]):
+        """Store (fingerprint_id, content_type, simhash, bands) rows and their band index."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO content_simhashes (fingerprint_id, content_type, simhash)
+                VALUES (?, ?, ?)
+                """,
+                [(fid, content_type, _to_signed64(simhash)) for fid, content_type, simhash, _ in entries],
+            )
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO content_simhash_bands (content_type, band, band_value, fingerprint_id)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (content_type, band, band_value, fid)
+                    for fid, content_type, _, bands in entries
+                    for band, band_value in bands
+                ],
+            )
+            conn.commit()
+
+    def update_fingerprint_statuses(self, fingerprint_ids: Iterable[int], status: str):
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in _chunked(fingerprint_ids, MAX_SQL_VARIABLES - 1):
+                placeholders = ", ".join(["?"] * len(chunk))
+                cursor.execute(
+                    f"""
+                    UPDATE content_fingerprints
+                    SET processing_status = ?, last_updated = CURRENT_TIMESTAMP
+                    WHERE id IN ({placeholders})
+                    """,
+                    [status, *chunk],
+                )
             conn.commit()
-            return cursor.lastrowid
 
     def update_fingerprint_status(self, fingerprint_id: int, status: str):
         with self.get_connection() as conn:
@@ -603,6 +1463,114 @@ class DatabaseHandler:
             )
             conn.commit()
 
+    # --- LLM response cache ---
+    def get_llm_cache_entry(self, cache_key: str, max_age_seconds: float) -> Optional[str]:
+        """Return a cached response younger than max_age_seconds, bumping its LRU position."""
+        now = time.time()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT response_text FROM llm_response_cache WHERE cache_key = ? AND created_at >= ?",
+                (cache_key, now - max_age_seconds),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            cursor.execute(
+                """
+                UPDATE llm_response_cache
+                SET last_accessed_at = ?, hit_count = hit_count + 1
+                WHERE cache_key = ?
+                """,
+                (now, cache_key),
+            )
+            conn.commit()
+            return row["response_text"]
+
+    def save_llm_cache_entry(self, cache_key: str, model: str, response_text: str):
+        now = time.time()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO llm_response_cache
+                    (cache_key, model, response_text, size_bytes, created_at, last_accessed_at, hit_count)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                """,
+                (cache_key, model, response_text, len(response_text.encode("utf-8")), now, now),
+            )
+            conn.commit()
+
+    def prune_llm_cache(self, max_age_seconds: float, max_entries: int) -> int:
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < ?",
+                (time.time() - max_age_seconds,),
+            )
+            removed = cursor.rowcount
+            cursor.execute(
+                """
+                DELETE FROM llm_response_cache WHERE cache_key IN (
+                    SELECT cache_key FROM llm_response_cache
+                    ORDER BY last_accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (max(0, max_entries),),
+            )
+            removed += cursor.rowcount
+            conn.commit()
+            return removed
+
+    # --- Provider response cache ---
+    def get_provider_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT raw_response, fetched_at FROM provider_response_cache WHERE cache_key = ?",
+                (cache_key,),
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def save_provider_response(
+        self,
+        cache_key: str,
+        provider: str,
+        query: str,
+        params_json: str,
+        time_bucket: int,
+        raw_response: str,
+    ):
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO provider_response_cache
+                    (cache_key, provider, query, params_json, time_bucket, raw_response, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (cache_key, provider, query, params_json, time_bucket, raw_response, time.time()),
+            )
+            conn.commit()
+
+    def prune_provider_cache(self, max_age_seconds: float) -> int:
+        """Drop payloads fetched more than max_age_seconds ago that no result row references."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                DELETE FROM provider_response_cache
+                WHERE fetched_at < ?
+                  AND cache_key NOT IN (SELECT response_key FROM search_results WHERE response_key IS NOT NULL)
+                  AND cache_key NOT IN (SELECT response_key FROM twitter_results WHERE response_key IS NOT NULL)
+                """,
+                (time.time() - max_age_seconds,),
+            )
+            conn.commit()
+            return cursor.rowcount
+
     # --- Processing runs ---
     def create_processing_run(self, run_date: str, session_id: int) -> int:
         with self.get_connection() as conn:
@@ -627,6 +1595,9 @@ class DatabaseHandler:
                 "duplicates_skipped",
                 "content_generated",
                 "status",
+                "search_latency_ms",
+                "twitter_latency_ms",
+                "degraded_sources",
             ]:
                 set_clauses.append(f"{key} = ?")
                 values.append(value)
@@ -775,34 +1746,77 @@ class DatabaseHandler:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def insert_creator_persona_posts(self, persona_id: int, posts: List[Dict[str, Any]]):
+    def upsert_creator_persona_posts(
+        self, persona_id: int, posts: List[Dict[str, Any]], chunk_size: int = BULK_INSERT_CHUNK_SIZE
+    ) -> List[int]:
+        """
+        Insert posts, or refresh engagement counts and raw_json for tweets already stored
+        for this persona. Advances creator_personas.newest_tweet_id in the same transaction.
+        Returns the row ids (inserted or updated) in input order.
+        """
+        columns = 13
+        rows = [
+            (
+                persona_id,
+                post.get("tweet_id"),
+                post.get("tweet_url"),
+                post.get("content"),
+                post.get("created_at"),
+                post.get("impressions"),
+                post.get("likes"),
+                post.get("replies"),
+                post.get("retweets"),
+                post.get("quotes"),
+                post.get("bookmarks"),
+                post.get("engagement_score"),
+                post.get("raw_json"),
+            )
+            for post in posts
+        ]
+        tweet_ids = [int(post["tweet_id"]) for post in posts if str(post.get("tweet_id") or "").isdigit()]
+        ids: List[int] = []
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            for post in posts:
+            for chunk in _chunked(rows, max(1, min(chunk_size, MAX_SQL_VARIABLES // columns))):
+                placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk))
                 cursor.execute(
-                    """
+                    f"""
                     INSERT INTO creator_persona_posts
                     (persona_id, tweet_id, tweet_url, content, created_at, impressions, likes,
                      replies, retweets, quotes, bookmarks, engagement_score, raw_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    VALUES {placeholders}
+                    ON CONFLICT(persona_id, tweet_id) DO UPDATE SET
+                        likes = excluded.likes,
+                        replies = excluded.replies,
+                        retweets = excluded.retweets,
+                        quotes = excluded.quotes,
+                        impressions = COALESCE(excluded.impressions, impressions),
+                        bookmarks = COALESCE(excluded.bookmarks, bookmarks),
+                        engagement_score = excluded.engagement_score,
+                        raw_json = excluded.raw_json,
+                        captured_at = CURRENT_TIMESTAMP
+                    RETURNING id, tweet_id
                     """,
-                    (
-                        persona_id,
-                        post.get("tweet_id"),
-                        post.get("tweet_url"),
-                        post.get("content"),
-                        post.get("created_at"),
-                        post.get("impressions"),
-                        post.get("likes"),
-                        post.get("replies"),
-                        post.get("retweets"),
-                        post.get("quotes"),
-                        post.get("bookmarks"),
-                        post.get("engagement_score"),
-                        post.get("raw_json"),
-                    ),
+                    [value for row in chunk for value in row],
+                )
+                # RETURNING order is unspecified: match rows back by tweet_id. Rows without
+                # one never conflict, so each is a fresh insert, taken in statement order.
+                returned = cursor.fetchall()
+                # tweet_id is TEXT, so an int passed in comes back as a string.
+                by_tweet = {str(row["tweet_id"]): row["id"] for row in returned if row["tweet_id"] is not None}
+                untracked = iter([row["id"] for row in returned if row["tweet_id"] is None])
+                ids.extend(by_tweet[str(row[1])] if row[1] is not None else next(untracked) for row in chunk)
+            if tweet_ids:
+                # Snowflake ids grow over time, so the numerically largest is the newest
+                cursor.execute(
+                    """
+                    UPDATE creator_personas SET newest_tweet_id = ?
+                    WHERE id = ? AND (newest_tweet_id IS NULL OR CAST(newest_tweet_id AS INTEGER) < ?)
+                    """,
+                    (str(max(tweet_ids)), persona_id, max(tweet_ids)),
                 )
             conn.commit()
+        return ids
 
     def save_creator_persona_run(
         self,
@@ -812,14 +1826,15 @@ class DatabaseHandler:
         output_json_path: str,
         output_md_path: str,
         summary_json: Dict[str, Any],
+        top_tweet_ids: Optional[List[str]] = None,
     ) -> int:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
                 INSERT INTO creator_persona_runs
-                (persona_id, window_days, source, output_json_path, output_md_path, summary_json)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (persona_id, window_days, source, output_json_path, output_md_path, summary_json, top_tweet_ids)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     persona_id,
@@ -828,6 +1843,7 @@ class DatabaseHandler:
                     output_json_path,
                     output_md_path,
                     json.dumps(summary_json),
+                    json.dumps(top_tweet_ids) if top_tweet_ids is not None else None,
                 ),
             )
             conn.commit()
@@ -852,6 +1868,7 @@ class DatabaseHandler:
                 return None
             result = dict(row)
             result["summary_json"] = json.loads(result["summary_json"]) if result.get("summary_json") else None
+            result["top_tweet_ids"] = json.loads(result["top_tweet_ids"]) if result.get("top_tweet_ids") else None
             return result
 
     def list_creator_persona_posts(self, persona_id: int, limit: int = 100) -> List[Dict[str, Any]]:
@@ -874,6 +1891,7 @@ class DatabaseHandler:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM creator_persona_posts WHERE persona_id = ?", (persona_id,))
             cursor.execute("DELETE FROM creator_persona_runs WHERE persona_id = ?", (persona_id,))
+            cursor.execute("UPDATE creator_personas SET newest_tweet_id = NULL WHERE id = ?", (persona_id,))
             conn.commit()
 
     def delete_creator_persona(self, handle: str) -> bool:
@@ -885,10 +1903,51 @@ class DatabaseHandler:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM creator_persona_posts WHERE persona_id = ?", (persona_id,))
             cursor.execute("DELETE FROM creator_persona_runs WHERE persona_id = ?", (persona_id,))
+            cursor.execute("DELETE FROM creator_persona_context WHERE persona_id = ?", (persona_id,))
             cursor.execute("DELETE FROM creator_personas WHERE id = ?", (persona_id,))
             conn.commit()
         return True
 
+    def get_persona_context_version(self) -> int:
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT version FROM creator_persona_context_version WHERE id = 1").fetchone()
+            return int(row["version"]) if row else 0
+
+    def list_persona_context_snapshots(self) -> List[Dict[str, Any]]:
+        """Active personas (newest first) with their stored context snapshot, if any."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT p.id, p.handle, p.context_version, c.version AS snapshot_version, c.context_json
+                FROM creator_personas p
+                LEFT JOIN creator_persona_context c ON c.persona_id = p.id
+                WHERE p.status = 'active'
+                ORDER BY p.updated_at DESC
+                """
+            )
+            rows = []
+            for row in cursor.fetchall():
+                result = dict(row)
+                result["context_json"] = json.loads(result["context_json"]) if result.get("context_json") else None
+                rows.append(result)
+            return rows
+
+    def save_persona_context_snapshot(self, persona_id: int, version: int, context: Dict[str, Any]):
+        with self.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO creator_persona_context (persona_id, version, context_json, built_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(persona_id) DO UPDATE SET
+                    version = excluded.version,
+                    context_json = excluded.context_json,
+                    built_at = excluded.built_at
+                """,
+                (persona_id, version, json.dumps(context), time.time()),
+            )
+            conn.commit()
+
     def list_creator_personas(self, active_only: bool = False) -> List[Dict[str, Any]]:
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -999,13 +2058,55 @@ class DatabaseHandler:
             cursor.execute(
                 """
                 UPDATE posts
-                SET typefully_draft_id = ?, updated_at = CURRENT_TIMESTAMP
+                SET typefully_draft_id = ?, typefully_claim = NULL, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
                 """,
                 (typefully_draft_id, post_id),
             )
             conn.commit()
 
+    def claim_post_typefully_draft(
+        self, post_id: int, marker: str, expected: Optional[str] = None
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Atomically set posts.typefully_claim to marker while the post has no draft id and
+        its claim is still `expected` (None: unclaimed). Returns None when claimed,
+        otherwise the post's current {"typefully_draft_id", "typefully_claim"}.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE posts
+                SET typefully_claim = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND typefully_draft_id IS NULL AND typefully_claim IS ?
+                """,
+                (marker, post_id, expected),
+            )
+            if cursor.rowcount:
+                conn.commit()
+                return None
+            row = cursor.execute(
+                "SELECT typefully_draft_id, typefully_claim FROM posts WHERE id = ?", (post_id,)
+            ).fetchone()
+            conn.commit()
+            if not row:
+                raise ValueError(f"Post {post_id} not found.")
+            return {"typefully_draft_id": row["typefully_draft_id"], "typefully_claim": row["typefully_claim"]}
+
+    def release_post_typefully_claim(self, post_id: int, marker: str):
+        """Clear typefully_claim if it still holds marker (the draft was definitely not created)."""
+        with self.get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE posts
+                SET typefully_claim = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND typefully_claim = ?
+                """,
+                (post_id, marker),
+            )
+            conn.commit()
+
     def update_post_metrics(self, post_id: int, metadata_json: Dict[str, Any]):
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -1089,16 +2190,24 @@ class DatabaseHandler:
             )
             conn.commit()
 
-    def update_conversation_reply(self, conversation_id: int, suggested_reply: str):
+    def update_conversation_reply(
+        self, conversation_id: int, suggested_reply: str, latency_ms: Optional[int] = None
+    ):
+        self.update_conversation_replies([(conversation_id, suggested_reply, latency_ms)])
+
+    def update_conversation_replies(self, replies: List[Tuple[int, str, Optional[int]]]):
+        """Write (conversation_id, suggested_reply, latency_ms) rows in one transaction."""
+        if not replies:
+            return
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
+            cursor.executemany(
                 """
                 UPDATE conversations
-                SET suggested_reply = ?, updated_at = CURRENT_TIMESTAMP
+                SET suggested_reply = ?, reply_latency_ms = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
                 """,
-                (suggested_reply, conversation_id),
+                [(suggested_reply, latency_ms, conversation_id) for conversation_id, suggested_reply, latency_ms in replies],
             )
             conn.commit()
 
@@ -0,0 +1,104 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+_MAGIC = b"XBF2"
+# magic, bit count, hash count, items added, highest fingerprint id synced, rows synced
+_HEADER = struct.Struct("<4sQIQQQ")
+
+
+class FingerprintBloomFilter:
+    """Bloom filter over (content_type, primary_identifier) fingerprint keys.
+
+    A miss means the key was never added, so the database lookup can be
+    skipped; a hit still has to be confirmed against content_fingerprints.
+    Every row up to `max_id` has been folded in by sync(), and `rows` counts
+    them: a warm start checks both against the table (a restored or pruned DB
+    fails the check) and then only reads rows added since.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        error_rate = min(max(error_rate, 1e-9), 0.5)
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        self.max_id = 0
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(content_type: str, primary_identifier: str) -> bytes:
+        return f"{content_type}\x1f{primary_identifier}".encode("utf-8")
+
+    def _positions(self, key: bytes) -> Iterable[int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, content_type: str, primary_identifier: str):
+        positions = list(self._positions(self._key(content_type, primary_identifier)))
+        with self._lock:
+            for position in positions:
+                self.bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def add_many(self, keys: Iterable[Tuple[str, str]]):
+        for content_type, primary_identifier in keys:
+            self.add(content_type, primary_identifier)
+
+    def sync(self, rows: Iterable[Tuple[str, str, int]]):
+        """Fold in every content_fingerprints row with id > max_id, in id order."""
+        for content_type, primary_identifier, fingerprint_id in rows:
+            self.add(content_type, primary_identifier)
+            with self._lock:
+                self.max_id = max(self.max_id, fingerprint_id)
+                self.rows += 1
+
+    def might_contain(self, content_type: str, primary_identifier: str) -> bool:
+        bits = self.bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(self._key(content_type, primary_identifier))
+        )
+
+    def estimated_error_rate(self) -> float:
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def save(self, path: str):
+        """Write the bit array atomically so a crash never leaves a torn file."""
+        target = Path(path)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        with self._lock:
+            payload = _HEADER.pack(
+                _MAGIC, self.num_bits, self.num_hashes, self.count, self.max_id, self.rows
+            ) + bytes(self.bits)
+        tmp.write_bytes(payload)
+        os.replace(tmp, target)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["FingerprintBloomFilter"]:
+        """Load a saved filter, or None if the file is missing or unreadable."""
+        try:
+            payload = Path(path).read_bytes()
+            magic, num_bits, num_hashes, count, max_id, rows = _HEADER.unpack_from(payload)
+        except (OSError, struct.error):
+            return None
+        bits = payload[_HEADER.size :]
+        if magic != _MAGIC or len(bits) != (num_bits + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bytearray(bits)
+        bloom.count = count
+        bloom.max_id = max_id
+        bloom.rows = rows
+        bloom._lock = threading.Lock()
+        return bloom
@@ -0,0 +1,184 @@
+import http.client
+import threading
+import time
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Errors that mean a kept-alive socket was closed by the server between requests.
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+# Methods safe to send twice; only these are retried on a stale socket by default.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class ConnectError(OSError):
+    """The connection could not be established, so no part of the request was sent."""
+
+
+class HTTPSConnectionPool:
+    """Keep-alive HTTPS connections to one host, shared across threads.
+
+    Up to maxsize requests run at once, each on its own connection; callers
+    beyond that wait. Idle connections are reused most-recently-used first and
+    dropped after idle_timeout seconds. An idempotent request that fails on a
+    reused socket because the server closed it is retried once on a fresh
+    connection; other methods are sent at most once (the server may already have
+    acted on them). Connection failures raise ConnectError.
+    tls=False speaks plain HTTP (local servers and mocks).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        maxsize: int = 4,
+        timeout: float = 30.0,
+        idle_timeout: float = 30.0,
+        port: Optional[int] = None,
+        tls: bool = True,
+    ):
+        self.host = host
+        self.port = port
+        self._connection_class = http.client.HTTPSConnection if tls else http.client.HTTPConnection
+        self.maxsize = max(1, maxsize)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._slots = threading.BoundedSemaphore(self.maxsize)
+        self._idle: List[Tuple[http.client.HTTPConnection, float]] = []
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._stats = {
+            "requests": 0,
+            "handshakes": 0,
+            "reused": 0,
+            "stale_reconnects": 0,
+            "handshake_ms": 0.0,
+            "peak_in_use": 0,
+        }
+
+    def _checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused). Expired idle connections are closed on the way."""
+        now = time.monotonic()
+        with self._lock:
+            self._in_use += 1
+            self._stats["peak_in_use"] = max(self._stats["peak_in_use"], self._in_use)
+            while self._idle:
+                conn, idle_since = self._idle.pop()
+                if now - idle_since <= self.idle_timeout:
+                    self._stats["reused"] += 1
+                    return conn, True
+                conn.close()
+        return self._connect(), False
+
+    def _connect(self) -> http.client.HTTPConnection:
+        conn = self._connection_class(self.host, self.port, timeout=self.timeout)
+        started = time.perf_counter()
+        try:
+            conn.connect()
+        except OSError as e:
+            conn.close()
+            raise ConnectError(f"Could not connect to {self.host}: {e}") from e
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._stats["handshakes"] += 1
+            self._stats["handshake_ms"] += elapsed_ms
+        return conn
+
+    def _checkin(self, conn: Optional[http.client.HTTPConnection]):
+        with self._lock:
+            self._in_use -= 1
+            if conn is not None:
+                self._idle.append((conn, time.monotonic()))
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        retry: Optional[bool] = None,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send one request and return (status, headers, body) with the body fully read.
+        retry: resend once on a stale reused socket (default: only for idempotent methods).
+        """
+        if retry is None:
+            retry = method.upper() in _IDEMPOTENT_METHODS
+        with self._slots:
+            with self._lock:
+                self._stats["requests"] += 1
+            conn, reused = None, False
+            try:
+                conn, reused = self._checkout()
+                try:
+                    response = self._send(conn, method, path, headers, body)
+                except _STALE_ERRORS:
+                    if not reused or not retry:
+                        raise
+                    conn.close()
+                    with self._lock:
+                        self._stats["stale_reconnects"] += 1
+                    conn = self._connect()
+                    response = self._send(conn, method, path, headers, body)
+                data = response.read()
+                keep = not response.will_close
+                status, response_headers = response.status, dict(response.getheaders())
+            except BaseException:
+                if conn is not None:
+                    conn.close()
+                self._checkin(None)
+                raise
+            if not keep:
+                conn.close()
+            self._checkin(conn if keep else None)
+            return status, response_headers, data
+
+    @staticmethod
+    def _send(conn, method, path, headers, body) -> http.client.HTTPResponse:
+        conn.request(method, path, body=body, headers=dict(headers or {}))
+        return conn.getresponse()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = len(self._idle)
+        stats["reuse_rate"] = round(stats["reused"] / stats["requests"], 3) if stats["requests"] else 0.0
+        stats["handshake_ms"] = round(stats["handshake_ms"], 1)
+        return stats
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+
+_pools: Dict[str, HTTPSConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(
+    host: str, maxsize: int = 4, port: Optional[int] = None, tls: bool = True, timeout: float = 30.0
+) -> HTTPSConnectionPool:
+    """
+    Process-wide pool per host, so every agent talking to a host shares its sockets.
+    maxsize and timeout only apply when the pool is first created.
+    """
+    key = host if port is None else f"{host}:{port}"
+    if not tls:
+        key = f"http://{key}"
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = HTTPSConnectionPool(host, maxsize=maxsize, timeout=timeout, port=port, tls=tls)
+        return pool
+
+
+def http_pool_stats() -> Dict[str, Dict[str, float]]:
+    with _pools_lock:
+        pools = dict(_pools)
+    return {host: pool.stats() for host, pool in pools.items()}
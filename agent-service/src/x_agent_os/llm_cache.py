@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from x_agent_os.config import LLM_CACHE_ENABLED, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL_SECONDS
+from x_agent_os.database import DatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+# Process-wide counters per namespace ("reviewer", "editor", "reply", ...).
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def llm_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Snapshot of hit/miss/store/error counters for every cache namespace."""
+    with _stats_lock:
+        return {namespace: dict(counters) for namespace, counters in _stats.items()}
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: Any) -> Any:
+    """
+    Canonical form of a prompt for keying: whitespace runs collapsed and the
+    ends stripped. Case, dates and ids are kept, since they can change the
+    answer. Lists and dicts are normalized element-wise.
+    """
+    if isinstance(prompt, str):
+        return _WHITESPACE.sub(" ", prompt).strip()
+    if isinstance(prompt, (list, tuple)):
+        return [normalize_prompt(part) for part in prompt]
+    if isinstance(prompt, dict):
+        return {key: normalize_prompt(value) for key, value in prompt.items()}
+    return prompt
+
+
+def _count(namespace: str, counter: str):
+    with _stats_lock:
+        counters = _stats.setdefault(namespace, {"hits": 0, "misses": 0, "stores": 0, "errors": 0})
+        counters[counter] += 1
+
+
+class CachedResponse:
+    """Stands in for a Gemini response on a cache hit (`.text` plus a non-empty `.parts`)."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.parts = [text]
+
+
+class LLMResponseCache:
+    """Content-addressed cache of Gemini responses, stored in llm_response_cache.
+
+    The key is a SHA-256 of the model name and the normalized prompt
+    (normalize_prompt), so whitespace differences still hit while any change
+    to the prompt's content is a miss. Entries expire after ttl_seconds and
+    the table is trimmed to the max_entries most recently used rows. Cache
+    failures never fail the call; they just fall through to the model. Logs go
+    through `logging`, never stdout, because run_generate_reply.py's stdout is
+    parsed as JSON by the dashboard.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseHandler,
+        namespace: str,
+        ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        enabled: bool = LLM_CACHE_ENABLED,
+        prune_every: int = 50,
+    ):
+        self.db = db
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.prune_every = max(1, prune_every)
+        self._stores = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_name: str, prompt: Any) -> str:
+        payload = json.dumps({"model": model_name, "prompt": normalize_prompt(prompt)}, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def generate(
+        self,
+        model,
+        prompt: Any,
+        refresh: bool = False,
+        accept: Optional[Callable[[str], bool]] = None,
+        **kwargs,
+    ):
+        """
+        model.generate_content(prompt, **kwargs) behind the cache. Returns either
+        the live response or a CachedResponse; both expose `.parts` and `.text`.
+        refresh=True skips the lookup but still stores the new response; accept,
+        if given, must return True for a response to be stored.
+        """
+        if not self.enabled:
+            return model.generate_content(prompt, **kwargs)
+
+        model_name = getattr(model, "model_name", type(model).__name__)
+        cache_key = self.make_key(model_name, prompt)
+        if not refresh:
+            try:
+                cached_text = self.db.get_llm_cache_entry(cache_key, self.ttl_seconds)
+            except Exception as e:
+                logger.warning("LLM cache lookup failed (%s): %s", self.namespace, e)
+                _count(self.namespace, "errors")
+                cached_text = None
+            if cached_text is not None:
+                _count(self.namespace, "hits")
+                logger.info("LLM cache hit (%s): %s", self.namespace, cache_key[:12])
+                return CachedResponse(cached_text)
+        _count(self.namespace, "misses")
+
+        response = model.generate_content(prompt, **kwargs)
+        try:
+            response_text = response.text if response.parts else ""
+        except Exception:
+            # Blocked or multi-candidate responses raise on .text; those are not worth caching.
+            response_text = ""
+        if response_text and (accept is None or accept(response_text)):
+            self._store(cache_key, model_name, response_text)
+        return response
+
+    def _store(self, cache_key: str, model_name: str, response_text: str):
+        try:
+            self.db.save_llm_cache_entry(cache_key, model_name, response_text)
+        except Exception as e:
+            logger.warning("LLM cache store failed (%s): %s", self.namespace, e)
+            _count(self.namespace, "errors")
+            return
+        _count(self.namespace, "stores")
+        with self._lock:
+            self._stores += 1
+            due = self._stores % self.prune_every == 0
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        try:
+            return self.db.prune_llm_cache(self.ttl_seconds, self.max_entries)
+        except Exception as e:
+            logger.warning("LLM cache prune failed (%s): %s", self.namespace, e)
+            return 0
@@ -1,23 +1,39 @@
+import math
 import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from x_agent_os.agents.editor_agent import EditorAgent
 from x_agent_os.agents.reviewer_agent import ReviewerAgent
 from x_agent_os.agents.search_agent import SearchAgent
 from x_agent_os.agents.twitter_agent import TwitterAgent
+from x_agent_os.config import (
+    EDITOR_BATCH_MODE,
+    FINGERPRINT_BLOOM_CAPACITY,
+    FINGERPRINT_BLOOM_ENABLED,
+    FINGERPRINT_BLOOM_ERROR_RATE,
+    FINGERPRINT_BLOOM_PATH,
+    RAPIDAPI_POOL_SIZE,
+)
 from x_agent_os.content_fingerprinting import IncrementalProcessingManager
 from x_agent_os.daily_brief import DailyBriefGenerator
 from x_agent_os.database import DatabaseHandler
+from x_agent_os.http_pool import http_pool_stats
+from x_agent_os.llm_cache import llm_cache_stats
 from x_agent_os.metrics import MetricsCollector
+from x_agent_os.persona_context import get_persona_contexts
+from x_agent_os.provider_cache import ProviderResponseCache, provider_cache_stats
 from x_agent_os.skills import SkillManager
 
 
-def _pick_query(skill_config: Dict[str, Any]) -> str:
-    queries = skill_config.get("research_queries") or []
-    if queries:
-        return queries[0]
-    return skill_config.get("description", "research topics")
+def _pick_queries(skill_config: Dict[str, Any], max_queries: int) -> List[str]:
+    queries = [query.strip() for query in skill_config.get("research_queries") or [] if query and query.strip()]
+    queries = list(dict.fromkeys(queries))[: max(1, max_queries)]
+    return queries or [skill_config.get("description", "research topics")]
 
 
 def _summarize_feature_notes(skill_config: Dict[str, Any]) -> str:
@@ -92,6 +108,44 @@ def _is_within_days(created_at: Optional[str], days: int, now: datetime) -> bool
     return parsed >= now_utc - timedelta(days=days)
 
 
+def _tweet_rank(tweet: Dict[str, Any], now: datetime) -> float:
+    """Engagement on a log scale, halved for every TWEET_RANK_HALF_LIFE_DAYS of age."""
+    engagement = (
+        (tweet.get("favorite_count") or 0)
+        + 2 * (tweet.get("retweet_count") or 0)
+        + 2 * (tweet.get("quote_count") or 0)
+        + (tweet.get("reply_count") or 0)
+    )
+    parsed = _parse_tweet_date(tweet.get("created_at"))
+    if parsed is None:
+        age_days = TWEET_RANK_HALF_LIFE_DAYS
+    else:
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        age_days = max(0.0, (now - parsed).total_seconds() / 86400)
+    return (1 + math.log1p(engagement)) * 0.5 ** (age_days / TWEET_RANK_HALF_LIFE_DAYS)
+
+
+def _interleave(batches: List[List[Any]]) -> List[Any]:
+    """Round-robin across per-query batches so every query is represented near the top."""
+    merged: List[Any] = []
+    for position in range(max((len(batch) for batch in batches), default=0)):
+        merged.extend(batch[position] for batch in batches if position < len(batch))
+    return merged
+
+
+def _dedup_by_url(items: List[Tuple[Dict[str, Any], Any]]) -> List[Tuple[Dict[str, Any], Any]]:
+    seen = set()
+    unique = []
+    for result, fingerprint in items:
+        url = result.get("url")
+        if url in seen:
+            continue
+        seen.add(url)
+        unique.append((result, fingerprint))
+    return unique
+
+
 def _clean_snippet(snippet: str) -> str:
     cleaned = re.sub(r"https?://\S+", "", snippet or "")
     cleaned = re.sub(r"\s+", " ", cleaned).strip()
@@ -110,129 +164,361 @@ def _build_suggested_reply(snippet: str, skill_name: str, reply_style: Optional[
 
 
 def _persona_context(db: DatabaseHandler, limit: int = 2, posts_limit: int = 3) -> str:
-    personas = db.list_creator_personas(active_only=True)
+    personas = get_persona_contexts(db, limit=limit, posts_limit=posts_limit)
     if not personas:
         return ""
     chunks: List[str] = ["Creator persona inspo (active):"]
-    for persona in personas[:limit]:
-        handle = persona.get("handle")
-        run = db.get_latest_creator_persona_run(handle)
-        posts = db.list_creator_persona_posts(persona["id"], limit=posts_limit)
-        chunks.append(f"- @{handle}")
-        if run and run.get("summary_json"):
-            chunks.append(f"  summary: {run['summary_json']}")
-        if posts:
-            for post in posts:
-                chunks.append(f"  hit: {post.get('content')}")
+    for persona in personas:
+        chunks.append(f"- @{persona['handle']}")
+        if persona["summary"]:
+            chunks.append(f"  summary: {persona['summary']}")
+        for content in persona["top_posts"]:
+            chunks.append(f"  hit: {content}")
     return "\n".join(chunks)
 
 
-def run_daily_pipeline(date: Optional[str] = None) -> Dict[str, Any]:
-    run_date = date or datetime.utcnow().strftime("%Y-%m-%d")
-    db = DatabaseHandler()
-    skill_manager = SkillManager(db)
-
-    skill_manager.seed_missing_skills()
-    active_skills = skill_manager.get_active_skills()
-    if not active_skills:
-        skill_manager.seed_database()
-        active_skills = skill_manager.get_active_skills()
-
-    search_agent = SearchAgent()
-    twitter_agent = TwitterAgent()
-    reviewer_agent = ReviewerAgent()
-    editor_agent = EditorAgent()
-    processor = IncrementalProcessingManager(db)
-
-    pipeline_summary = {
-        "date": run_date,
-        "skills_processed": 0,
-        "posts_created": 0,
-        "conversations_created": 0,
-    }
-
-    recency_days = 30
-    now = datetime.now(timezone.utc)
-
-    internal_skills = [skill for skill in active_skills if skill.get("type") == "internal"]
-    generation_skills = [skill for skill in active_skills if skill.get("type") != "internal"]
-    internal_context = _internal_skill_context(internal_skills)
-    persona_context = _persona_context(db)
-
-    for skill in generation_skills:
+# Max in-flight calls per external provider when skills run concurrently.
+# RapidAPI matches its keep-alive connection pool (X_AGENT_OS_RAPIDAPI_POOL_SIZE).
+DEFAULT_PROVIDER_LIMITS: Dict[str, int] = {
+    "perplexity": 2,
+    "rapidapi": RAPIDAPI_POOL_SIZE,
+    "gemini": 4,
+}
+
+
+# Seconds each fetch may run, once it holds a provider slot, before the skill
+# continues without it. A timed-out call keeps running in the background until
+# its own request timeout (PERPLEXITY_TIMEOUT_SECONDS, RAPIDAPI_TIMEOUT_SECONDS)
+# frees the slot; fetches don't record fingerprints, so its items are still new
+# next run.
+DEFAULT_FETCH_TIMEOUTS: Dict[str, float] = {
+    "perplexity": 90.0,
+    "rapidapi": 60.0,
+}
+# Seconds a fetch may wait for a provider slot, counted from submission, before
+# it is dropped without running.
+DEFAULT_FETCH_QUEUE_TIMEOUT = 180.0
+
+# research_queries fanned out per skill, and merged items handed to the
+# reviewer per source, so the prompt stays bounded however many queries run.
+DEFAULT_MAX_QUERIES_PER_SKILL = 5
+MAX_SEARCH_RESULTS_FOR_REVIEW = 20
+MAX_TWEETS_FOR_REVIEW = 20
+TWEET_RANK_HALF_LIFE_DAYS = 7.0
+
+# Per-request timeout for each editor post; a topic that exceeds it is stored
+# as an "#Error" post instead of holding up the rest of the skill.
+EDITOR_CALL_TIMEOUT_SECONDS = 120.0
+
+_EMPTY_FETCH = {"new_results": [], "duplicate_count": 0, "new_fingerprints": []}
+
+
+class _SkillRunner:
+    """Runs one generation skill end to end; safe to call from worker threads."""
+
+    def __init__(
+        self,
+        db: DatabaseHandler,
+        run_date: str,
+        provider_limits: Optional[Dict[str, int]] = None,
+        fetch_timeouts: Optional[Dict[str, float]] = None,
+        fetch_queue_timeout: float = DEFAULT_FETCH_QUEUE_TIMEOUT,
+        max_concurrency: int = 1,
+        recency_days: int = 30,
+        max_queries_per_skill: int = DEFAULT_MAX_QUERIES_PER_SKILL,
+    ):
+        self.db = db
+        self.run_date = run_date
+        self.recency_days = recency_days
+        self.max_queries_per_skill = max(1, max_queries_per_skill)
+        self.now = datetime.now(timezone.utc)
+        limits = {**DEFAULT_PROVIDER_LIMITS, **(provider_limits or {})}
+        self.limits = {name: threading.BoundedSemaphore(max(1, limit)) for name, limit in limits.items()}
+        self.fetch_timeouts = {**DEFAULT_FETCH_TIMEOUTS, **(fetch_timeouts or {})}
+        self.fetch_queue_timeout = fetch_queue_timeout
+        # One slot per (skill, query, source); the provider semaphores do the real limiting.
+        self.fetch_pool = ThreadPoolExecutor(
+            max_workers=2 * max(1, max_concurrency) * self.max_queries_per_skill, thread_name_prefix="fetch"
+        )
+        self.search_agent = SearchAgent(call_limiter=self.limits["perplexity"])
+        self.twitter_agent = TwitterAgent(call_limiter=self.limits["rapidapi"])
+        self.reviewer_agent = ReviewerAgent()
+        # The editor fans topics out itself; it shares the gemini semaphore per call
+        # so one skill's topics cannot starve the other skills' reviewer calls.
+        self.editor_agent = EditorAgent(
+            max_workers=max(1, limits["gemini"]),
+            call_timeout=EDITOR_CALL_TIMEOUT_SECONDS,
+            call_limiter=self.limits["gemini"],
+            batch_mode=EDITOR_BATCH_MODE,
+        )
+        self.processor = IncrementalProcessingManager(db)
+        self.internal_context = ""
+        self.persona_context = ""
+        # Set once the previously started job has merged; see start().
+        self._previous_merge: Optional[threading.Event] = None
+
+    def start(self, skill: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create the session + processing run up front so ids follow skill order.
+        Jobs also merge in start order: fetches overlap, but fingerprints are
+        recorded skill by skill, so which skill keeps a shared item does not
+        depend on which fetch finished first.
+        """
         skill_config = skill["config_json"]
-        skill_slug = skill["slug"]
-        skill_name = skill["name"]
-        query = _recency_query(_pick_query(skill_config), recency_days)
-
-        session_name = f"{run_date} - {skill_slug} - daily run"
-        session_id = db.create_session(
-            session_name=session_name,
-            topic=query,
-            app_name=skill_name,
+        queries = [
+            _recency_query(query, self.recency_days)
+            for query in _pick_queries(skill_config, self.max_queries_per_skill)
+        ]
+        session_id = self.db.create_session(
+            session_name=f"{self.run_date} - {skill['slug']} - daily run",
+            topic=" | ".join(queries),
+            app_name=skill["name"],
             app_description=skill_config.get("description"),
         )
+        processing_run_id = self.db.create_processing_run(self.run_date, session_id)
+        merge_after, self._previous_merge = self._previous_merge, threading.Event()
+        return {
+            "skill": skill,
+            "queries": queries,
+            "session_id": session_id,
+            "processing_run_id": processing_run_id,
+            "merge_after": merge_after,
+            "merged": self._previous_merge,
+        }
+
+    def _timed_call(self, provider: str, slot: Dict[str, Any], fn, *args, **kwargs):
+        """
+        Run fn under the provider's semaphore, recording in slot["at"] when it got
+        a slot. Gives up after fetch_queue_timeout without a slot, and never starts
+        fn once the caller has abandoned the fetch.
+        """
+        limit = self.limits[provider]
+        if not limit.acquire(timeout=self.fetch_queue_timeout):
+            raise TimeoutError(f"no {provider} slot within {self.fetch_queue_timeout}s")
+        try:
+            if slot["abandoned"]:
+                raise TimeoutError("abandoned while queued")
+            started = slot["at"] = time.perf_counter()
+            result = fn(*args, **kwargs)
+        finally:
+            limit.release()
+        return result, int((time.perf_counter() - started) * 1000)
+
+    def fetch(self, queries: List[str], session_id: int) -> Dict[str, Any]:
+        """
+        Fan every query out to Perplexity and RapidAPI at once and join before
+        review. Each fetch gets fetch_timeouts[source] from the moment it holds
+        a provider slot, and may queue for a slot for fetch_queue_timeout from
+        submission; fetches past either deadline are dropped. Results are
+        collected as they finish, so one slow source never holds up the other.
+        Fetches never record fingerprints, so a dropped fetch's items stay unseen
+        for the next run.
+        """
+        # With several queries in one session the per-session result cache would
+        # hand query 2 the rows query 1 just saved.
+        use_session_cache = len(queries) == 1
+        calls = {
+            "perplexity": lambda query: (
+                self.search_agent.search_incremental,
+                (query, session_id, use_session_cache),
+                {"record_fingerprints": False},
+            ),
+            "rapidapi": lambda query: (
+                self.twitter_agent.search_tweets_incremental,
+                (query,),
+                {"session_id": session_id, "use_session_cache": use_session_cache, "record_fingerprints": False},
+            ),
+        }
+        submitted = time.perf_counter()
+        pending = []
+        for provider, call in calls.items():
+            for index, query in enumerate(queries):
+                fn, args, kwargs = call(query)
+                slot = {"at": None, "abandoned": False}
+                future = self.fetch_pool.submit(self._timed_call, provider, slot, fn, *args, **kwargs)
+                pending.append((provider, index, query, future, slot))
+
+        results: Dict[str, List[Dict[str, Any]]] = {provider: [_EMPTY_FETCH] * len(queries) for provider in calls}
+        latencies: Dict[str, int] = {provider: 0 for provider in calls}
+        degraded: List[str] = []
+        while pending:
+            now = time.perf_counter()
+            waiting = []
+            for entry in pending:
+                provider, index, query, future, slot = entry
+                started = slot["at"]
+                if started is not None:
+                    deadline = started + self.fetch_timeouts[provider]
+                else:
+                    deadline = submitted + self.fetch_queue_timeout
+                if future.done():
+                    try:
+                        result, latency = future.result()
+                    except Exception as e:
+                        print(f"⚠️  {provider} fetch for '{query}' failed: {e}; continuing without it")
+                        result, latency = _EMPTY_FETCH, int((now - (started or submitted)) * 1000)
+                        degraded.append(provider)
+                elif now >= deadline:
+                    slot["abandoned"] = True
+                    if started is None:
+                        print(f"⚠️  {provider} fetch for '{query}' got no slot within {self.fetch_queue_timeout}s; continuing without it")
+                    else:
+                        print(f"⚠️  {provider} fetch for '{query}' timed out after {self.fetch_timeouts[provider]}s; continuing without it")
+                    result, latency = _EMPTY_FETCH, int((now - (started or submitted)) * 1000)
+                    degraded.append(provider)
+                else:
+                    waiting.append((entry, deadline))
+                    continue
+                results[provider][index] = result
+                latencies[provider] = max(latencies[provider], latency)
+            pending = [entry for entry, _ in waiting]
+            if waiting:
+                next_deadline = min(deadline for _, deadline in waiting)
+                wait_futures(
+                    [entry[3] for entry in pending],
+                    timeout=max(0.0, next_deadline - time.perf_counter()),
+                    return_when=FIRST_COMPLETED,
+                )
+        return {
+            "search": results["perplexity"],
+            "twitter": results["rapidapi"],
+            "fetch_stats": {
+                "search_latency_ms": latencies["perplexity"],
+                "twitter_latency_ms": latencies["rapidapi"],
+                "degraded_sources": ",".join(dict.fromkeys(degraded)) or None,
+            },
+        }
+
+    def merge(self, fetched: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge per-query results into one bounded, ranked set for the reviewer.
+        Search results keep query order, interleaved; tweets are ranked by
+        engagement and recency. Fetches leave fingerprints unrecorded, so the
+        kept items and the tweets outside the recency window (which will only
+        get older) are recorded as seen here; in-window items past the caps stay
+        eligible for a later run. Items an earlier skill already recorded are
+        dropped as duplicates.
+        """
+        search_items = _dedup_by_url(
+            _interleave(
+                [list(zip(r.get("new_results", []), r.get("new_fingerprints", []))) for r in fetched["search"]]
+            )
+        )
+        tweet_items = []
+        stale_fingerprints = []
+        for r in fetched["twitter"]:
+            for tweet, fingerprint in zip(r.get("new_results", []), r.get("new_fingerprints", [])):
+                if _is_within_days(tweet.get("created_at"), self.recency_days, self.now):
+                    tweet_items.append((tweet, fingerprint))
+                else:
+                    stale_fingerprints.append(fingerprint)
+        tweet_items = _dedup_by_url(tweet_items)
+        tweet_items.sort(key=lambda item: _tweet_rank(item[0], self.now), reverse=True)
+        kept_search = search_items[:MAX_SEARCH_RESULTS_FOR_REVIEW]
+        kept_tweets = tweet_items[:MAX_TWEETS_FOR_REVIEW]
+        inserted = self.processor.record_fingerprints(
+            [fingerprint for _, fingerprint in kept_search + kept_tweets] + stale_fingerprints
+        )
 
-        processing_run_id = db.create_processing_run(run_date, session_id)
+        def recorded(items):
+            return [
+                (result, inserted[key])
+                for result, fingerprint in items
+                if (key := (fingerprint["content_type"], fingerprint["primary_identifier"])) in inserted
+            ]
 
-        search_result = search_agent.search_incremental(query, session_id)
-        twitter_result = twitter_agent.search_tweets_incremental(query, session_id=session_id)
+        kept_count = len(kept_search) + len(kept_tweets)
+        kept_search, kept_tweets = recorded(kept_search), recorded(kept_tweets)
+        lost_races = kept_count - len(kept_search) - len(kept_tweets)
+        return {
+            "new_search_count": len(search_items),
+            "new_tweet_count": len(tweet_items),
+            "search": [result for result, _ in kept_search],
+            "tweets": [tweet for tweet, _ in kept_tweets],
+            "fingerprint_ids": [fid for _, fid in kept_search + kept_tweets],
+            "duplicate_count": sum(r.get("duplicate_count", 0) for r in fetched["search"] + fetched["twitter"])
+            + lost_races,
+        }
+
+    def close(self):
+        self.fetch_pool.shutdown(wait=False)
+
+    def run(self, job: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Run one started job. A skill that raises has its processing run marked
+        failed and counts as not processed, so no row is left in "running" and
+        the other skills carry on.
+        """
+        try:
+            return self._run(job)
+        except Exception as e:
+            print(f"❌ Skill '{job['skill']['slug']}' failed: {e}")
+            self.db.update_processing_run(job["processing_run_id"], status="failed")
+            return {"skills_processed": 0, "posts_created": 0, "conversations_created": 0}
+        finally:
+            job["merged"].set()
+
+    def _run(self, job: Dict[str, Any]) -> Dict[str, int]:
+        db = self.db
+        skill = job["skill"]
+        queries = job["queries"]
+        session_id = job["session_id"]
+        processing_run_id = job["processing_run_id"]
+        skill_config = skill["config_json"]
+        skill_slug = skill["slug"]
+        skill_name = skill["name"]
 
-        new_search = search_result.get("new_results", [])
-        new_tweets = twitter_result.get("new_results", [])
-        recent_tweets = [
-            tweet
-            for tweet in new_tweets
-            if _is_within_days(tweet.get("created_at"), recency_days, now)
-        ]
-        duplicate_count = search_result.get("duplicate_count", 0) + twitter_result.get("duplicate_count", 0)
-        new_fingerprint_ids: List[int] = []
-        new_fingerprint_ids.extend(search_result.get("new_fingerprint_ids", []))
-        new_fingerprint_ids.extend(twitter_result.get("new_fingerprint_ids", []))
+        fetched = self.fetch(queries, session_id)
+        fetch_stats = fetched["fetch_stats"]
+        if job["merge_after"] is not None:
+            job["merge_after"].wait()
+        try:
+            merged = self.merge(fetched)
+        finally:
+            job["merged"].set()
+        new_search = merged["search"]
+        recent_tweets = merged["tweets"]
+        duplicate_count = merged["duplicate_count"]
+        new_fingerprint_ids = merged["fingerprint_ids"]
 
         combined = new_search + recent_tweets
         if not combined:
             db.update_processing_run(
                 processing_run_id,
-                new_search_results=len(new_search),
-                new_tweets=len(recent_tweets),
+                new_search_results=merged["new_search_count"],
+                new_tweets=merged["new_tweet_count"],
                 duplicates_skipped=duplicate_count,
                 content_generated=0,
                 status="completed_no_new_content",
+                **fetch_stats,
+            )
+            return {"skills_processed": 0, "posts_created": 0, "conversations_created": 0}
+
+        skill_context = "\n\n".join(
+            filter(
+                None,
+                [
+                    _summarize_feature_notes(skill_config),
+                    self.persona_context,
+                    self.internal_context,
+                ],
             )
-            continue
-
-        reviewer_output = reviewer_agent.review_and_distill(
-            combined,
-            skill_name,
-            skill_config.get("description", ""),
-            "\n\n".join(
-                filter(
-                    None,
-                    [
-                        _summarize_feature_notes(skill_config),
-                        persona_context,
-                        internal_context,
-                    ],
-                )
-            ),
-            session_id,
         )
 
-        editor_outputs = editor_agent.craft_posts(
+        with self.limits["gemini"]:
+            reviewer_output = self.reviewer_agent.review_and_distill(
+                combined,
+                skill_name,
+                skill_config.get("description", ""),
+                skill_context,
+                session_id,
+            )
+
+        editor_outputs = self.editor_agent.craft_posts(
             reviewer_output,
             skill_name,
             skill_config.get("description", ""),
-            "\n\n".join(
-                filter(
-                    None,
-                    [
-                        _summarize_feature_notes(skill_config),
-                        persona_context,
-                        internal_context,
-                    ],
-                )
-            ),
+            skill_context,
             session_id,
         )
 
@@ -273,20 +559,101 @@ def run_daily_pipeline(date: Optional[str] = None) -> Dict[str, Any]:
             created_conversations += 1
 
         if new_fingerprint_ids:
-            processor.mark_content_as_processed(new_fingerprint_ids)
+            self.processor.mark_content_as_processed(new_fingerprint_ids)
 
         db.update_processing_run(
             processing_run_id,
-            new_search_results=len(new_search),
-            new_tweets=len(recent_tweets),
+            new_search_results=merged["new_search_count"],
+            new_tweets=merged["new_tweet_count"],
             duplicates_skipped=duplicate_count,
             content_generated=created_posts,
             status="completed",
+            **fetch_stats,
+        )
+        return {
+            "skills_processed": 1,
+            "posts_created": created_posts,
+            "conversations_created": created_conversations,
+        }
+
+
+def run_daily_pipeline(
+    date: Optional[str] = None,
+    max_concurrency: int = 1,
+    provider_limits: Optional[Dict[str, int]] = None,
+    fetch_timeouts: Optional[Dict[str, float]] = None,
+    max_queries_per_skill: int = DEFAULT_MAX_QUERIES_PER_SKILL,
+) -> Dict[str, Any]:
+    """Run every active generation skill, then write the daily brief.
+
+    With max_concurrency > 1 skills run on a bounded thread pool; calls to each
+    external provider are still capped by provider_limits (see
+    DEFAULT_PROVIDER_LIMITS). Sessions and processing runs are created in skill
+    order before any work starts, so their rows match the sequential mode; a
+    skill that fails has its run marked "failed" and the rest still run.
+    Fetches overlap, but skills merge and record fingerprints in skill order.
+    Within a skill, up to max_queries_per_skill research_queries are sent to
+    Perplexity and RapidAPI concurrently; a source that exceeds its
+    fetch_timeouts entry is skipped for that skill. Results are merged,
+    deduplicated and ranked before review (see _SkillRunner.merge).
+    """
+    run_date = date or datetime.utcnow().strftime("%Y-%m-%d")
+    db = DatabaseHandler()
+    if FINGERPRINT_BLOOM_ENABLED:
+        db.enable_fingerprint_filter(
+            capacity=FINGERPRINT_BLOOM_CAPACITY,
+            error_rate=FINGERPRINT_BLOOM_ERROR_RATE,
+            path=FINGERPRINT_BLOOM_PATH,
         )
+    skill_manager = SkillManager(db)
+
+    skill_manager.seed_missing_skills()
+    active_skills = skill_manager.get_active_skills()
+    if not active_skills:
+        skill_manager.seed_database()
+        active_skills = skill_manager.get_active_skills()
+
+    runner = _SkillRunner(
+        db,
+        run_date,
+        provider_limits=provider_limits,
+        fetch_timeouts=fetch_timeouts,
+        max_concurrency=max_concurrency,
+        max_queries_per_skill=max_queries_per_skill,
+    )
+
+    pipeline_summary = {
+        "date": run_date,
+        "skills_processed": 0,
+        "posts_created": 0,
+        "conversations_created": 0,
+    }
 
-        pipeline_summary["skills_processed"] += 1
-        pipeline_summary["posts_created"] += created_posts
-        pipeline_summary["conversations_created"] += created_conversations
+    internal_skills = [skill for skill in active_skills if skill.get("type") == "internal"]
+    generation_skills = [skill for skill in active_skills if skill.get("type") != "internal"]
+    runner.internal_context = _internal_skill_context(internal_skills)
+    runner.persona_context = _persona_context(db)
+
+    try:
+        if max_concurrency <= 1:
+            skill_summaries = [runner.run(runner.start(skill)) for skill in generation_skills]
+        else:
+            jobs = [runner.start(skill) for skill in generation_skills]
+            with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="skill") as pool:
+                skill_summaries = list(pool.map(runner.run, jobs))
+    finally:
+        runner.close()
+
+    for skill_summary in skill_summaries:
+        for key, value in skill_summary.items():
+            pipeline_summary[key] += value
+
+    if FINGERPRINT_BLOOM_ENABLED:
+        db.save_fingerprint_filter()
+    print(f"📊 LLM cache: {llm_cache_stats()}")
+    print(f"📊 Provider cache: {provider_cache_stats()}")
+    print(f"📊 HTTP pools: {http_pool_stats()}")
+    ProviderResponseCache(db, "all").prune()
 
     DailyBriefGenerator(db).generate_and_save(run_date)
     return pipeline_summary
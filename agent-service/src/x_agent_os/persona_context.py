@@ -0,0 +1,56 @@
+import threading
+from typing import Any, Dict, List, Tuple
+
+from x_agent_os.database import DatabaseHandler
+
+# Top posts kept per snapshot; readers slice down to what they need.
+SNAPSHOT_TOP_POSTS = 5
+
+# Per database file: (creator_persona_context_version, contexts of active personas, newest first).
+_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+_cache_lock = threading.Lock()
+
+
+def _build_context(db: DatabaseHandler, persona: Dict[str, Any]) -> Dict[str, Any]:
+    run = db.get_latest_creator_persona_run(persona["handle"])
+    posts = db.list_creator_persona_posts(persona["id"], limit=SNAPSHOT_TOP_POSTS)
+    return {
+        "handle": persona["handle"],
+        "summary": run.get("summary_json") if run else None,
+        "top_posts": [post.get("content") for post in posts],
+    }
+
+
+def _load(db: DatabaseHandler) -> List[Dict[str, Any]]:
+    """Stored snapshots for active personas, rebuilding (and saving) any that are behind their persona."""
+    contexts = []
+    for persona in db.list_persona_context_snapshots():
+        context = persona["context_json"]
+        if context is None or persona["snapshot_version"] != persona["context_version"]:
+            context = _build_context(db, persona)
+            # Saved under the version read before building: a write that lands meanwhile
+            # bumps context_version again, so the next reader rebuilds rather than trusting this.
+            db.save_persona_context_snapshot(persona["id"], persona["context_version"], context)
+        contexts.append(context)
+    return contexts
+
+
+def get_persona_contexts(db: DatabaseHandler, limit: int = 2, posts_limit: int = 3) -> List[Dict[str, Any]]:
+    """
+    {"handle", "summary", "top_posts"} for the first `limit` active personas. Served from
+    a process-level copy while creator_persona_context_version is unchanged (one row
+    lookup); otherwise reloaded from the materialized snapshots.
+    """
+    version = db.get_persona_context_version()
+    with _cache_lock:
+        cached = _cache.get(db.db_path)
+    if cached is None or cached[0] != version:
+        contexts = _load(db)
+        with _cache_lock:
+            _cache[db.db_path] = (version, contexts)
+    else:
+        contexts = cached[1]
+    return [
+        {"handle": context["handle"], "summary": context["summary"], "top_posts": context["top_posts"][:posts_limit]}
+        for context in contexts[:limit]
+    ]
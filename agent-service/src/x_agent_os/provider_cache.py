@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from x_agent_os.config import (
+    PROVIDER_CACHE_BUCKET_SECONDS,
+    PROVIDER_CACHE_ENABLED,
+    PROVIDER_CACHE_STALE_SECONDS,
+    PROVIDER_CACHE_TTL_SECONDS,
+)
+from x_agent_os.database import DatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+# Process-wide counters per provider ("perplexity", "rapidapi").
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+# Keys with a background revalidation in flight, so a stale entry is refreshed once.
+_revalidating: Set[str] = set()
+_revalidating_lock = threading.Lock()
+
+
+def provider_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Snapshot of hit/stale/miss/store/error counters for every provider."""
+    with _stats_lock:
+        return {provider: dict(counters) for provider, counters in _stats.items()}
+
+
+def _count(provider: str, counter: str):
+    with _stats_lock:
+        counters = _stats.setdefault(
+            provider, {"hits": 0, "stale_hits": 0, "misses": 0, "stores": 0, "revalidations": 0, "errors": 0}
+        )
+        counters[counter] += 1
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+class ProviderResponseCache:
+    """Raw provider payloads keyed by (provider, normalized query, params, time bucket).
+
+    An entry younger than ttl_seconds is served as is. Up to stale_seconds past
+    that it is still served, and a background thread refetches it once
+    (stale-while-revalidate), holding revalidate_limiter (the provider's call
+    semaphore) if given so refreshes count against the provider limit. Older
+    entries, and any entry from an earlier time bucket, are misses. The loader returns the raw payload text, or None
+    for responses that must not be cached (errors, rate limits).
+    """
+
+    def __init__(
+        self,
+        db: DatabaseHandler,
+        provider: str,
+        ttl_seconds: float = PROVIDER_CACHE_TTL_SECONDS,
+        stale_seconds: float = PROVIDER_CACHE_STALE_SECONDS,
+        bucket_seconds: int = PROVIDER_CACHE_BUCKET_SECONDS,
+        enabled: bool = PROVIDER_CACHE_ENABLED,
+        revalidate_limiter: Optional[threading.Semaphore] = None,
+    ):
+        self.db = db
+        self.provider = provider
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.bucket_seconds = max(1, bucket_seconds)
+        self.enabled = enabled
+        self.revalidate_limiter = revalidate_limiter
+
+    def make_key(self, query: str, params: Dict[str, Any], now: Optional[float] = None) -> Tuple[str, int, str]:
+        """Return (cache_key, time_bucket, params_json) for a request."""
+        bucket = int((now if now is not None else time.time()) // self.bucket_seconds)
+        params_json = json.dumps(params, sort_keys=True, default=str)
+        payload = "\x1f".join([self.provider, normalize_query(query), params_json, str(bucket)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest(), bucket, params_json
+
+    def fetch(
+        self, query: str, params: Dict[str, Any], loader: Callable[[], Optional[str]]
+    ) -> Tuple[Optional[str], Optional[str], str]:
+        """
+        Return (raw_response, cache_key, status) where status is "hit", "stale",
+        "miss" or "disabled". cache_key is None when nothing was cached.
+        """
+        if not self.enabled:
+            return loader(), None, "disabled"
+
+        cache_key, bucket, params_json = self.make_key(query, params)
+        try:
+            entry = self.db.get_provider_response(cache_key)
+        except Exception as e:
+            logger.warning("Provider cache lookup failed (%s): %s", self.provider, e)
+            _count(self.provider, "errors")
+            entry = None
+
+        if entry:
+            age = time.time() - entry["fetched_at"]
+            if age <= self.ttl_seconds:
+                _count(self.provider, "hits")
+                return entry["raw_response"], cache_key, "hit"
+            if age <= self.ttl_seconds + self.stale_seconds:
+                _count(self.provider, "stale_hits")
+                self._revalidate(cache_key, query, params_json, bucket, loader)
+                return entry["raw_response"], cache_key, "stale"
+
+        _count(self.provider, "misses")
+        raw_response = loader()
+        if raw_response is None:
+            return None, None, "miss"
+        if not self._store(cache_key, query, params_json, bucket, raw_response):
+            return raw_response, None, "miss"
+        return raw_response, cache_key, "miss"
+
+    def _store(self, cache_key: str, query: str, params_json: str, bucket: int, raw_response: str) -> bool:
+        try:
+            self.db.save_provider_response(
+                cache_key, self.provider, normalize_query(query), params_json, bucket, raw_response
+            )
+        except Exception as e:
+            logger.warning("Provider cache store failed (%s): %s", self.provider, e)
+            _count(self.provider, "errors")
+            return False
+        _count(self.provider, "stores")
+        return True
+
+    def _revalidate(
+        self, cache_key: str, query: str, params_json: str, bucket: int, loader: Callable[[], Optional[str]]
+    ):
+        with _revalidating_lock:
+            if cache_key in _revalidating:
+                return
+            _revalidating.add(cache_key)
+
+        def load():
+            if self.revalidate_limiter is None:
+                return loader()
+            with self.revalidate_limiter:
+                return loader()
+
+        def refresh():
+            try:
+                raw_response = load()
+                if raw_response is not None and self._store(cache_key, query, params_json, bucket, raw_response):
+                    _count(self.provider, "revalidations")
+            except Exception as e:
+                logger.warning("Provider cache revalidation failed (%s): %s", self.provider, e)
+                _count(self.provider, "errors")
+            finally:
+                with _revalidating_lock:
+                    _revalidating.discard(cache_key)
+
+        threading.Thread(target=refresh, name=f"revalidate-{self.provider}", daemon=True).start()
+
+    def prune(self) -> int:
+        """Drop unreferenced payloads that can no longer be served."""
+        try:
+            return self.db.prune_provider_cache(self.bucket_seconds + self.ttl_seconds + self.stale_seconds)
+        except Exception as e:
+            logger.warning("Provider cache prune failed (%s): %s", self.provider, e)
+            return 0
@@ -0,0 +1,137 @@
+import json
+import logging
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from x_agent_os.agents.reply_agent import ReplyAgent
+from x_agent_os.config import REPLY_WORKER_CONCURRENCY, REPLY_WORKER_HOST, REPLY_WORKER_PORT
+from x_agent_os.database import DatabaseHandler
+from x_agent_os.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_GENERATE_PATH = re.compile(r"^/conversations/(\d+)/generate/?$")
+
+
+class ReplyWorker:
+    """One warm ReplyAgent (Gemini client, DB handle) shared by every request.
+
+    Requests are served on their own threads; at most `concurrency` model calls
+    run at once and the rest wait their turn. Concurrent requests for the same
+    conversation (double clicks) share one generation.
+    """
+
+    def __init__(self, agent: Optional[ReplyAgent] = None, concurrency: int = REPLY_WORKER_CONCURRENCY):
+        self.agent = agent or ReplyAgent(DatabaseHandler())
+        self._slots = threading.BoundedSemaphore(max(1, concurrency))
+        self._flights = SingleFlight(remember=False)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "coalesced": 0, "errors": 0, "in_flight": 0}
+
+    def _count(self, counter: str, delta: int = 1):
+        with self._lock:
+            self.stats[counter] += delta
+
+    def generate(self, conversation_id: int, refresh: bool = False) -> str:
+        self._count("requests")
+
+        def run() -> str:
+            with self._slots:
+                self._count("in_flight")
+                try:
+                    return self.agent.generate_reply_for_conversation(conversation_id, refresh=refresh)
+                finally:
+                    self._count("in_flight", -1)
+
+        try:
+            reply, shared = self._flights.do((conversation_id, refresh), run)
+        except Exception:
+            self._count("errors")
+            raise
+        if shared:
+            self._count("coalesced")
+        return reply
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "XAgentOSReplyWorker/1.0"
+    worker: ReplyWorker
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}, None
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            return None, f"Invalid JSON body: {e}"
+        if not isinstance(payload, dict):
+            return None, "JSON body must be an object"
+        return payload, None
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/health":
+            self._send_json(200, {"ok": True, "stats": self.worker.snapshot()})
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        match = _GENERATE_PATH.match(self.path)
+        if not match:
+            self._send_json(404, {"error": "Not found"})
+            return
+        payload, error = self._read_json()
+        if error:
+            self._send_json(400, {"error": error})
+            return
+
+        conversation_id = int(match.group(1))
+        started = time.perf_counter()
+        try:
+            reply = self.worker.generate(conversation_id, refresh=payload.get("refresh") is True)
+        except ValueError as e:  # Unknown conversation
+            self._send_json(404, {"error": str(e)})
+            return
+        except Exception as e:
+            logger.exception("Reply generation failed for conversation %s", conversation_id)
+            self._send_json(500, {"error": "Failed to generate reply.", "detail": str(e)})
+            return
+        latency_ms = int((time.perf_counter() - started) * 1000)
+        logger.info("Generated reply for conversation %s in %d ms", conversation_id, latency_ms)
+        self._send_json(200, {"reply": reply, "latency_ms": latency_ms})
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def serve(host: str = REPLY_WORKER_HOST, port: int = REPLY_WORKER_PORT, worker: Optional[ReplyWorker] = None):
+    """
+    Serve reply generation over localhost HTTP until interrupted:
+      POST /conversations/<id>/generate  {"refresh": false} -> {"reply": "...", "latency_ms": 1234}
+      GET  /health
+    """
+    handler = type("ReplyWorkerHandler", (_Handler,), {"worker": worker or ReplyWorker()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    logger.info("Reply worker listening on http://%s:%d", host, server.server_address[1])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
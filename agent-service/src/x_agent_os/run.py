@@ -1,6 +1,6 @@
 import argparse
 
-from x_agent_os.orchestrator import run_daily_pipeline, run_metrics_update
+from x_agent_os.orchestrator import DEFAULT_MAX_QUERIES_PER_SKILL, run_daily_pipeline, run_metrics_update
 
 
 def main():
@@ -9,18 +9,42 @@ def main():
 
     daily_parser = subparsers.add_parser("daily", help="Run daily pipeline + brief")
     daily_parser.add_argument("--date", help="Override date YYYY-MM-DD", default=None)
+    daily_parser.add_argument(
+        "--max-concurrency", type=int, default=1, help="Skills to run in parallel (1 = sequential)"
+    )
+    daily_parser.add_argument(
+        "--max-queries", type=int, default=DEFAULT_MAX_QUERIES_PER_SKILL, help="research_queries fanned out per skill"
+    )
 
     metrics_parser = subparsers.add_parser("metrics", help="Run metrics update")
     metrics_parser.add_argument("--days", type=int, default=14)
 
+    replies_parser = subparsers.add_parser("replies", help="Generate replies for pending conversations")
+    replies_parser.add_argument("--max-workers", type=int, default=4, help="Concurrent Gemini calls")
+    replies_parser.add_argument("--all", action="store_true", help="Regenerate conversations that already have a reply")
+    replies_parser.add_argument("--refresh", action="store_true", help="Bypass the LLM response cache")
+
     args = parser.parse_args()
 
     if args.command == "daily":
-        result = run_daily_pipeline(date=args.date)
+        result = run_daily_pipeline(
+            date=args.date, max_concurrency=args.max_concurrency, max_queries_per_skill=args.max_queries
+        )
         print(f"Daily pipeline complete: {result}")
     elif args.command == "metrics":
         result = run_metrics_update(days=args.days)
         print(f"Metrics update complete: {result}")
+    elif args.command == "replies":
+        from x_agent_os.agents.reply_agent import ReplyAgent
+
+        results = ReplyAgent().generate_replies_batch(
+            max_workers=args.max_workers, refresh=args.refresh, include_existing=args.all
+        )
+        for result in results:
+            status = f"error: {result['error']}" if result["error"] else "ok"
+            print(f"Conversation {result['conversation_id']}: {status} ({result['latency_ms']} ms)")
+        failed = sum(1 for result in results if result["error"])
+        print(f"Reply batch complete: {len(results) - failed} generated, {failed} failed")
 
 
 if __name__ == "__main__":
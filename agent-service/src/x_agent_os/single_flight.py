@@ -0,0 +1,74 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapse identical calls so one network request serves every caller.
+
+    The first caller for a key runs fn; callers arriving while it is in flight
+    wait and share its result (or its exception). With remember=True a
+    successful result is also kept for later callers until forget() is called,
+    so the owner's lifetime (one pipeline run) bounds how long it is reused.
+    Failures are never remembered.
+    """
+
+    def __init__(self, remember: bool = True):
+        self.remember = remember
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._done: Dict[Hashable, Any] = {}
+        self.stats = {"calls": 0, "coalesced": 0}
+
+    def do(
+        self, key: Hashable, fn: Callable[[], Any], remember_if: Optional[Callable[[Any], bool]] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Return (result, shared); shared is True when another caller's call was reused.
+        remember_if can veto keeping a result (e.g. an empty response from a failed request).
+        """
+        with self._lock:
+            if key in self._done:
+                self.stats["coalesced"] += 1
+                return self._done[key], True
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.stats["calls"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None and self.remember and (remember_if is None or remember_if(call.result)):
+                    self._done[key] = call.result
+            call.event.set()
+        return call.result, False
+
+    def forget(self, key: Optional[Hashable] = None):
+        """Drop one remembered result, or all of them."""
+        with self._lock:
+            if key is None:
+                self._done.clear()
+            else:
+                self._done.pop(key, None)
@@ -0,0 +1,154 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError: # Optional: faster decoding when installed, same results either way
+    orjson = None
+
+_EMPTY: Dict[str, Any] = {}
+
+
+def loads(raw: Union[str, bytes]) -> Any:
+    """Decode a JSON payload with orjson when available, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dig(node: Any, *keys: str) -> Any:
+    """Follow keys through nested dicts; None as soon as a level is missing or not a dict."""
+    for key in keys:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def _tweet_result(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The tweet_results.result of a TimelineModule item or TimelineAddEntries entry, if it has one."""
+    item_content = entry.get('itemContent')
+    if item_content:
+        result = _dig(item_content, 'tweet_results', 'result')
+        if result:
+            return result
+    content = entry.get('content')
+    if not content:
+        return None
+    return (
+        _dig(content, 'itemContent', 'tweet_results', 'result')
+        or _dig(content, 'tweet_results', 'result')
+        or _dig(content, 'tweet', 'tweet_results', 'result')
+    )
+
+
+def _tweet_item(tweet_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Flatten a Tweet result into the dict stored in twitter_results, or None if it has no id/author."""
+    if tweet_result.get('__typename') != 'Tweet':
+        return None
+    legacy = tweet_result.get('legacy') or _EMPTY
+    tweet_id = legacy.get('id_str')
+    if not tweet_id:
+        return None
+
+    user_result = _dig(tweet_result, 'core', 'user_results', 'result') or _EMPTY
+    if user_result.get('core'): # Current API: screen_name moved to core, counts stay in legacy
+        screen_name = user_result['core'].get('screen_name', 'unknown_user')
+        user_legacy = user_result.get('legacy') or _EMPTY
+    elif user_result.get('legacy'):
+        user_legacy = user_result['legacy']
+        screen_name = user_legacy.get('screen_name', 'unknown_user')
+    else: # Some tweet types (e.g. community tweets) carry the author under user
+        user_legacy = _dig(tweet_result, 'user', 'result', 'legacy') or _EMPTY
+        screen_name = user_legacy.get('screen_name', 'unknown_user')
+    if screen_name == 'unknown_user':
+        return None
+
+    return {
+        "url": f"https://twitter.com/{screen_name}/status/{tweet_id}",
+        "snippet": legacy.get('full_text', 'No text available'),
+        "screen_name": screen_name,
+        "followers_count": user_legacy.get('followers_count', 0),
+        "created_at": legacy.get('created_at', 'N/A'),
+        "favorite_count": legacy.get('favorite_count', 0),
+        "quote_count": legacy.get('quote_count', 0),
+        "reply_count": legacy.get('reply_count', 0),
+        "retweet_count": legacy.get('retweet_count', 0)
+    }
+
+
+def _is_bottom_cursor(entry: Dict[str, Any]) -> bool:
+    content = entry.get('content') or _EMPTY
+    return content.get('cursorType') == 'Bottom' or entry.get('entryId', '').startswith('cursor-bottom')
+
+
+def _global_object_tweets(response_json: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Older globalObjects payload shape: tweets and users keyed by id."""
+    global_objects = response_json.get('globalObjects') or _EMPTY
+    users = global_objects.get('users') or _EMPTY
+    tweets = []
+    for tweet_id, tweet_data in (global_objects.get('tweets') or _EMPTY).items():
+        user_info = users.get(tweet_data.get('user_id_str')) or _EMPTY
+        screen_name = user_info.get('screen_name', 'unknown_user')
+        tweets.append({
+            "url": f"https://twitter.com/{screen_name}/status/{tweet_id}",
+            "snippet": tweet_data.get('full_text', tweet_data.get('text', 'No text available')),
+            "screen_name": screen_name,
+            "followers_count": user_info.get('followers_count', 0),
+            "created_at": tweet_data.get('created_at', 'N/A'),
+            "favorite_count": tweet_data.get('favorite_count', 0),
+            "quote_count": tweet_data.get('quote_count', 0),
+            "reply_count": tweet_data.get('reply_count', 0),
+            "retweet_count": tweet_data.get('retweet_count', 0)
+        })
+    return tweets
+
+
+def parse_search_timeline(response_json: Any) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Extract (tweets, bottom_cursor) from a decoded search-v2 payload in one pass
+    over the timeline instructions. Falls back to the globalObjects shape when the
+    timeline holds no tweet entries. Never raises on unexpected structure.
+    """
+    if not isinstance(response_json, dict):
+        return [], None
+
+    tweets: List[Dict[str, Any]] = []
+    cursor: Optional[str] = None
+    saw_entries = False
+
+    top_level_cursor = response_json.get('cursor')
+    if isinstance(top_level_cursor, dict) and top_level_cursor.get('bottom'):
+        cursor = top_level_cursor['bottom']
+
+    for instruction in _dig(response_json, 'result', 'timeline', 'instructions') or ():
+        instruction_type = instruction.get('type')
+        if instruction_type == 'TimelineAddEntries':
+            entries = instruction.get('entries') or ()
+        elif instruction_type == 'TimelineModule':
+            entries = [
+                container['item'] for container in instruction.get('items') or ()
+                if (container.get('item') or _EMPTY).get('itemContent')
+            ]
+        elif instruction_type == 'TimelineReplaceEntry':
+            entry = instruction.get('entry') or _EMPTY
+            if cursor is None and _is_bottom_cursor(entry):
+                cursor = (entry.get('content') or _EMPTY).get('value')
+            continue
+        else:
+            continue
+
+        for entry in entries:
+            saw_entries = True
+            if instruction_type == 'TimelineAddEntries' and cursor is None and _is_bottom_cursor(entry):
+                cursor = (entry.get('content') or _EMPTY).get('value')
+                continue
+            tweet_result = _tweet_result(entry)
+            if tweet_result:
+                tweet = _tweet_item(tweet_result)
+                if tweet:
+                    tweets.append(tweet)
+
+    if not saw_entries:
+        tweets = _global_object_tweets(response_json)
+    return tweets, cursor
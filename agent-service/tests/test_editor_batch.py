@@ -0,0 +1,48 @@
+"""Parsing of batch-mode editor responses (EditorAgent._parse_batch_posts)."""
+import json
+
+import pytest
+
+from x_agent_os.agents.editor_agent import MAX_POST_CHARS, EditorAgent
+
+parse = EditorAgent._parse_batch_posts
+
+
+def _response(items):
+    return json.dumps(items)
+
+
+def test_well_formed_batch():
+    text = _response([{"topic_index": 1, "linkedin_post": "first"}, {"topic_index": 2, "linkedin_post": "second"}])
+    assert parse(text, 2) == {0: "first", 1: "second"}
+
+
+@pytest.mark.parametrize("fence", ["```json\n{}\n```", "```\n{}\n```", "Here are your posts:\n{}\nEnjoy!"])
+def test_fences_and_surrounding_text_are_ignored(fence):
+    text = fence.format(_response([{"topic_index": 1, "linkedin_post": "post"}]))
+    assert parse(text, 1) == {0: "post"}
+
+
+def test_position_is_used_when_topic_index_is_missing():
+    text = _response([{"linkedin_post": "first"}, {"linkedin_post": "second"}])
+    assert parse(text, 2) == {0: "first", 1: "second"}
+
+
+def test_invalid_entries_are_left_out():
+    text = _response(
+        [
+            {"topic_index": 1, "linkedin_post": "  kept  "},
+            {"topic_index": 1, "linkedin_post": "duplicate index"},
+            {"topic_index": 3, "linkedin_post": "out of range"},
+            {"topic_index": "2", "linkedin_post": "index is not an int"},
+            {"topic_index": 2, "linkedin_post": "   "},
+            {"topic_index": 2, "linkedin_post": "x" * (MAX_POST_CHARS + 1)},
+            "not an object",
+        ]
+    )
+    assert parse(text, 2) == {0: "kept"}
+
+
+@pytest.mark.parametrize("text", ["", "no json here", "[not json]", '{"topic_index": 1}', "] reversed ["])
+def test_unparseable_responses_yield_nothing(text):
+    assert parse(text, 2) == {}
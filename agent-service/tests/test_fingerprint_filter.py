@@ -0,0 +1,100 @@
+"""Bloom filter persistence and catch-up in front of content_fingerprints."""
+import sqlite3
+
+import pytest
+
+from x_agent_os import database
+from x_agent_os.database import DatabaseHandler
+from x_agent_os.fingerprint_filter import FingerprintBloomFilter
+
+
+@pytest.fixture
+def db(tmp_path):
+    yield DatabaseHandler(str(tmp_path / "x_agent_os.db"))
+    database._fingerprint_filters.clear()
+
+
+def _fingerprint(identifier):
+    return {"content_type": "tweet", "primary_identifier": str(identifier), "content_hash": "h", "platform": "twitter"}
+
+
+def _insert_behind_the_filter(db, identifier):
+    """Write a row the way another process would, without touching this process's filter."""
+    conn = sqlite3.connect(db.db_path)
+    conn.execute(
+        "INSERT INTO content_fingerprints (content_type, primary_identifier, content_hash, platform) "
+        "VALUES ('tweet', ?, 'h', 'twitter')",
+        (str(identifier),),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _reload(db):
+    database._fingerprint_filters.clear()
+    return DatabaseHandler(db.db_path).enable_fingerprint_filter(capacity=1000)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    bloom = FingerprintBloomFilter(capacity=100, error_rate=0.01)
+    bloom.sync([("tweet", "1", 1), ("tweet", "2", 2)])
+    path = str(tmp_path / "filter.bloom")
+    bloom.save(path)
+    loaded = FingerprintBloomFilter.load(path)
+    assert loaded.bits == bloom.bits
+    assert (loaded.max_id, loaded.rows, loaded.count) == (2, 2, 2)
+    assert loaded.might_contain("tweet", "1") and loaded.might_contain("tweet", "2")
+
+
+def test_unreadable_file_loads_as_none(tmp_path):
+    path = tmp_path / "filter.bloom"
+    assert FingerprintBloomFilter.load(str(path)) is None
+    path.write_bytes(b"not a filter")
+    assert FingerprintBloomFilter.load(str(path)) is None
+
+
+def test_enable_builds_from_existing_rows(db):
+    db.save_content_fingerprints([_fingerprint(i) for i in range(5)])
+    bloom = db.enable_fingerprint_filter(capacity=1000)
+    assert (bloom.max_id, bloom.rows) == (5, 5)
+    assert all(bloom.might_contain("tweet", str(i)) for i in range(5))
+
+
+def test_warm_start_catches_up_past_max_id(db):
+    db.save_content_fingerprints([_fingerprint(i) for i in range(3)])
+    db.enable_fingerprint_filter(capacity=1000)
+    db.save_fingerprint_filter()
+    _insert_behind_the_filter(db, "late")
+    bloom = _reload(db)
+    assert (bloom.max_id, bloom.rows) == (4, 4)
+    assert bloom.might_contain("tweet", "late")
+
+
+def test_save_syncs_rows_written_by_other_processes(db):
+    db.enable_fingerprint_filter(capacity=1000)
+    _insert_behind_the_filter(db, "other")
+    db.save_content_fingerprints([_fingerprint("mine")])
+    db.save_fingerprint_filter()
+    bloom = _reload(db)
+    assert (bloom.max_id, bloom.rows) == (2, 2)
+    assert bloom.might_contain("tweet", "other")
+
+
+def test_mismatched_file_is_rebuilt(db):
+    db.save_content_fingerprints([_fingerprint(i) for i in range(3)])
+    db.enable_fingerprint_filter(capacity=1000)
+    db.save_fingerprint_filter()
+    with db.get_connection() as conn:
+        conn.execute("DELETE FROM content_fingerprints WHERE primary_identifier = '1'")
+        conn.commit()
+    bloom = _reload(db)
+    assert (bloom.max_id, bloom.rows) == (3, 2)
+    assert not bloom.might_contain("tweet", "1")
+
+
+def test_filter_miss_does_not_break_the_insert(db):
+    db.enable_fingerprint_filter(capacity=1000)
+    _insert_behind_the_filter(db, "raced")
+    assert db.check_content_fingerprint("tweet", "raced") is None
+    assert db.save_content_fingerprint("tweet", "raced", None, "h", "twitter") == 1
+    assert db.save_content_fingerprints([_fingerprint("raced")]) == {}
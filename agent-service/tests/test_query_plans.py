@@ -0,0 +1,56 @@
+"""EXPLAIN QUERY PLAN regression checks: every HOT_QUERIES entry must be served by an index."""
+import sqlite3
+
+import pytest
+
+from x_agent_os.database import HOT_QUERIES, MIGRATIONS, SCHEMA_VERSION, DatabaseHandler
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseHandler(str(tmp_path / "x_agent_os.db"))
+
+
+@pytest.fixture
+def upgraded_db(tmp_path):
+    """A database created by the first two migrations (before the hot path indexes), then upgraded."""
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    for version, _, migration in MIGRATIONS:
+        if version > 2:
+            break
+        migration(cursor)
+    conn.commit()
+    conn.close()
+    return DatabaseHandler(path)
+
+
+def _full_scans(db, sql, params):
+    with db.get_connection() as conn:
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    return [detail for detail in plan if detail.startswith("SCAN ") and " INDEX " not in detail]
+
+
+def test_schema_is_fully_migrated(db):
+    assert db.get_schema_version() == SCHEMA_VERSION
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_an_index(db, name):
+    sql, params = HOT_QUERIES[name]
+    assert _full_scans(db, sql, params) == [], f"{name} falls back to a full table scan"
+
+
+def test_find_full_table_scans_is_clean(db):
+    assert db.find_full_table_scans() == {}
+
+
+def test_upgraded_database_gets_the_indexes(upgraded_db):
+    assert upgraded_db.get_schema_version() == SCHEMA_VERSION
+    assert upgraded_db.find_full_table_scans() == {}
+
+
+def test_full_table_scan_is_reported(db):
+    # The check itself must catch a scan: content_hash has no index.
+    assert _full_scans(db, "SELECT id FROM content_fingerprints WHERE content_hash = ?", ("x",))
@@ -0,0 +1,87 @@
+"""SimHash signatures, LSH banding and near-duplicate filtering in IncrementalProcessingManager."""
+import itertools
+
+import pytest
+
+from x_agent_os.content_fingerprinting import (
+    SIMHASH_BANDS,
+    SIMHASH_BITS,
+    IncrementalProcessingManager,
+    hamming_distance,
+    simhash,
+    simhash_bands,
+)
+from x_agent_os.database import DatabaseHandler
+
+ARTICLE = "OpenAI ships a new reasoning model that beats the previous release on coding benchmarks by a wide margin"
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseHandler(str(tmp_path / "x_agent_os.db"))
+
+
+def _result(url, snippet):
+    return {"url": url, "title": url, "snippet": snippet}
+
+
+def test_hamming_distance():
+    assert hamming_distance(0b1011, 0b1011) == 0
+    assert hamming_distance(0b1011, 0b0010) == 2
+    assert hamming_distance(0, (1 << SIMHASH_BITS) - 1) == SIMHASH_BITS
+
+
+def test_short_texts_have_no_signature():
+    assert simhash("too short to sign") is None
+    assert simhash("") is None
+
+
+def test_signature_ignores_case_urls_and_retweet_prefix():
+    assert simhash(f"RT @someone: {ARTICLE.upper()} https://t.co/abc") == simhash(ARTICLE)
+
+
+def test_near_duplicates_are_closer_than_unrelated_texts():
+    edited = ARTICLE.replace("wide", "huge")
+    unrelated = "The city council approved a new budget for road repairs and public parks next spring"
+    assert hamming_distance(simhash(ARTICLE), simhash(edited)) < hamming_distance(simhash(ARTICLE), simhash(unrelated))
+
+
+def test_bands_split_the_signature():
+    value = simhash(ARTICLE)
+    bands = simhash_bands(value)
+    width = SIMHASH_BITS // SIMHASH_BANDS
+    assert [band for band, _ in bands] == list(range(SIMHASH_BANDS))
+    assert sum(band_value << (band * width) for band, band_value in bands) == value
+
+
+@pytest.mark.parametrize("flips", list(itertools.combinations(range(0, SIMHASH_BITS, 13), SIMHASH_BANDS - 1)))
+def test_signatures_within_bands_minus_one_share_a_band(flips):
+    value = simhash(ARTICLE)
+    other = value
+    for bit in flips:
+        other ^= 1 << bit
+    assert hamming_distance(value, other) == SIMHASH_BANDS - 1
+    assert set(simhash_bands(value)) & set(simhash_bands(other))
+
+
+def test_near_duplicate_in_the_same_batch_is_dropped(db):
+    manager = IncrementalProcessingManager(db, near_duplicate_thresholds={"search_result": SIMHASH_BITS})
+    results = [_result("https://a.example/1", ARTICLE), _result("https://b.example/2", ARTICLE + " today")]
+    outcome = manager.process_search_results_incrementally(results)
+    assert [r["url"] for r in outcome["new_results"]] == ["https://a.example/1"]
+    assert outcome["duplicate_count"] == 1
+
+
+def test_near_duplicate_of_a_stored_item_is_dropped(db):
+    manager = IncrementalProcessingManager(db)
+    manager.process_search_results_incrementally([_result("https://a.example/1", ARTICLE)])
+    outcome = manager.process_search_results_incrementally([_result("https://b.example/2", ARTICLE)])
+    assert outcome["new_results"] == []
+    assert outcome["duplicate_count"] == 1
+
+
+def test_disabled_threshold_keeps_near_duplicates(db):
+    manager = IncrementalProcessingManager(db, near_duplicate_thresholds={"search_result": None})
+    results = [_result("https://a.example/1", ARTICLE), _result("https://b.example/2", ARTICLE)]
+    outcome = manager.process_search_results_incrementally(results)
+    assert len(outcome["new_results"]) == 2
@@ -0,0 +1,89 @@
+"""SingleFlight coalescing, remembering and error propagation."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from x_agent_os.single_flight import SingleFlight
+
+
+def _wait_for_followers(flight, count):
+    for _ in range(500):
+        if flight.stats["coalesced"] >= count:
+            return
+        time.sleep(0.01)
+    raise AssertionError("followers never joined the call")
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(flight.do, "q", slow)
+        assert started.wait(5)
+        followers = [pool.submit(flight.do, "q", slow) for _ in range(3)]
+        _wait_for_followers(flight, 3)
+        release.set()
+        assert leader.result() == ("value", False)
+        assert [f.result() for f in followers] == [("value", True)] * 3
+    assert calls == [1]
+    assert flight.stats == {"calls": 1, "coalesced": 3}
+
+
+def test_result_is_remembered_until_forgotten():
+    flight = SingleFlight()
+    assert flight.do("q", lambda: 1) == (1, False)
+    assert flight.do("q", lambda: 2) == (1, True)
+    flight.forget("q")
+    assert flight.do("q", lambda: 3) == (3, False)
+
+
+def test_remember_if_can_veto():
+    flight = SingleFlight()
+    assert flight.do("q", lambda: [], remember_if=bool) == ([], False)
+    assert flight.do("q", lambda: ["row"], remember_if=bool) == (["row"], False)
+    assert flight.do("q", lambda: [], remember_if=bool) == (["row"], True)
+
+
+def test_remember_false_only_coalesces_in_flight_calls():
+    flight = SingleFlight(remember=False)
+    assert flight.do("q", lambda: 1) == (1, False)
+    assert flight.do("q", lambda: 2) == (2, False)
+
+
+def test_error_reaches_every_waiter_and_is_not_remembered():
+    flight = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("provider down")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(flight.do, "q", failing)
+        assert started.wait(5)
+        followers = [pool.submit(flight.do, "q", lambda: "unused") for _ in range(2)]
+        _wait_for_followers(flight, 2)
+        release.set()
+        for future in [leader] + followers:
+            with pytest.raises(ValueError, match="provider down"):
+                future.result()
+    assert flight.do("q", lambda: "recovered") == ("recovered", False)
+
+
+def test_keys_are_independent():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("b", lambda: 2) == (2, False)
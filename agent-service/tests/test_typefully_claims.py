@@ -0,0 +1,144 @@
+"""posts.typefully_claim compare-and-swap and how batch publishing uses it."""
+import asyncio
+
+import pytest
+
+from x_agent_os.agents.typefully_client import TypefullyAPIError, ValidationError
+from x_agent_os.agents.typefully_drafts import TypefullyDraftManager
+from x_agent_os.database import DatabaseHandler
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseHandler(str(tmp_path / "x_agent_os.db"))
+
+
+@pytest.fixture
+def post_id(db):
+    return db.create_post(None, None, "x", "short_post", "agent", "hello world")
+
+
+def _state(db, post_id):
+    with db.get_connection() as conn:
+        row = conn.execute("SELECT typefully_draft_id, typefully_claim FROM posts WHERE id = ?", (post_id,)).fetchone()
+    return row["typefully_draft_id"], row["typefully_claim"]
+
+
+class _Pool:
+    maxsize = 2
+
+
+class _FakeAsyncClient:
+    """Stands in for AsyncTypefullyClient: create_draft returns (or raises) the queued outcomes in order."""
+
+    def __init__(self, *outcomes, scheduled=()):
+        self.pool = _Pool()
+        self.outcomes = list(outcomes)
+        self.scheduled = list(scheduled)
+        self.creates = []
+
+    async def create_draft(self, **request):
+        self.creates.append(request)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def get_recently_scheduled_drafts(self):
+        return self.scheduled
+
+
+class _FakeClient:
+    def __init__(self, async_client):
+        self.async_client = async_client
+
+
+def _publish(db, client, post_id, **kwargs):
+    manager = TypefullyDraftManager(_FakeClient(client), db)
+    items = asyncio.run(manager.acreate_from_generated_content(["hello world"], post_ids=[post_id], **kwargs))
+    return items[0]
+
+
+def test_claim_is_taken_once(db, post_id):
+    assert db.claim_post_typefully_draft(post_id, "first") is None
+    assert db.claim_post_typefully_draft(post_id, "second") == {"typefully_draft_id": None, "typefully_claim": "first"}
+    assert _state(db, post_id) == (None, "first")
+
+
+def test_claim_swaps_only_from_the_expected_marker(db, post_id):
+    db.claim_post_typefully_draft(post_id, "first")
+    assert db.claim_post_typefully_draft(post_id, "second", expected="stale") is not None
+    assert db.claim_post_typefully_draft(post_id, "second", expected="first") is None
+    assert _state(db, post_id) == (None, "second")
+
+
+def test_post_with_a_draft_cannot_be_claimed(db, post_id):
+    db.update_post_typefully_id(post_id, "42")
+    assert db.claim_post_typefully_draft(post_id, "marker") == {"typefully_draft_id": "42", "typefully_claim": None}
+
+
+def test_release_needs_the_current_marker(db, post_id):
+    db.claim_post_typefully_draft(post_id, "mine")
+    db.release_post_typefully_claim(post_id, "someone else's")
+    assert _state(db, post_id) == (None, "mine")
+    db.release_post_typefully_claim(post_id, "mine")
+    assert _state(db, post_id) == (None, None)
+
+
+def test_missing_post_raises(db):
+    with pytest.raises(ValueError):
+        db.claim_post_typefully_draft(999, "marker")
+
+
+def test_created_draft_clears_the_claim(db, post_id):
+    item = _publish(db, _FakeAsyncClient({"id": 7}), post_id)
+    assert (item.status, item.draft_id) == ("created", "7")
+    assert _state(db, post_id) == ("7", None)
+
+
+def test_post_with_a_draft_is_skipped(db, post_id):
+    db.update_post_typefully_id(post_id, "7")
+    client = _FakeAsyncClient()
+    item = _publish(db, client, post_id)
+    assert (item.status, item.draft_id) == ("skipped", "7")
+    assert client.creates == []
+
+
+def test_rejected_create_releases_the_claim(db, post_id):
+    item = _publish(db, _FakeAsyncClient(ValidationError("too long")), post_id)
+    assert item.status == "failed"
+    assert _state(db, post_id) == (None, None)
+
+
+@pytest.mark.parametrize("outcome", [TypefullyAPIError("bad gateway", status_code=502), {"share_url": "no id"}])
+def test_unknown_outcome_keeps_the_claim(db, post_id, outcome):
+    item = _publish(db, _FakeAsyncClient(outcome), post_id)
+    assert item.status == "pending"
+    draft_id, claim = _state(db, post_id)
+    assert draft_id is None and claim is not None
+
+
+def test_pending_post_is_not_resubmitted_by_default(db, post_id):
+    db.claim_post_typefully_draft(post_id, "earlier run")
+    client = _FakeAsyncClient()
+    item = _publish(db, client, post_id)
+    assert item.status == "pending"
+    assert client.creates == []
+    assert _state(db, post_id) == (None, "earlier run")
+
+
+def test_pending_post_adopts_a_matching_scheduled_draft(db, post_id):
+    db.claim_post_typefully_draft(post_id, "earlier run")
+    sent = TypefullyDraftManager(_FakeClient(None), db)._single_draft_request("hello world")["content"]
+    client = _FakeAsyncClient(scheduled=[{"id": 8, "text": "something else"}, {"id": 9, "text": sent}])
+    item = _publish(db, client, post_id)
+    assert (item.status, item.draft_id) == ("skipped", "9")
+    assert client.creates == []
+    assert _state(db, post_id) == ("9", None)
+
+
+def test_pending_post_is_resubmitted_on_request(db, post_id):
+    db.claim_post_typefully_draft(post_id, "earlier run")
+    item = _publish(db, _FakeAsyncClient({"id": 11}), post_id, resubmit_pending=True)
+    assert (item.status, item.draft_id) == ("created", "11")
+    assert _state(db, post_id) == ("11", None)
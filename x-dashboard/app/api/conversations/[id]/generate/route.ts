@@ -6,10 +6,57 @@ import { NextResponse } from "next/server";
 
 const execFileAsync = promisify(execFile);
 
+// Long-lived agent-service worker (python run_reply_worker.py). When it is not
+// running we fall back to spawning run_generate_reply.py for this request.
+const REPLY_WORKER_URL = process.env.REPLY_WORKER_URL ?? "http://127.0.0.1:8765";
+const REPLY_WORKER_TIMEOUT_MS = Number(process.env.REPLY_WORKER_TIMEOUT_MS ?? 120000);
+
 type Params = {
   params: { id: string };
 };
 
+async function generateViaWorker(conversationId: number): Promise<Response | null> {
+  if (!REPLY_WORKER_URL) return null;
+  try {
+    return await fetch(`${REPLY_WORKER_URL}/conversations/${conversationId}/generate`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      // A click on "Generate reply" always asks for a fresh reply rather than the cached one.
+      body: JSON.stringify({ refresh: true }),
+      cache: "no-store",
+      signal: AbortSignal.timeout(REPLY_WORKER_TIMEOUT_MS)
+    });
+  } catch (error) {
+    // A worker that accepted the request but timed out may still be generating; don't start a second run.
+    if (error instanceof Error && error.name === "TimeoutError") throw error;
+    // Worker not running (connection refused) or unreachable: use the CLI instead.
+    return null;
+  }
+}
+
+async function generateViaCli(conversationId: number): Promise<string> {
+  const repoRoot = path.resolve(process.cwd(), "..");
+  const scriptPath = path.join(repoRoot, "agent-service", "run_generate_reply.py");
+  const pythonPath = process.env.PYTHON || "python";
+  const dbPath =
+    process.env.X_AGENT_OS_DB_PATH ?? path.join(repoRoot, "data", "x_agent_os.db");
+
+  const { stdout } = await execFileAsync(
+    pythonPath,
+    [scriptPath, "--conversation-id", String(conversationId), "--refresh"],
+    {
+      cwd: path.join(repoRoot, "agent-service"),
+      env: {
+        ...process.env,
+        X_AGENT_OS_DB_PATH: dbPath
+      }
+    }
+  );
+
+  const payload = JSON.parse(stdout.trim());
+  return payload.reply;
+}
+
 export async function POST(request: Request, { params }: Params) {
   try {
     const conversationId = Number(params.id);
@@ -17,26 +64,23 @@ export async function POST(request: Request, { params }: Params) {
       return NextResponse.json({ error: "Invalid conversation id" }, { status: 400 });
     }
 
-    const repoRoot = path.resolve(process.cwd(), "..");
-    const scriptPath = path.join(repoRoot, "agent-service", "run_generate_reply.py");
-    const pythonPath = process.env.PYTHON || "python";
-    const dbPath =
-      process.env.X_AGENT_OS_DB_PATH ?? path.join(repoRoot, "data", "x_agent_os.db");
-
-    const { stdout } = await execFileAsync(
-      pythonPath,
-      [scriptPath, "--conversation-id", String(conversationId)],
-      {
-        cwd: path.join(repoRoot, "agent-service"),
-        env: {
-          ...process.env,
-          X_AGENT_OS_DB_PATH: dbPath
-        }
+    const workerResponse = await generateViaWorker(conversationId);
+    if (workerResponse) {
+      const payload = await workerResponse.json();
+      if (workerResponse.ok) {
+        return NextResponse.json({ reply: payload.reply });
       }
-    );
+      return NextResponse.json(
+        {
+          error: payload.error ?? "Failed to generate reply.",
+          detail: payload.detail
+        },
+        { status: workerResponse.status }
+      );
+    }
 
-    const payload = JSON.parse(stdout.trim());
-    return NextResponse.json({ reply: payload.reply });
+    const reply = await generateViaCli(conversationId);
+    return NextResponse.json({ reply });
   } catch (error) {
     const message = error instanceof Error ? error.message : String(error);
     return NextResponse.json(
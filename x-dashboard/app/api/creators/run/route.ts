@@ -18,6 +18,7 @@ export async function POST(request: Request) {
     const limit = typeof body.limit === "number" ? body.limit : 50;
     const topN = typeof body.topN === "number" ? body.topN : 7;
     const force = body.force === true;
+    const incremental = body.incremental === true;
 
     const repoRoot = path.resolve(process.cwd(), "..");
     const scriptPath = path.join(repoRoot, "agent-service", "run_creator_persona.py");
@@ -37,7 +38,8 @@ export async function POST(request: Request) {
         String(limit),
         "--top-n",
         String(topN),
-        ...(force ? ["--force"] : [])
+        ...(force ? ["--force"] : []),
+        ...(incremental ? ["--incremental"] : [])
       ],
       {
         cwd: path.join(repoRoot, "agent-service"),
@@ -61,6 +61,7 @@ export type Conversation = {
   snippet: string | null;
   reason: string | null;
   suggested_reply: string | null;
+  reply_latency_ms?: number | null;
   status: string;
   created_at: string;
   updated_at: string;